@@ -0,0 +1,356 @@
+#!/usr/bin/python3
+"""JSON API over the models, as an asyncio (ASGI) application
+
+Serve it with any ASGI server, e.g.:
+    uvicorn --workers 4 api.v1.app:app
+
+Routes:
+    GET  /api/v1/status
+    GET  /api/v1/stats
+    GET  /api/v1/<states|cities|places|amenities>
+    GET  /api/v1/<states|cities|places|amenities>/<id>
+    GET  /api/v1/states/<id>/cities
+    GET  /api/v1/cities/<id>/places
+    POST /api/v1/places_search
+        {"states": [ids], "cities": [ids], "amenities": [ids]}
+
+Lists are sorted by id and take two query parameters: limit, the
+maximum number of objects, and after, the id of the last object of
+the previous page.
+"""
+import asyncio
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from os import getenv
+from urllib.parse import parse_qs
+
+RESOURCES = {"states": "State", "cities": "City", "places": "Place",
+             "amenities": "Amenity"}
+STATS = {"amenities": "Amenity", "cities": "City", "places": "Place",
+         "reviews": "Review", "states": "State", "users": "User"}
+
+
+def to_json(obj):
+    """returns the JSON text of an object
+    Related objects DBStorage may have loaded into it are left out.
+    Args:
+        obj: a BaseModel
+    Return:
+        returns a string
+    """
+    return json.dumps({key: value for key, value in obj.to_dict().items()
+                       if not _related(value)})
+
+
+def _related(value):
+    """tells whether a value is a related object or a list of them"""
+    if isinstance(value, list):
+        return any(hasattr(item, "to_dict") for item in value[:1])
+    return hasattr(value, "to_dict")
+
+
+# FileStorage.close() of the jobs, one at a time
+_closing = threading.Lock()
+
+
+def _job(fn, *args):
+    """runs fn(storage, *args) in a worker thread
+    In file mode the storage is closed first, which reads the file again
+    if another process saved it (one thread at a time), so the job sees
+    what the console or the other workers saved. In DB mode the Session
+    of the thread is removed afterwards, so the next job of the thread
+    does not read rows cached by this one.
+    Args:
+        fn: function taking the storage then args
+    Return:
+        returns what fn returns
+    """
+    import models
+    db = getenv("HBNB_TYPE_STORAGE") == "db"
+    if not db:
+        with _closing:
+            models.storage.close()
+    try:
+        return fn(models.storage, *args)
+    finally:
+        if db:
+            models.storage.close()
+
+
+def _warm(storage):
+    """loads the storage at startup rather than on the first request:
+    models.storage is built, and its file or database loaded, on first
+    access"""
+    import models
+    models.storage
+
+
+def _stats(storage):
+    """returns the number of objects of each class"""
+    return {name: storage.count(cls) for name, cls in STATS.items()}
+
+
+def _get(storage, cls, id):
+    """returns the JSON text of an object, None if it does not exist"""
+    obj = storage.get(cls, id)
+    return None if obj is None else to_json(obj)
+
+
+def _page(storage, cls, after, limit):
+    """returns the JSON texts of a page of a class, with the id of its
+    last object"""
+    objs = list(storage.iter_all(cls, after=after, limit=limit))
+    return [to_json(obj) for obj in objs], objs[-1].id if objs else None
+
+
+def _state_cities(storage, id, after, limit):
+    """returns the JSON texts of the cities of a state, None if it does
+    not exist"""
+    state = storage.get("State", id)
+    if state is None:
+        return None
+    cities = sorted(state.cities, key=lambda city: city.id)
+    return [to_json(city) for city in _slice(cities, after, limit)]
+
+
+def _city_places(storage, id, after, limit):
+    """returns the JSON texts of the places of a city, None if it does
+    not exist"""
+    if storage.get("City", id) is None:
+        return None
+    return _search(storage, [], [id], [], after, limit)
+
+
+def _search(storage, states, cities, amenities, after, limit):
+    """returns the JSON texts of the places in the given cities or in
+    the cities of the given states (anywhere if there are none) having
+    every given amenity. Unknown ids are ignored.
+    """
+    city_ids = set(cities)
+    for state_id in states:
+        state = storage.get("State", state_id)
+        if state is not None:
+            city_ids.update(city.id for city in state.cities)
+    places = storage.filter_places(
+        city_ids=city_ids if states or cities else None,
+        amenity_ids=amenities)
+    places.sort(key=lambda place: place.id)
+    return [to_json(place) for place in _slice(places, after, limit)]
+
+
+def _slice(objs, after, limit):
+    """returns a page of a list sorted by id"""
+    if after is not None:
+        objs = [obj for obj in objs if obj.id > after]
+    return objs if limit is None else objs[:limit]
+
+
+def _paging(scope):
+    """returns the limit and after parameters of a request
+    Raises:
+        ValueError: if limit is not a non-negative integer
+    """
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    limit = query.get("limit", [None])[-1]
+    if limit is not None:
+        limit = int(limit)
+        if limit < 0:
+            raise ValueError(limit)
+    return limit, query.get("after", [None])[-1]
+
+
+class API:
+    """ASGI application of the API
+    Storage calls block, so they run in a thread pool and the event loop
+    only parses requests and sends bytes. Lists are streamed: objects
+    are fetched batch at a time with storage.iter_all(), each batch a
+    keyset page and a job of its own, and sent once serialized, so a
+    large list neither sits in memory nor holds a thread for long.
+    Attributes:
+        executor: thread pool running the storage calls
+        batch: objects per chunk of a streamed list
+        routes: (method, path pattern, handler) of each route
+    """
+
+    def __init__(self, threads=None, batch=500):
+        """builds the application
+        Args:
+            threads: size of the thread pool, HBNB_API_THREADS or 8 if
+                not given
+            batch: objects per chunk of a streamed list
+        """
+        if threads is None:
+            threads = int(getenv("HBNB_API_THREADS", 8))
+        self.executor = ThreadPoolExecutor(threads, "hbnb-api")
+        self.batch = batch
+        kinds = "|".join(RESOURCES)
+        self.routes = [
+            ("GET", r"/api/v1/status", self.status),
+            ("GET", r"/api/v1/stats", self.stats),
+            ("GET", r"/api/v1/({})".format(kinds), self.list),
+            ("GET", r"/api/v1/({})/([^/]+)".format(kinds), self.get),
+            ("GET", r"/api/v1/states/([^/]+)/cities", self.state_cities),
+            ("GET", r"/api/v1/cities/([^/]+)/places", self.city_places),
+            ("POST", r"/api/v1/places_search", self.places_search),
+        ]
+        self.routes = [(method, re.compile(pattern + "/?"), handler)
+                       for method, pattern, handler in self.routes]
+
+    async def __call__(self, scope, receive, send):
+        """entry point of the ASGI server"""
+        if scope["type"] == "lifespan":
+            return await self.lifespan(receive, send)
+        if scope["type"] != "http":
+            return
+        try:
+            _paging(scope)
+        except ValueError:
+            return await self.respond(send, 400, {"error": "Bad limit"})
+        status, error = 404, "Not found"
+        for method, pattern, handler in self.routes:
+            match = pattern.fullmatch(scope["path"])
+            if match is None:
+                continue
+            if scope["method"] == method:
+                return await handler(scope, receive, send, *match.groups())
+            status, error = 405, "Method not allowed"
+        await self.respond(send, status, {"error": error})
+
+    async def lifespan(self, receive, send):
+        """loads the storage on startup, stops the thread pool on
+        shutdown"""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self.run(_warm)
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.executor.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def run(self, fn, *args):
+        """runs fn(storage, *args) in the thread pool
+        Return:
+            returns an awaitable of what fn returns
+        """
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self.executor, _job, fn, *args)
+
+    @staticmethod
+    async def respond(send, status, body):
+        """sends a whole JSON response
+        Args:
+            send: ASGI send
+            status: HTTP status
+            body: JSON text, or an object to dump
+        """
+        if type(body) is not str:
+            body = json.dumps(body)
+        body = body.encode("UTF-8")
+        await send({"type": "http.response.start", "status": status,
+                    "headers": [(b"content-type", b"application/json"),
+                                (b"content-length", str(len(body)).encode())]})
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    async def stream(send, chunks):
+        """sends a JSON array, one chunk of objects at a time
+        Args:
+            send: ASGI send
+            chunks: async iterator of lists of JSON texts
+        """
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/json")]})
+        separator = b"["
+        async for texts in chunks:
+            if texts:
+                await send({"type": "http.response.body", "more_body": True,
+                            "body": separator + ",".join(texts).encode()})
+                separator = b","
+        await send({"type": "http.response.body",
+                    "body": b"[]" if separator == b"[" else b"]"})
+
+    async def status(self, scope, receive, send):
+        """GET /api/v1/status"""
+        await self.respond(send, 200, {"status": "OK"})
+
+    async def stats(self, scope, receive, send):
+        """GET /api/v1/stats: number of objects of each class"""
+        await self.respond(send, 200, await self.run(_stats))
+
+    async def list(self, scope, receive, send, kind):
+        """GET /api/v1/<kind>: the objects of a class, streamed"""
+        limit, after = _paging(scope)
+
+        async def pages(after, limit):
+            """yields the JSON texts of the pages"""
+            while limit is None or limit > 0:
+                size = self.batch if limit is None else min(self.batch,
+                                                            limit)
+                texts, after = await self.run(_page, RESOURCES[kind],
+                                              after, size)
+                yield texts
+                if len(texts) < size:
+                    return
+                if limit is not None:
+                    limit -= size
+
+        await self.stream(send, pages(after, limit))
+
+    async def get(self, scope, receive, send, kind, id):
+        """GET /api/v1/<kind>/<id>"""
+        text = await self.run(_get, RESOURCES[kind], id)
+        if text is None:
+            return await self.respond(send, 404, {"error": "Not found"})
+        await self.respond(send, 200, text)
+
+    async def state_cities(self, scope, receive, send, id):
+        """GET /api/v1/states/<id>/cities"""
+        limit, after = _paging(scope)
+        texts = await self.run(_state_cities, id, after, limit)
+        await self.send_list(send, texts)
+
+    async def city_places(self, scope, receive, send, id):
+        """GET /api/v1/cities/<id>/places"""
+        limit, after = _paging(scope)
+        texts = await self.run(_city_places, id, after, limit)
+        await self.send_list(send, texts)
+
+    async def places_search(self, scope, receive, send):
+        """POST /api/v1/places_search: the places of some states or
+        cities having some amenities"""
+        limit, after = _paging(scope)
+        body = b""
+        more = True
+        while more:
+            message = await receive()
+            body += message.get("body", b"")
+            more = message.get("more_body", False)
+        try:
+            search = json.loads(body) if body.strip() else {}
+            if type(search) is not dict:
+                raise ValueError(search)
+            criteria = [list(search.get(name) or [])
+                        for name in ("states", "cities", "amenities")]
+        except (ValueError, TypeError):
+            return await self.respond(send, 400, {"error": "Not a JSON"})
+        texts = await self.run(_search, *criteria, after, limit)
+        await self.send_list(send, texts)
+
+    async def send_list(self, send, texts):
+        """streams a list of JSON texts, 404 if it is None"""
+        if texts is None:
+            return await self.respond(send, 404, {"error": "Not found"})
+
+        async def chunks():
+            """yields batch texts at a time"""
+            for i in range(0, len(texts), self.batch):
+                yield texts[i:i + self.batch]
+
+        await self.stream(send, chunks())
+
+
+app = API()
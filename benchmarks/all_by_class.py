@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+"""Benchmark of FileStorage.all(cls) against the store size
+
+Run from the repository root:
+    python3 -m benchmarks.all_by_class [size ...]
+
+The store holds a fixed number of States and is padded with Places, so
+a filter that scans every key grows with the store while the per-class
+index only grows with the number of States.
+"""
+import shlex
+import sys
+from timeit import timeit
+from models import storage
+from models.place import Place
+from models.state import State
+
+STATES = 50
+
+
+def scan_all(cls):
+    """the previous all(cls): split every key and compare class names"""
+    dic = {}
+    objects = storage.all()
+    for key in objects:
+        partition = shlex.split(key.replace('.', ' '))
+        if partition[0] == cls.__name__:
+            dic[key] = objects[key]
+    return dic
+
+
+def fill(size):
+    """resets the store to STATES States padded with Places"""
+    storage.all().clear()
+    storage._FileStorage__reindex()
+    for i in range(STATES):
+        storage.new(State(name="state_{}".format(i)))
+    for i in range(size - STATES):
+        storage.new(Place(name="place_{}".format(i)))
+
+
+def main(sizes):
+    """prints the time per all(State) call for each store size"""
+    print("{:>10} {:>14} {:>14}".format("objects", "scan (ms)", "index (ms)"))
+    for size in sizes:
+        fill(size)
+        assert scan_all(State) == storage.all(State)
+        runs = 3
+        scan = timeit(lambda: scan_all(State), number=runs) / runs
+        runs = 1000
+        index = timeit(lambda: storage.all(State), number=runs) / runs
+        print("{:>10} {:>14.3f} {:>14.4f}".format(
+            size, scan * 1000, index * 1000))
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000])
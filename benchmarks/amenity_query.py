@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+"""Benchmark of "places having all of these amenities" queries
+
+Run from the repository root:
+    python3 -m benchmarks.amenity_query [places]
+
+Each place gets a random subset of 20 amenities. The scan checks the
+amenity_ids of every Place, the index ANDs one bitmap per amenity.
+"""
+import random
+import sys
+from timeit import timeit
+from models.engine.amenity_index import AmenityIndex
+
+AMENITIES = ["amenity_{}".format(i) for i in range(20)]
+
+
+def main(size):
+    """prints the time of each query with both methods"""
+    rand = random.Random(0)
+    index = AmenityIndex()
+    places = {}
+    for i in range(size):
+        key = "Place.{:08d}".format(i)
+        places[key] = [a for a in AMENITIES if rand.random() < 0.3]
+        index.set(key, places[key])
+    index.flush()
+    print("{} places".format(size))
+    print("{:>12} {:>9} {:>11} {:>12} {:>12}".format(
+        "amenities", "matches", "scan (ms)", "AND (us)", "keys (ms)"))
+    for count in (1, 2, 3, 5):
+        wanted = AMENITIES[:count]
+        required = set(wanted)
+        scan = sorted(k for k, ids in places.items()
+                      if required.issubset(ids))
+        assert index.having_all(wanted) == scan
+        slow = timeit(lambda: [k for k, ids in places.items()
+                               if required.issubset(ids)], number=1)
+        runs = 1000
+        bitmaps = [index.bitmaps[a] for a in wanted]
+
+        def intersect():
+            bits = -1
+            for bitmap in bitmaps:
+                bits &= bitmap
+            return bits
+        fast = timeit(intersect, number=runs) / runs
+        runs = 5
+        keys = timeit(lambda: index.having_all(wanted), number=runs) / runs
+        print("{:>12} {:>9} {:>11.1f} {:>12.1f} {:>12.2f}".format(
+            count, len(scan), slow * 1000, fast * 1e6, keys * 1000))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
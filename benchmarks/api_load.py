@@ -0,0 +1,133 @@
+#!/usr/bin/python3
+"""Concurrent load on the API of api/v1/app.py: requests per second and
+latency percentiles by number of clients
+
+Run from the repository root:
+    python3 -m benchmarks.api_load [seconds]
+or against a database, e.g. a SQLite file:
+    HBNB_TYPE_STORAGE=db HBNB_DB_URL=sqlite:////tmp/bench.db \\
+        python3 -m benchmarks.api_load [seconds]
+
+The clients are coroutines calling the ASGI application directly, so
+the figures are those of the application (routing, thread pool,
+storage, JSON) without the HTTP server. The thread pool is sized by
+HBNB_API_THREADS.
+"""
+import asyncio
+import json
+import random
+import sys
+from time import perf_counter
+from models import storage
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.state import State
+from models.user import User
+from api.v1.app import API
+
+STATES = 100
+CITIES = 10
+PLACES = 2
+AMENITIES = 20
+CLIENTS = [1, 8, 32, 128]
+
+
+def fill():
+    """stores STATES States of CITIES Cities of PLACES Places each,
+    returns the ids of the States"""
+    user = User(email="load@hbnb.io", password="pwd")
+    storage.new(user)
+    amenities = [Amenity(name="amenity_{}".format(i))
+                 for i in range(AMENITIES)]
+    storage.bulk_new(amenities)
+    ids = []
+    for i in range(STATES):
+        state = State(name="state_{}".format(i))
+        storage.new(state)
+        ids.append(state.id)
+        for j in range(CITIES):
+            city = City(name="city_{}".format(j), state_id=state.id)
+            storage.new(city)
+            for k in range(PLACES):
+                storage.new(Place(name="place_{}".format(k), city_id=city.id,
+                                  user_id=user.id))
+    storage.save()
+    storage.close()
+    return ids
+
+
+def scenarios(ids):
+    """returns the requests of each scenario, as functions of a
+    random.Random returning (method, path, body)"""
+    return {
+        "get state": lambda rand: (
+            "GET", "/api/v1/states/" + rand.choice(ids), b""),
+        "page of 20": lambda rand: (
+            "GET", "/api/v1/states?limit=20&after=" + rand.choice(ids), b""),
+        "all cities": lambda rand: ("GET", "/api/v1/cities", b""),
+        "search": lambda rand: (
+            "POST", "/api/v1/places_search",
+            json.dumps({"states": [rand.choice(ids)]}).encode()),
+    }
+
+
+async def request(app, method, path, body):
+    """sends one request, returns its status"""
+    path, _, query = path.partition("?")
+    scope = {"type": "http", "method": method, "path": path,
+             "query_string": query.encode(), "headers": []}
+    status = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    await app(scope, receive, send)
+    return status[0]
+
+
+async def run(app, make, clients, seconds):
+    """returns the requests per second and the latencies of clients
+    clients sending requests for seconds"""
+    latencies = []
+    stop = perf_counter() + seconds
+
+    async def client(n):
+        rand = random.Random(n)
+        while perf_counter() < stop:
+            start = perf_counter()
+            assert await request(app, *make(rand)) == 200
+            latencies.append(perf_counter() - start)
+
+    start = perf_counter()
+    await asyncio.gather(*(client(n) for n in range(clients)))
+    return len(latencies) / (perf_counter() - start), sorted(latencies)
+
+
+def percentile(latencies, p):
+    """returns the p-th percentile of sorted latencies, in ms"""
+    return latencies[min(len(latencies) - 1,
+                         int(len(latencies) * p / 100))] * 1000
+
+
+def main(seconds):
+    """prints the throughput and latencies of each scenario"""
+    ids = fill()
+    app = API()
+    print("{:>12} {:>8} {:>10} {:>10} {:>10}".format(
+        "scenario", "clients", "req/s", "p50 ms", "p99 ms"))
+    for name, make in scenarios(ids).items():
+        for clients in CLIENTS:
+            rate, latencies = asyncio.run(run(app, make, clients, seconds))
+            print("{:>12} {:>8} {:>10.0f} {:>10.1f} {:>10.1f}".format(
+                name, clients, rate, percentile(latencies, 50),
+                percentile(latencies, 99)))
+    app.executor.shutdown()
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 2)
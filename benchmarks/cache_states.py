@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+"""Benchmark of the /states page of web_flask, with and
+without a CachedStorage in front of the storage
+
+Run from the repository root:
+    python3 -m benchmarks.cache_states [requests]
+or against a database, e.g. a SQLite file:
+    HBNB_TYPE_STORAGE=db HBNB_DB_URL=sqlite:////tmp/bench.db \\
+        python3 -m benchmarks.cache_states [requests]
+
+Requests go through the Flask test client, teardown (storage.close())
+included, and render the page every time (web_flask.page_cache is left
+out).
+"""
+import sys
+from time import perf_counter
+import models
+from models import storage
+from models.city import City
+from models.engine.cache import CachedStorage
+from models.state import State
+from web_flask import create_app
+
+STATES = 100
+CITIES = 20
+
+
+def fill():
+    """stores STATES States of CITIES Cities each"""
+    for i in range(STATES):
+        state = State(name="state_{}".format(i))
+        storage.new(state)
+        for j in range(CITIES):
+            storage.new(City(name="city_{}".format(j), state_id=state.id))
+    storage.save()
+    storage.close()
+
+
+def run(client, requests):
+    """returns the requests per second of GET /states"""
+    start = perf_counter()
+    for _ in range(requests):
+        assert client.get("/states").status_code == 200
+    return requests / (perf_counter() - start)
+
+
+def main(requests):
+    """prints the throughput without and with the cache"""
+    app = create_app()
+    view = app.view_functions["states.list_state"]
+    app.view_functions["states.list_state"] = view.__wrapped__
+    fill()
+    client = app.test_client()
+    print("{:>10} {:>10}".format("storage", "req/s"))
+    print("{:>10} {:>10.0f}".format("engine", run(client, requests)))
+    models.storage = cached = CachedStorage(storage)
+    print("{:>10} {:>10.0f}".format("cached", run(client, requests)))
+    print(cached.stats())
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""Report of the memory taken by one object of each model class
+
+Run from the repository root:
+    python3 -m benchmarks.compact_memory [objects]
+
+Objects are rebuilt with from_dicts() from to_dict() output, once as
+models and once as compact records, and tracemalloc measures the
+memory held per object. Attribute values are shared between the two
+runs, so the numbers are the per-object overhead of each layout.
+"""
+import sys
+import tracemalloc
+from models.amenity import Amenity
+from models.base_model import BaseModel
+from models.city import City
+from models.engine.compact import compact_class
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+
+SAMPLES = {
+    BaseModel: {},
+    User: {"email": "a@b.c", "password": "pwd", "first_name": "A",
+           "last_name": "B"},
+    State: {"name": "California"},
+    City: {"name": "Fresno", "state_id": "s"},
+    Amenity: {"name": "Wifi"},
+    Place: {"city_id": "c", "user_id": "u", "name": "House",
+            "description": "nice", "number_rooms": 2,
+            "number_bathrooms": 1, "max_guest": 4, "price_by_night": 100,
+            "latitude": 37.7, "longitude": -122.4},
+    Review: {"place_id": "p", "user_id": "u", "text": "great"},
+}
+
+
+def per_object(cls, dicts):
+    """bytes allocated per object by cls.from_dicts(dicts)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objs = cls.from_dicts(dicts)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objs
+    return (after - before) / len(dicts)
+
+
+def main(size):
+    """prints the bytes per object of each model class"""
+    print("{:>10} {:>12} {:>12}".format("class", "model (B)", "compact (B)"))
+    for model, attributes in SAMPLES.items():
+        template = model(**attributes).to_dict()
+        dicts = [dict(template, id="{:036d}".format(i))
+                 for i in range(size)]
+        # build once so one-time class setup is not counted
+        model.from_dicts(dicts[:1])
+        compact_class(model).from_dicts(dicts[:1])
+        print("{:>10} {:>12.0f} {:>12.0f}".format(
+            model.__name__, per_object(model, dicts),
+            per_object(compact_class(model), dicts)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+"""Benchmark of the console all command, time and peak memory
+
+Run from the repository root:
+    python3 -m benchmarks.console_all [objects]
+
+Each command runs in a fresh interpreter on the same generated file,
+reloaded before the measure, with the output sent to /dev/null:
+    list: the previous all, print() of the list of every str(obj)
+    all: the current all, streamed
+    all --json: the current all, one JSON object per line
+Both eager and lazy (HBNB_FILE_LAZY) reloads are measured.
+"""
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+from benchmarks.reload_memory import ROOT, generate
+
+
+def child(mode, path):
+    """runs one command in this interpreter and prints time and the
+    peak RSS it added"""
+    import models
+    from console import HBNBCommand
+    storage = models.storage
+    storage._FileStorage__file_path = path
+    storage.reload()
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    stdout = sys.stdout
+    start = perf_counter()
+    with open(os.devnull, "w") as sys.stdout:
+        if mode == "list":
+            print([str(value) for value in storage.all("Place").values()])
+        else:
+            HBNBCommand().onecmd(mode.replace("all", "all Place"))
+    elapsed = perf_counter() - start
+    sys.stdout = stdout
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps([elapsed, (peak - before) / 1024]))
+
+
+def main(size):
+    """prints time and added peak RSS of each command"""
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "bench.json")
+    generate(path, size)
+    print("{} Places, {:.1f} MB file".format(
+        size, os.path.getsize(path) / 1e6))
+    print("{:>8} {:>12} {:>10} {:>16}".format("reload", "command",
+                                              "time (s)", "peak +RSS (MB)"))
+    for reload in ("eager", "lazy"):
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        env.pop("HBNB_FILE_LAZY", None)
+        if reload == "lazy":
+            env["HBNB_FILE_LAZY"] = "1"
+        for mode in ("list", "all", "all --json"):
+            out = subprocess.run([sys.executable, "-m", __spec__.name,
+                                  "--child", mode, path], env=env, cwd=tmp,
+                                 check=True, capture_output=True, text=True)
+            elapsed, peak = json.loads(out.stdout)
+            print("{:>8} {:>12} {:>10.2f} {:>16.1f}".format(
+                reload, mode, elapsed, peak))
+    os.remove(path)
+    os.rmdir(tmp)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2], sys.argv[3])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+"""Benchmark of the parsing of <class>.<method>(<args>) console commands
+
+Run from the repository root:
+    python3 -m benchmarks.console_parse [lines]
+
+"split" is what HBNBCommand.default did before parse_call(): match two
+patterns given as strings, join the arguments into a line and split it
+again in the do_<command> method. "parse_call" is console.parse_call(),
+which also unquotes the strings and builds dictionaries and numbers.
+Nothing is looked up in the storage.
+"""
+import re
+import sys
+from time import perf_counter
+from console import parse_call
+
+LINES = [
+    'State.all()',
+    'State.count()',
+    'User.show("38f22813-2753-4d42-b37c-57a17f1e4f88")',
+    'User.destroy("38f22813-2753-4d42-b37c-57a17f1e4f88")',
+    'User.update("38f22813-2753-4d42-b37c-57a17f1e4f88", "first_name", '
+    '"John")',
+    'User.update("38f22813-2753-4d42-b37c-57a17f1e4f88", {"first_name": '
+    '"John", "age": 89})',
+]
+
+
+def split(line):
+    """parses a line as HBNBCommand.default did"""
+    cmdPattern = "^([A-Za-z]+)\\.([a-z]+)\\(([^(]*)\\)"
+    paramsPattern = ('^"([^"]+)"(?:,\\s*(?:"([^"]+)"|(\\{[^}]+\\}))'
+                     '(?:,\\s*(?:("?[^"]+"?)))?)?')
+    m = re.match(cmdPattern, line)
+    mName, method, params = m.groups()
+    m = re.match(paramsPattern, params)
+    params = [item for item in m.groups() if item] if m else []
+    return method, " ".join([mName] + params).split()
+
+
+def run(parse, lines):
+    """returns the lines per second parse goes through"""
+    start = perf_counter()
+    for line in lines:
+        parse(line)
+    return len(lines) / (perf_counter() - start)
+
+
+def main(count):
+    """prints the throughput of both parsers"""
+    lines = [LINES[i % len(LINES)] for i in range(count)]
+    print("{:>12} {:>12}".format("parser", "lines/s"))
+    for name, parse in (("split", split), ("parse_call", parse_call)):
+        print("{:>12} {:>12.0f}".format(name, run(parse, lines)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
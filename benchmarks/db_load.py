@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+"""Concurrent load on DBStorage, requests per second by thread count
+
+Run from the repository root against a database, e.g. a SQLite file:
+    HBNB_TYPE_STORAGE=db HBNB_DB_URL=sqlite:////tmp/bench.db \\
+        python3 -m benchmarks.db_load [seconds]
+
+Every thread plays a web worker: a request looks up one State, reads
+a page of States, counts the Cities and then calls storage.close() like
+the teardown of the Flask apps. The pool is sized from the
+HBNB_DB_POOL_* variables, e.g. HBNB_DB_POOL_SIZE=8.
+"""
+import random
+import sys
+import threading
+from os import getenv
+from time import perf_counter
+from models import storage
+from models.city import City
+from models.state import State
+
+STATES = 500
+THREADS = [1, 2, 4, 8]
+
+
+def fill():
+    """stores STATES States with a City each, returns their ids"""
+    ids = []
+    for i in range(STATES):
+        state = State(name="state_{}".format(i))
+        storage.new(state)
+        storage.new(City(name="city_{}".format(i), state_id=state.id))
+        ids.append(state.id)
+    storage.save()
+    storage.close()
+    return ids
+
+
+def request(ids, rand):
+    """one request of a web worker"""
+    state = storage.get(State, rand.choice(ids))
+    list(storage.iter_all(State, "name", state.id, 20))
+    storage.count(City)
+    storage.close()
+
+
+def run(ids, threads, seconds):
+    """returns the requests per second served by threads workers"""
+    done = [0] * threads
+    stop = perf_counter() + seconds
+
+    def worker(n):
+        rand = random.Random(n)
+        while perf_counter() < stop:
+            request(ids, rand)
+            done[n] += 1
+
+    workers = [threading.Thread(target=worker, args=(n,))
+               for n in range(threads)]
+    start = perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return sum(done) / (perf_counter() - start)
+
+
+def main(seconds):
+    """prints the throughput for each thread count"""
+    if getenv("HBNB_TYPE_STORAGE") != "db":
+        sys.exit("set HBNB_TYPE_STORAGE=db (and HBNB_DB_URL)")
+    ids = fill()
+    print("{:>8} {:>10}".format("threads", "req/s"))
+    for threads in THREADS:
+        print("{:>8} {:>10.0f}".format(threads, run(ids, threads, seconds)))
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 3)
@@ -0,0 +1,49 @@
+#!/usr/bin/python3
+"""Benchmark of FileStorage.close(), called by the web apps after every
+request
+
+Run from the repository root:
+    python3 -m benchmarks.file_reload [objects]
+
+    unchanged: close() when no process saved the file since, the current
+        close() only compares the stamp of the file
+    changed: close() after another process saved the file, read again
+        as every close() did before
+"""
+import os
+import sys
+import tempfile
+from time import perf_counter
+from benchmarks.reload_memory import generate
+
+
+def main(size, rounds=20):
+    """prints the mean time of close() on an unchanged and a changed
+    file"""
+    import models
+    storage = models.storage
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "bench.json")
+    generate(path, size)
+    storage._FileStorage__file_path = path
+    storage.reload()
+    print("{} Places, {:.1f} MB file".format(
+        size, os.path.getsize(path) / 1e6))
+    print("{:>10} {:>12}".format("file", "close() ms"))
+    for mode in ("unchanged", "changed"):
+        elapsed = 0
+        for i in range(rounds):
+            if mode == "changed":
+                # what another process saving the file looks like here
+                storage._FileStorage__stamp = None
+            start = perf_counter()
+            storage.close()
+            elapsed += perf_counter() - start
+        print("{:>10} {:>12.3f}".format(mode, elapsed / rounds * 1000))
+    for name in os.listdir(tmp):
+        os.remove(os.path.join(tmp, name))
+    os.rmdir(tmp)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+"""Benchmark of FileStorage.nearby / within_box against a scan
+
+Run from the repository root:
+    python3 -m benchmarks.geo_queries [places]
+
+Places are spread around 100 random city centers.
+"""
+import random
+import sys
+from timeit import timeit
+from models import storage
+from models.engine import geo
+from models.place import Place
+
+
+def fill(size):
+    """stores size Places, returns the city centers"""
+    storage.all().clear()
+    storage._FileStorage__reindex()
+    rand = random.Random(0)
+    centers = [(rand.uniform(-60, 60), rand.uniform(-170, 170))
+               for _ in range(100)]
+    template = Place(city_id="c", user_id="u", name="place").to_dict()
+    dicts = []
+    for i in range(size):
+        lat, lon = centers[i % len(centers)]
+        dicts.append(dict(template, id="{:08d}".format(i),
+                          latitude=lat + rand.gauss(0, 0.2),
+                          longitude=lon + rand.gauss(0, 0.2)))
+    for place in Place.from_dicts(dicts):
+        storage.new(place)
+    return centers
+
+
+def scan(places, lat, lon, radius_km, limit):
+    """ranks every Place"""
+    return geo.rank(((p.id, p.latitude, p.longitude) for p in places),
+                    lat, lon, radius_km, limit)
+
+
+def main(size):
+    """prints the latency of the geo queries"""
+    lat, lon = fill(size)[0]
+    places = list(storage.all(Place).values())
+    print("{} places".format(size))
+    print("{:>26} {:>8} {:>11} {:>12}".format(
+        "query", "results", "scan (ms)", "index (ms)"))
+    queries = (
+        ("nearby 1 km, limit 20", lambda: storage.nearby(lat, lon, 1, 20),
+         lambda: scan(places, lat, lon, 1, 20)),
+        ("nearby 5 km, limit 20", lambda: storage.nearby(lat, lon, 5, 20),
+         lambda: scan(places, lat, lon, 5, 20)),
+        ("box 0.02 x 0.02 deg",
+         lambda: storage.within_box(lat - .01, lon - .01, lat + .01,
+                                    lon + .01),
+         lambda: sorted(p.id for p in places
+                        if lat - .01 <= p.latitude <= lat + .01
+                        and lon - .01 <= p.longitude <= lon + .01)),
+    )
+    for label, query, baseline in queries:
+        results = query()
+        assert len(results) == len(baseline())
+        slow = timeit(baseline, number=1)
+        runs = 200
+        fast = timeit(query, number=runs) / runs
+        print("{:>26} {:>8} {:>11.1f} {:>12.3f}".format(
+            label, len(results), slow * 1000, fast * 1000))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
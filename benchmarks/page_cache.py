@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+"""Benchmark of the web_flask pages with and without the page cache
+
+Run from the repository root:
+    python3 -m benchmarks.page_cache [requests]
+or against a database, e.g. a SQLite file:
+    HBNB_TYPE_STORAGE=db HBNB_DB_URL=sqlite:////tmp/bench.db \\
+        python3 -m benchmarks.page_cache [requests]
+
+Requests go through the Flask test client, teardown (storage.close())
+included. "render" is the view without cached_page, "cached" a plain
+GET answered from the cache, "304" a GET with the ETag of the page.
+"""
+import sys
+from time import perf_counter
+from models import storage
+from models.amenity import Amenity
+from models.city import City
+from models.state import State
+from web_flask import create_app
+
+STATES = 50
+CITIES = 20
+AMENITIES = 30
+PAGES = ["/states_list", "/cities_by_states", "/states", "/hbnb_filters"]
+
+
+def fill():
+    """stores STATES States of CITIES Cities each and AMENITIES
+    Amenities"""
+    for i in range(STATES):
+        state = State(name="state_{}".format(i))
+        storage.new(state)
+        for j in range(CITIES):
+            storage.new(City(name="city_{}".format(j), state_id=state.id))
+    for i in range(AMENITIES):
+        storage.new(Amenity(name="amenity_{}".format(i)))
+    storage.save()
+    storage.close()
+
+
+def run(client, path, requests, headers=None):
+    """returns the requests per second of GET path"""
+    start = perf_counter()
+    for _ in range(requests):
+        client.get(path, headers=headers)
+    return requests / (perf_counter() - start)
+
+
+def main(requests):
+    """prints the throughput of each page"""
+    fill()
+    print("{:>20} {:>10} {:>10} {:>10}".format(
+        "page", "render", "cached", "304"))
+    app = create_app()
+    client = app.test_client()
+    for path in PAGES:
+        endpoint = app.url_map.bind("").match(path)[0]
+        view = app.view_functions[endpoint]
+        app.view_functions[endpoint] = view.__wrapped__
+        render = run(client, path, requests)
+        app.view_functions[endpoint] = view
+        etag = client.get(path).headers["ETag"]
+        cached = run(client, path, requests)
+        revalidated = run(client, path, requests, {"If-None-Match": etag})
+        print("{:>20} {:>10.0f} {:>10.0f} {:>10.0f}".format(
+            path, render, cached, revalidated))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
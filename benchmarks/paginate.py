@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+"""Benchmark of iter_all() keyset pages against all() + sort + slice
+
+Run from the repository root:
+    python3 -m benchmarks.paginate [states]
+or against a database, e.g. a SQLite file:
+    HBNB_TYPE_STORAGE=db HBNB_DB_URL=sqlite:////tmp/bench.db \\
+        python3 -m benchmarks.paginate [states]
+
+Both walk every State in pages of PAGE objects sorted by name. The
+peak column is the largest allocation (tracemalloc) made for a page.
+"""
+import sys
+import tracemalloc
+from time import perf_counter
+from models import storage
+from models.state import State
+
+PAGE = 100
+
+
+def fill(size):
+    """stores size States"""
+    for i in range(size):
+        storage.new(State(name="state_{:07d}".format(size - i)))
+    storage.save()
+
+
+def offset_pages(size):
+    """pages cut out of the whole sorted class, the previous way"""
+    for offset in range(0, size, PAGE):
+        states = sorted(storage.all(State).values(),
+                        key=lambda state: (state.name, state.id))
+        yield states[offset:offset + PAGE]
+
+
+def keyset_pages(size):
+    """pages of iter_all() starting after the last id seen"""
+    after = None
+    while True:
+        page = list(storage.iter_all(State, "name", after, PAGE))
+        if not page:
+            return
+        yield page
+        after = page[-1].id
+
+
+def walk(pages, size):
+    """returns the seconds and the largest page peak of a walk"""
+    peak = 0
+    start = perf_counter()
+    pages = pages(size)
+    while True:
+        tracemalloc.reset_peak()
+        if next(pages, None) is None:
+            break
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+    return perf_counter() - start, peak
+
+
+def main(size):
+    """prints the time and memory of both walks"""
+    fill(size)
+    offset = [s.id for page in offset_pages(size) for s in page]
+    keyset = [s.id for page in keyset_pages(size) for s in page]
+    assert offset == keyset
+    tracemalloc.start()
+    print("{:>8} {:>12} {:>12}".format("walk", "total (s)", "peak (KiB)"))
+    for name, pages in (("offset", offset_pages), ("keyset", keyset_pages)):
+        seconds, peak = walk(pages, size)
+        print("{:>8} {:>12.3f} {:>12.1f}".format(name, seconds, peak / 1024))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+"""Benchmark of FileStorage.filter_places against a Python scan
+
+Run from the repository root:
+    python3 -m benchmarks.place_filter [places]
+"""
+import random
+import sys
+from timeit import timeit
+from models import storage
+from models.engine import place_table
+from models.place import Place
+
+QUERIES = {
+    "one city": dict(city_ids=["city_7"]),
+    "price range": dict(min_price=100, max_price=120),
+    "rooms + guests": dict(min_rooms=3, min_guests=5),
+    "all predicates": dict(city_ids=["city_{}".format(i) for i in range(50)],
+                           min_price=50, max_price=250, min_rooms=2,
+                           min_guests=2),
+}
+
+
+def fill(size):
+    """stores size random Places"""
+    storage.all().clear()
+    storage._FileStorage__reindex()
+    rand = random.Random(0)
+    template = Place(user_id="u", name="place").to_dict()
+    dicts = [dict(template, id=str(i),
+                  city_id="city_{}".format(rand.randrange(1000)),
+                  price_by_night=rand.randrange(10, 500),
+                  number_rooms=rand.randrange(1, 6),
+                  max_guest=rand.randrange(1, 10))
+             for i in range(size)]
+    for place in Place.from_dicts(dicts):
+        storage.new(place)
+
+
+def main(size):
+    """prints the time of each query with both methods"""
+    if place_table.numpy is None:
+        sys.exit("NumPy is not installed")
+    fill(size)
+    places = list(storage.all(Place).values())
+    print("{} places".format(size))
+    print("{:>16} {:>9} {:>12} {:>12}".format(
+        "query", "matches", "scan (ms)", "table (ms)"))
+    for label, criteria in QUERIES.items():
+        found = storage.filter_places(**criteria)
+        assert len(found) == len(place_table.scan(places, **criteria))
+        scan = timeit(lambda: place_table.scan(places, **criteria),
+                      number=1)
+        runs = 10
+        table = timeit(lambda: storage.filter_places(**criteria),
+                       number=runs) / runs
+        print("{:>16} {:>9} {:>12.1f} {:>12.2f}".format(
+            label, len(found), scan * 1000, table * 1000))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+"""Microbenchmark of rebuilding model instances from to_dict() output
+
+Run from the repository root:
+    python3 -m benchmarks.rehydrate [objects]
+
+    strptime + setattr: the previous BaseModel.__init__ loop
+    __init__: the current BaseModel.__init__ (fromisoformat)
+    from_dicts: the bulk BaseModel.from_dicts path used by reload()
+"""
+import sys
+from datetime import datetime
+from time import perf_counter
+from sqlalchemy import inspect
+from models.place import Place
+
+
+def legacy(dicts):
+    """the previous __init__ body, run on fresh instances"""
+    manager = inspect(Place).class_manager
+    objs = []
+    for kwargs in dicts:
+        obj = manager.new_instance()
+        for key, value in kwargs.items():
+            if key == "created_at" or key == "updated_at":
+                value = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f")
+            if key != "__class__":
+                setattr(obj, key, value)
+        objs.append(obj)
+    return objs
+
+
+def main(size):
+    """prints the time to rebuild size Places with each path"""
+    template = Place(city_id="c", user_id="u", name="place",
+                     number_rooms=2, price_by_night=100, latitude=1.5,
+                     longitude=2.5).to_dict()
+    dicts = [dict(template, id=str(i)) for i in range(size)]
+    print("{} objects".format(size))
+    for label, build in (("strptime + setattr", legacy),
+                         ("__init__", lambda ds: [Place(**d) for d in ds]),
+                         ("from_dicts", Place.from_dicts)):
+        start = perf_counter()
+        objs = build(dicts)
+        elapsed = perf_counter() - start
+        assert objs[-1].to_dict() == dicts[-1]
+        print("{:>20}: {:>7.2f} s {:>10.0f} objects/s".format(
+            label, elapsed, size / elapsed))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+"""Benchmark of FileStorage.reload() time and peak memory
+
+Run from the repository root:
+    python3 -m benchmarks.reload_memory [objects]
+
+Each loader runs in a fresh interpreter on the same generated file:
+    json.load + eval: the previous reload(), whole file parsed at once,
+        followed by the indexing the current reload() does on the fly
+    streaming: the current reload()
+    lazy: the current reload() with HBNB_FILE_LAZY set
+"""
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import uuid
+from time import perf_counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def generate(path, size):
+    """writes a file.json of size Places"""
+    with open(path, "w", encoding="UTF-8") as f:
+        f.write("{")
+        for i in range(size):
+            _id = str(uuid.uuid4())
+            record = {"id": _id, "__class__": "Place",
+                      "created_at": "2017-09-28T21:03:54.052298",
+                      "updated_at": "2017-09-28T21:03:54.052302",
+                      "city_id": "c{}".format(i % 1000), "user_id": "u",
+                      "name": "place {}".format(i), "number_rooms": i % 5,
+                      "price_by_night": i % 300, "latitude": 37.77,
+                      "longitude": -122.43}
+            f.write("{}{}: {}".format(", " if i else "",
+                                      json.dumps("Place." + _id),
+                                      json.dumps(record)))
+        f.write("}")
+
+
+def child(mode, path):
+    """reloads path in this interpreter and prints time and peak RSS"""
+    from models import storage
+    from models.engine import file_storage
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    storage._FileStorage__file_path = path
+    start = perf_counter()
+    if mode == "json.load + eval":
+        objects = storage.all()
+        with open(path, 'r', encoding="UTF-8") as f:
+            for key, value in (json.load(f)).items():
+                objects[key] = vars(file_storage)[value["__class__"]](**value)
+        storage._FileStorage__reindex()
+    else:
+        storage.reload()
+    elapsed = perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps([len(storage.all()), elapsed, before, peak]))
+
+
+def main(size):
+    """prints reload time and peak RSS of each loader"""
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "bench.json")
+    generate(path, size)
+    print("{} objects, {:.1f} MB file".format(
+        size, os.path.getsize(path) / 1e6))
+    print("{:>18} {:>10} {:>16}".format("loader", "time (s)",
+                                        "peak RSS (MB)"))
+    for mode in ("json.load + eval", "streaming", "lazy"):
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        env.pop("HBNB_FILE_LAZY", None)
+        if mode == "lazy":
+            env["HBNB_FILE_LAZY"] = "1"
+        out = subprocess.run([sys.executable, "-m", __spec__.name,
+                              "--child", mode, path], env=env, cwd=tmp,
+                             check=True, capture_output=True, text=True)
+        count, elapsed, before, peak = json.loads(out.stdout)
+        assert count == size
+        print("{:>18} {:>10.2f} {:>16.1f}".format(
+            mode, elapsed, (peak - before) / 1024))
+    os.remove(path)
+    os.rmdir(tmp)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2], sys.argv[3])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+"""Benchmark of FileStorage.save() latency after a one-object update
+
+Run from the repository root:
+    python3 -m benchmarks.save_dirty [objects]
+
+"full to_dict" re-serializes every object like the previous save() did,
+"dirty only" is the current save(), which re-encodes the changed object
+and splices the cached JSON of the others.
+"""
+import json
+import os
+import sys
+import tempfile
+from time import perf_counter
+from models import storage
+from models.place import Place
+
+
+def full_dump(path):
+    """the previous save(): to_dict() every object, dump the lot"""
+    my_dict = {}
+    for key, value in storage.all().items():
+        my_dict[key] = value.to_dict()
+    with open(path, 'w', encoding="UTF-8") as f:
+        json.dump(my_dict, f)
+
+
+def main(size):
+    """prints the latency of a save following a single update"""
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "file.json")
+    storage._FileStorage__file_path = path
+    storage.all().clear()
+    storage._FileStorage__reindex()
+    places = [Place(name="place_{}".format(i), city_id="c", user_id="u",
+                    number_rooms=i % 5, price_by_night=i % 300)
+              for i in range(size)]
+    for place in places:
+        storage.new(place)
+    start = perf_counter()
+    storage.save()
+    print("{} objects, first save: {:.3f} s".format(
+        size, perf_counter() - start))
+    for label, save in (("full to_dict", lambda: full_dump(path)),
+                        ("dirty only", storage.save)):
+        runs = 5
+        start = perf_counter()
+        for i in range(runs):
+            places[i].name = "renamed"
+            save()
+        print("{:>14}: {:>10.2f} ms per save".format(
+            label, (perf_counter() - start) / runs * 1000))
+    os.remove(path)
+    os.rmdir(tmp)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,51 @@
+#!/usr/bin/python3
+"""Benchmark of FileStorage.save() with and without the journal
+
+Run from the repository root:
+    python3 -m benchmarks.save_journal [objects] [updates]
+
+Each update changes one Place and saves it, as a console update does.
+"""
+import os
+import sys
+import tempfile
+from time import perf_counter
+from models import storage
+from models.engine.journal import Journal
+from models.place import Place
+
+
+def run(places, updates):
+    """renames and saves the first updates places one at a time"""
+    for i, place in enumerate(places[:updates]):
+        place.name = "renamed_{}".format(i)
+        storage.new(place)
+        storage.save()
+
+
+def main(size, updates):
+    """prints the save throughput of both modes"""
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "file.json")
+    storage._FileStorage__file_path = path
+    storage.all().clear()
+    places = [Place(name="place_{}".format(i)) for i in range(size)]
+    for place in places:
+        storage.new(place)
+    print("{} objects, {} updates".format(size, updates))
+    for label, journal in (("full rewrite", None),
+                           ("journal", Journal(path + ".journal"))):
+        storage._FileStorage__journal = journal
+        storage.save()
+        start = perf_counter()
+        run(places, updates)
+        elapsed = perf_counter() - start
+        print("{:>14}: {:>10.1f} saves/s".format(label, updates / elapsed))
+    for name in os.listdir(tmp):
+        os.remove(os.path.join(tmp, name))
+    os.rmdir(tmp)
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [10000, 200][len(args):]))
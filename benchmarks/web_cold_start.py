@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+"""Cold start time and RSS of the web_flask application
+
+Run from the repository root:
+    python3 -m benchmarks.web_cold_start [--scripts]
+
+Every measure is a new Python process which imports the application,
+answers one GET through the Flask test client and reports the time
+since the start of the interpreter and its peak RSS. By default the
+application is web_flask.create_app(), cold (storage loaded by the
+first request needing it) and warm (warm_up=True, what a pre-forking
+WSGI server shares with its workers). With --scripts every per-task
+script of web_flask is measured as its own process instead.
+"""
+import json
+import subprocess
+import sys
+
+PAGES = [("0-hello_route", "/"),
+         ("1-hbnb_route", "/hbnb"),
+         ("2-c_route", "/c/is_fun"),
+         ("3-python_route", "/python"),
+         ("4-number_route", "/number/3"),
+         ("5-number_template", "/number_template/3"),
+         ("6-number_odd_or_even", "/number_odd_or_even/3"),
+         ("7-states_list", "/states_list"),
+         ("8-cities_by_states", "/cities_by_states"),
+         ("9-states", "/states"),
+         ("10-hbnb_filters", "/hbnb_filters")]
+
+CHILD = """
+import importlib, json, resource, sys, time
+start = time.perf_counter()
+module, path, warm = sys.argv[1], sys.argv[2], sys.argv[3] == "1"
+if module == "web_flask":
+    from web_flask import create_app
+    app = create_app(warm_up=warm)
+else:
+    app = importlib.import_module("web_flask." + module).app
+ready = time.perf_counter()
+status = app.test_client().get(path).status_code
+json.dump({"status": status, "ready": ready - start,
+           "first": time.perf_counter() - start,
+           "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss},
+          sys.stdout)
+"""
+
+
+def measure(module, path, warm=False):
+    """returns the report of a new process serving one GET"""
+    out = subprocess.run([sys.executable, "-W", "ignore", "-c", CHILD,
+                          module, path, "1" if warm else "0"],
+                         check=True, capture_output=True, text=True).stdout
+    report = json.loads(out)
+    assert report["status"] == 200, (module, path, report)
+    return report
+
+
+def show(name, path, report):
+    """prints one line of results"""
+    print("{:>22} {:>22} {:>10.0f} {:>10.0f} {:>9.1f}".format(
+        name, path, report["ready"] * 1000, report["first"] * 1000,
+        report["rss"] / 1024))
+
+
+def main(scripts):
+    """prints the startup time and RSS of each measure"""
+    print("{:>22} {:>22} {:>10} {:>10} {:>9}".format(
+        "application", "GET", "ready ms", "first ms", "RSS MiB"))
+    if scripts:
+        total = 0
+        for module, path in PAGES:
+            report = measure(module, path)
+            total += report["rss"]
+            show(module, path, report)
+        print("{:>22} {:>55.1f}".format("11 processes", total / 1024))
+        return
+    for warm in (False, True):
+        name = "create_app (warm)" if warm else "create_app"
+        for path in ("/", "/cities_by_states"):
+            show(name, path, measure("web_flask", path, warm))
+
+
+if __name__ == "__main__":
+    main("--scripts" in sys.argv[1:])
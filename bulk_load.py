@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+"""Loads NDJSON objects into the storage
+
+Usage:
+    ./bulk_load.py [-b BATCH] [FILE ...]
+
+Every line of the files (or of the standard input) is one object as
+written by to_dict(), with its "__class__". The objects go to the
+storage through bulk_new(), BATCH lines at a time, and are saved by a
+single bulk_save() at the end, so nothing is saved if a line is wrong.
+"""
+import argparse
+import fileinput
+import json
+import sys
+from os import getenv
+from time import perf_counter
+from models import classes, storage
+
+
+def load(lines, batch):
+    """builds and stores the objects of NDJSON lines, the ones of a class
+    without a table (BaseModel) are refused in DB mode
+    Args:
+        lines: iterable of lines
+        batch: number of lines handed to bulk_new() at once
+    Return:
+        returns the number of objects stored
+    """
+    count = 0
+    groups = {}
+    db = getenv("HBNB_TYPE_STORAGE") == "db"
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            value = json.loads(line)
+            cls = classes[value["__class__"]]
+            if db and not hasattr(cls, "__table__"):
+                raise TypeError("{} has no table".format(cls.__name__))
+        except (ValueError, KeyError, TypeError) as error:
+            raise ValueError("line {}: {!r}".format(number, error))
+        groups.setdefault(cls, []).append(value)
+        if number % batch == 0:
+            count += flush(groups)
+    return count + flush(groups)
+
+
+def flush(groups):
+    """hands the objects of grouped dictionaries to bulk_new()
+    Args:
+        groups: class -> list of dictionaries, emptied
+    Return:
+        returns the number of objects
+    """
+    objects = []
+    for cls, values in groups.items():
+        objects.extend(cls.from_dicts(values))
+    groups.clear()
+    return storage.bulk_new(objects)
+
+
+def main():
+    """parses the command line and loads the files"""
+    parser = argparse.ArgumentParser(description="Load NDJSON objects")
+    parser.add_argument("-b", "--batch", type=int, default=10000,
+                        help="lines per bulk_new() call")
+    parser.add_argument("files", nargs="*", help="files, default stdin")
+    args = parser.parse_args()
+    start = perf_counter()
+    try:
+        with fileinput.input(args.files) as lines:
+            count = load(lines, args.batch)
+    except ValueError as error:
+        sys.exit("** {} **".format(error))
+    storage.bulk_save()
+    seconds = perf_counter() - start
+    print("{} objects loaded in {:.2f}s ({:.0f}/s)".format(
+        count, seconds, count / seconds if seconds else 0))
+
+
+if __name__ == "__main__":
+    main()
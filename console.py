@@ -1,33 +1,119 @@
 #!/usr/bin/python3
 
-"""An interactive shell for managing objects in an Airbnb-like application"""
+"""An interactive shell for managing objects in an Airbnb-like application
+
+Usage:
+    ./console.py
+    ./console.py --batch [FILE] [-n EVERY]
+
+With --batch the commands of FILE (or of the standard input) are run
+without prompt, the storage is saved once every EVERY commands changing
+it and at the end, and the time spent per command is written to the
+standard error.
+"""
 
 import cmd
+import json
 import re
-from models.base_model import BaseModel
-from models import storage
-from models.user import User
-from models.state import State
-from models.city import City
-from models.amenity import Amenity
-from models.place import Place
-from models.review import Review
+import sys
+from ast import literal_eval
+from datetime import datetime
+from itertools import islice
+from time import perf_counter
+import models
 import shlex
 
-class_home = {
-    "BaseModel": BaseModel,
-    "User": User,
-    "State": State,
-    "City": City,
-    "Amenity": Amenity,
-    "Place": Place,
-    "Review": Review,
-}
+# classes are imported, and the storage loaded, by the first command
+# needing them
+class_home = models.classes
+# <class>.<method>(<args>) commands, parsed by parse_call(), and their
+# arguments: a "string", a {dictionary} or anything up to a comma
+CALL = re.compile(r"^(\w+)\.(\w+)\((.*)\)\s*$")
+ARG = re.compile(r'"([^"\\]*(?:\\.[^"\\]*)*)"|(\{.*\})|([^,\s][^,]*)')
+ESCAPE = re.compile(r"\\(.)")
+# methods of the calls, with their number of arguments after the class
+CALLS = {"all": 0, "count": 0, "show": 1, "destroy": 1, "update": 3}
 
 class HBNBCommand(cmd.Cmd):
     """Command interpreter for the HBNB console"""
 
     prompt = '(hbnb)  '
+    every = None
+    unsaved = 0
+
+    def save(self, obj=None):
+        """saves an object like BaseModel.save() and flushes the storage,
+        or in batch mode counts the change until flush()
+        Args:
+            obj: object to store with a new updated_at, None to only
+                flush what the command changed
+        """
+        if obj is not None:
+            obj.updated_at = datetime.now()
+            models.storage.new(obj)
+        if self.every is None:
+            models.storage.save()
+        else:
+            self.unsaved += 1
+
+    def flush(self):
+        """saves the storage if commands changed it since the last flush
+        Return:
+            returns True if the storage was saved
+        """
+        if not self.unsaved:
+            return False
+        models.storage.save()
+        self.unsaved = 0
+        return True
+
+    def run_batch(self, lines, every=1000, report=sys.stderr):
+        """runs commands without prompt, flushing the storage once per
+        every changing commands and at the end (also when a command
+        fails), then writes the timings of each command to report
+        Args:
+            lines: iterable of command lines, blank ones and comments
+                starting with # are skipped
+            every: changing commands per flush
+            report: file of the timings, None for no report
+        Return:
+            returns the timings, command -> [count, seconds, max seconds]
+        """
+        timings = {}
+        self.every = every
+        start = perf_counter()
+        try:
+            for line in lines:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                begin = perf_counter()
+                stop = self.onecmd(line)
+                timed(timings, self.command_name(line), begin)
+                if self.unsaved >= every:
+                    begin = perf_counter()
+                    self.flush()
+                    timed(timings, "(flush)", begin)
+                if stop:
+                    break
+        finally:
+            begin = perf_counter()
+            if self.flush():
+                timed(timings, "(flush)", begin)
+            self.every = None
+        if report is not None:
+            report_timings(timings, perf_counter() - start, report)
+        return timings
+
+    def command_name(self, line):
+        """returns the name of the command of a line, e.g. "create" for
+        "create State" or "count" for "State.count()"
+        """
+        name, arg, line = self.parseline(line)
+        match = re.match(r"\.(\w+)\(", arg or "")
+        if match:
+            return match.group(1)
+        return name or line
 
     def do_EOF(self, line):
         """Exits the console"""
@@ -49,148 +135,383 @@ class HBNBCommand(cmd.Cmd):
 
     def do_create(self, args):
         """ Create an object of any class"""
-        my_list = args.split(' ')
+        my_list = args.split()
         if not args:
             print("** class name missing **")
             return
         elif my_list[0] not in class_home:
             print("** class doesn't exist **")
             return
-        new_instance = class_home[my_list[0]]()
+        cls = class_home[my_list[0]]
+        attrs = {}
+        for param in my_list[1:]:
+            key, sep, value = param.partition('=')
+            if not key or not sep:
+                print("** invalid parameter {} **".format(param))
+                return
+            attrs[key] = parameter(value)
+        attrs = self.typed(cls, attrs)
+        if attrs is None:
+            return
+        new_instance = cls()
         print(new_instance.id)
-
-        for params in my_list[1:]:
-            key_value = params.split('=')
-            key = key_value[0]
-            value = key_value[1]
-            table = {
-                34: None,
-                95: 32
-            }
-            value = value.translate(table)
+        for key, value in attrs.items():
             setattr(new_instance, key, value)
-        new_instance.save()
+        self.save(new_instance)
 
     def do_show(self, line):
         """Prints the string representation of an instance"""
-        arr = line.split()
-
-        if len(arr) < 1:
-            print("** class name missing **")
-        elif arr[0] not in class_home:
-            print("** class doesn't exist **")
-        elif len(arr) < 2:
-            print("** instance id missing **")
-        else:
-            new_str = f"{arr[0]}.{arr[1]}"
-            if new_str not in storage.all():
-                print("** no instance found **")
-            else:
-                print(storage.all()[new_str])
+        self.call_show(*line.split()[:2])
 
     def do_destroy(self, line):
         """Deletes an instance based on the class name and id"""
-        arr = line.split()
-        if len(arr) < 1:
-            print("** class name missing **")
-        elif arr[0] not in class_home:
-            print("** class doesn't exist **")
-        elif len(arr) < 2:
-            print("** instance id missing **")
-        else:
-            new_str = f"{arr[0]}.{arr[1]}"
-            if new_str not in storage.all().keys():
-                print("** no instance found **")
-            else:
-                storage.all().pop(new_str)
-                storage.save()
+        self.call_destroy(*line.split()[:2])
 
     def do_all(self, line):
-        """Prints all instances or instances of a specific class"""
-        objects = []
-        if line == "":
-            print([str(value) for key, value in storage.all().items()])
-        else:
-            st = line.split(" ")
-            if st[0] not in class_home:
-                print("** class doesn't exist **")
+        """Prints all instances or instances of a specific class
+        Usage: all [<class>] [<attribute>=<value> ...] [--json]
+        [--limit <count>] [--offset <count>]
+        The instances are written one by one, as one list or with --json
+        as one JSON object per line, keeping those whose attributes equal
+        the given values, skipping the first offset ones.
+        """
+        try:
+            args = shlex.split(line)
+        except ValueError:
+            args = line.split()
+        name = None
+        filters = {}
+        options = {}
+        args = iter(args)
+        for arg in args:
+            if arg == "--json":
+                options["as_json"] = True
+            elif arg.startswith("--"):
+                option, sep, value = arg[2:].partition("=")
+                if not sep:
+                    value = next(args, "")
+                if option not in ("limit", "offset") or not value.isdigit():
+                    print("** invalid option {} **".format(arg))
+                    return
+                options[option] = int(value)
+            elif "=" in arg:
+                key, sep, value = arg.partition("=")
+                filters[key] = parameter(value)
+            elif name is None:
+                name = arg
             else:
-                for key, value in storage.all().items():
-                    clas = key.split(".")
-                    if clas[0] == st[0]:
-                        objects.append(str(value))
-                print(objects)
+                print("** invalid argument {} **".format(arg))
+                return
+        self.call_all(name, filters, **options)
 
     def do_update(self, line):
         """Updates an instance based on the class name and id"""
-        arr = line.split()
-        if len(arr) < 1:
-            print("** class name missing **")
+        try:
+            args = shlex.split(line)
+        except ValueError:
+            args = line.split()
+        self.call_update(*args[:4])
+
+    def do_count(self, line):
+        """Prints the count of all class instances"""
+        self.call_count(line)
+
+    def default(self, line):
+        """Handles commands in the format <class name>.<command>(<args>),
+        the arguments being passed to call_<command> as parsed by
+        parse_call()
+        """
+        call = parse_call(line)
+        if call is None or call[1] not in CALLS:
+            super().default(line)
             return
-        elif arr[0] not in class_home:
+        name, method, args = call
+        return getattr(self, "call_" + method)(name, *args[:CALLS[method]])
+
+    def lookup(self, name, id):
+        """returns an object, or prints why there is none
+        Args:
+            name: class name
+            id: id of the object
+        Return:
+            returns the object, or None
+        """
+        if name is None:
+            print("** class name missing **")
+        elif name not in class_home:
             print("** class doesn't exist **")
-            return
-        elif len(arr) < 2:
+        elif id is None:
             print("** instance id missing **")
-            return
         else:
-            new_str = f"{arr[0]}.{arr[1]}"
-            if new_str not in storage.all().keys():
+            obj = models.storage.get(name, id)
+            if obj is None:
                 print("** no instance found **")
-            elif len(arr) < 3:
-                print("** attribute name missing **")
-                return
-            elif len(arr) < 4:
-                print("** value missing **")
-                return
-            else:
-                setattr(storage.all()[new_str], arr[2], arr[3])
-                storage.save()
+            return obj
+        return None
 
-    def do_count(self, line):
-        """Prints the count of all class instances"""
-        kclass = globals().get(line, None)
-        if kclass is None:
+    def call_show(self, name=None, id=None):
+        """<class>.show(<id>): prints an instance"""
+        obj = self.lookup(name, id)
+        if obj is not None:
+            print(obj)
+
+    def call_destroy(self, name=None, id=None):
+        """<class>.destroy(<id>): deletes an instance"""
+        obj = self.lookup(name, id)
+        if obj is not None:
+            models.storage.delete(obj)
+            self.save()
+
+    def call_all(self, name=None, filters=None, as_json=False, limit=None,
+                 offset=0):
+        """<class>.all(): prints the instances of a class, all of them
+        if name is None, streamed from the storage one by one
+        Args:
+            name: class name, None for every class
+            filters: values the attributes must equal, converted to the
+                types of the columns of each class
+            as_json: writes one to_dict() JSON object per line instead
+                of a list of strings
+            limit: maximum number of instances, None for no limit
+            offset: number of matching instances to skip
+        """
+        if name is not None and name not in class_home:
             print("** class doesn't exist **")
             return
-        count = 0
-        for obj in storage.all().values():
-            if obj.__class__.__name__ == line:
-                count += 1
-        print(count)
+        objs = models.storage.stream(name)
+        if filters:
+            if name is not None and \
+                    self.typed(class_home[name], filters) is None:
+                return
+            objs = filter(matcher(filters), objs)
+        if offset or limit is not None:
+            objs = islice(objs, offset,
+                          None if limit is None else offset + limit)
+        write = sys.stdout.write
+        if as_json:
+            for obj in objs:
+                write(json.dumps(obj.to_dict(), default=str) + "\n")
+            return
+        # the same text as print([str(obj) for obj in objs])
+        sep = "["
+        for obj in objs:
+            write(sep + repr(str(obj)))
+            sep = ", "
+        write("[]\n" if sep == "[" else "]\n")
 
-    def default(self, line):
-        """Handles commands in the format <class name>.<command>"""
-        if line is None:
+    def call_update(self, name=None, id=None, attr=None, value=None):
+        """<class>.update(<id>, <attribute>, <value>) or
+        <class>.update(<id>, <dictionary>): sets attributes of an
+        instance, then saves it once
+        """
+        obj = self.lookup(name, id)
+        if obj is None:
+            return
+        if type(attr) is dict:
+            attrs = attr
+        elif attr is None:
+            print("** attribute name missing **")
+            return
+        elif value is None:
+            print("** value missing **")
+            return
+        else:
+            attrs = {str(attr): value}
+        attrs = self.typed(class_home[name], attrs)
+        if attrs is None:
             return
+        for attr, value in attrs.items():
+            setattr(obj, attr, value)
+        self.save(obj)
 
-        cmdPattern = "^([A-Za-z]+)\.([a-z]+)\(([^(]*)\)"
-        paramsPattern = """^"([^"]+)"(?:,\s*(?:"([^"]+)"|(\{[^}]+\}))(?:,\s*(?:("?[^"]+"?)))?)?"""
-        m = re.match(cmdPattern, line)
-        if not m:
-            super().default(line)
+    def typed(self, cls, attrs):
+        """converts values to the types of the columns of a class, see
+        convert()
+        Args:
+            cls: model class
+            attrs: values by attribute name
+        Return:
+            returns the converted values, or None after printing why one
+            of them does not fit its column
+        """
+        try:
+            return {attr: convert(cls, attr, value)
+                    for attr, value in attrs.items()}
+        except ValueError as error:
+            print("** invalid value: {} **".format(error))
+            return None
+
+    def call_count(self, name=None):
+        """<class>.count(): prints the number of instances of a class"""
+        if name not in class_home:
+            print("** class doesn't exist **")
             return
-        mName, method, params = m.groups()
-        m = re.match(paramsPattern, params)
-        params = [item for item in m.groups() if item] if m else []
+        print(models.storage.count(name))
+
+
+def parse_call(line):
+    """parses a <class>.<method>(<args>) command
+    The arguments are comma separated: "strings" (with \\" escapes),
+    dictionaries (JSON or Python literals), numbers, and anything else
+    up to the next comma, kept as a string.
+    Args:
+        line: command line
+    Return:
+        returns (class name, method, list of arguments), or None if the
+        line is not a call or a dictionary is not valid
+    """
+    match = CALL.match(line)
+    if match is None:
+        return None
+    name, method, text = match.groups()
+    args = []
+    for match in ARG.finditer(text):
+        kind = match.lastindex
+        value = match.group(kind)
+        if kind == 1:
+            if "\\" in value:
+                value = ESCAPE.sub(r"\1", value)
+        elif kind == 2:
+            value = dictionary(value)
+            if value is None:
+                return None
+        else:
+            value = Unquoted(value.rstrip())
+        args.append(value)
+    return name, method, args
+
+
+def dictionary(text):
+    """returns the dictionary written in text, as JSON or as a Python
+    literal (e.g. with single quotes), None if it is not one"""
+    try:
+        value = json.loads(text)
+    except ValueError:
+        try:
+            value = literal_eval(text)
+        except (ValueError, SyntaxError):
+            return None
+    return value if type(value) is dict else None
+
+
+def parameter(text):
+    """returns the value of a <key>=<value> parameter of create: a string,
+    "quoted" or not, with \\" escapes and underscores standing for
+    spaces, Unquoted if it was not quoted"""
+    if len(text) < 2 or text[0] != '"' or text[-1] != '"':
+        if type(number(text)) is not str:
+            return Unquoted(text)
+        return Unquoted(ESCAPE.sub(r"\1", text.replace("_", " ")))
+    return ESCAPE.sub(r"\1", text[1:-1].replace("_", " "))
+
+
+class Unquoted(str):
+    """text of an unquoted value, converted by convert() from the type of
+    its column, or to a number if it is one and the attribute is not a
+    column"""
+
+
+def convert(cls, name, value):
+    """converts a value to the type of the column of an attribute, see
+    BaseModel.coerce; Unquoted values of attributes that are not columns
+    become numbers when they are ones
+    Args:
+        cls: model class
+        name: name of the attribute
+        value: value to convert
+    Return:
+        returns the converted value
+    Raises:
+        ValueError: if the value does not fit the column
+    """
+    if type(value) is Unquoted:
+        table = getattr(cls, "__table__", None)
+        if table is None or name not in table.columns:
+            return number(str(value))
+        value = str(value)
+    return cls.coerce(name, value)
+
+
+def matcher(filters):
+    """returns a function telling whether an object has the given values,
+    converted to the types of the columns of its class once per class; an
+    object of a class where a value does not fit its column never matches
+    Args:
+        filters: values by attribute name
+    """
+    typed = {}
+
+    def match(obj):
+        """tells whether obj has the values of filters"""
+        cls = type(obj)
+        values = typed.get(cls)
+        if values is None:
+            # compact records stand in for their model class
+            model = class_home[cls.__name__]
+            try:
+                values = [(key, convert(model, key, value))
+                          for key, value in filters.items()]
+            except ValueError:
+                values = False
+            typed[cls] = values
+        return values is not False and all(
+            getattr(obj, key, None) == value for key, value in values)
+    return match
 
-        cmd = " ".join([mName] + params)
 
-        if method == 'all':
-            return self.do_all(cmd)
+def number(text):
+    """returns text as an int or a float if it is one, else text"""
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
 
-        if method == 'count':
-            return self.do_count(cmd)
 
-        if method == 'show':
-            return self.do_show(cmd)
+def timed(timings, name, begin):
+    """adds the time elapsed since begin to the timings of a command"""
+    seconds = perf_counter() - begin
+    timing = timings.setdefault(name, [0, 0.0, 0.0])
+    timing[0] += 1
+    timing[1] += seconds
+    timing[2] = max(timing[2], seconds)
 
-        if method == 'destroy':
-            return self.do_destroy(cmd)
 
-        if method == 'update':
-            return self.do_update(cmd)
+def report_timings(timings, seconds, report):
+    """writes the timings of a batch and its throughput
+    Args:
+        timings: command -> [count, seconds, max seconds]
+        seconds: duration of the batch
+        report: file to write to
+    """
+    print("{:>12} {:>10} {:>10} {:>10} {:>10}".format(
+        "command", "count", "total ms", "mean us", "max ms"), file=report)
+    commands = 0
+    for name, (count, total, most) in sorted(timings.items()):
+        if name != "(flush)":
+            commands += count
+        print("{:>12} {:>10} {:>10.1f} {:>10.1f} {:>10.2f}".format(
+            name, count, total * 1000, total / count * 1e6, most * 1000),
+            file=report)
+    print("{} commands in {:.2f}s ({:.0f}/s), {} flushes".format(
+        commands, seconds, commands / seconds if seconds else 0,
+        timings.get("(flush)", [0])[0]), file=report)
 
 
 if __name__ == '__main__':
-    HBNBCommand().cmdloop()
\ No newline at end of file
+    import argparse
+    import fileinput
+    parser = argparse.ArgumentParser(description="HBNB console")
+    parser.add_argument("--batch", metavar="FILE", nargs="?", const="-",
+                        help="run the commands of FILE (default stdin)")
+    parser.add_argument("-n", "--every", type=int, default=1000,
+                        help="commands per save in batch mode")
+    args = parser.parse_args()
+    if args.batch is None:
+        HBNBCommand().cmdloop()
+    else:
+        with fileinput.input([args.batch]) as lines:
+            HBNBCommand().run_batch(lines, max(args.every, 1))
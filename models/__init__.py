@@ -1,12 +1,107 @@
 #!/usr/bin/python3
-"""This module instantiates an object of class FileStorage or DBStorage"""
+"""This module instantiates an object of class FileStorage or DBStorage
+
+Nothing is done at import: the storage is built, and its file or
+database loaded, the first time models.storage is looked up, and a
+model class (and SQLAlchemy with it) is imported the first time it is
+looked up in models.classes.
+"""
+import threading
+from collections.abc import Mapping
+from importlib import import_module
 from os import getenv
 
 
-if getenv('HBNB_TYPE_STORAGE') == 'db':
-    from models.engine.db_storage import DBStorage
-    storage = DBStorage()
-else:
-    from models.engine.file_storage import FileStorage
-    storage = FileStorage()
-storage.reload()
\ No newline at end of file
+class Classes(Mapping):
+    """model classes by name, each imported on first lookup (all of
+    them in DB mode)
+    Attributes:
+        modules: module defining each class, by class name
+    """
+    modules = {
+        "BaseModel": "models.base_model",
+        "User": "models.user",
+        "State": "models.state",
+        "City": "models.city",
+        "Amenity": "models.amenity",
+        "Place": "models.place",
+        "Review": "models.review",
+    }
+
+    def __init__(self):
+        """starts with no class imported"""
+        self.__imported = {}
+
+    def __getitem__(self, name):
+        """returns a class, importing its module the first time
+        Args:
+            name: name of the class
+        Return:
+            returns the class
+        """
+        cls = self.__imported.get(name)
+        if cls is None:
+            if getenv('HBNB_TYPE_STORAGE') == 'db':
+                # the relationships name classes other modules define
+                # (Place.amenities), mappers need them all
+                for module in self.modules.values():
+                    import_module(module)
+            cls = getattr(import_module(self.modules[name]), name)
+            self.__imported[name] = cls
+        return cls
+
+    def __contains__(self, name):
+        """tells whether name is a model class, without importing it"""
+        return name in self.modules
+
+    def __iter__(self):
+        """iterates over the class names"""
+        return iter(self.modules)
+
+    def __len__(self):
+        """returns the number of classes"""
+        return len(self.modules)
+
+
+classes = Classes()
+_lock = threading.RLock()
+_building = None
+
+
+def __getattr__(name):
+    """builds models.storage on first access (PEP 562)
+    The storage is a plain module attribute afterwards, this function is
+    not called any more. Objects built while reload() runs find the
+    storage being loaded.
+    Args:
+        name: name of the missing attribute
+    Return:
+        returns the storage
+    """
+    global _building
+    if name != "storage":
+        raise AttributeError("module {!r} has no attribute {!r}"
+                             .format(__name__, name))
+    with _lock:
+        if "storage" in globals():
+            return globals()["storage"]
+        if _building is not None:
+            return _building
+        if getenv('HBNB_TYPE_STORAGE') == 'db':
+            from models.engine.db_storage import DBStorage
+            storage = DBStorage()
+        else:
+            from models.engine.file_storage import FileStorage
+            storage = FileStorage()
+        if getenv('HBNB_CACHE'):
+            from models.engine.cache import CachedStorage
+            storage = CachedStorage(storage,
+                                    int(getenv('HBNB_CACHE_SIZE', 1024)),
+                                    float(getenv('HBNB_CACHE_TTL', 60)))
+        _building = storage
+        try:
+            storage.reload()
+        finally:
+            _building = None
+        globals()["storage"] = storage
+        return storage
@@ -1,15 +1,31 @@
 #!/usr/bin/python3
 """This is the base model class for AirBnB"""
 from sqlalchemy.ext.declarative import declarative_base
+import math
 import uuid
 import models
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime
+from importlib import import_module
+from os import getenv
+from sqlalchemy import Column, Integer, Float, String, DateTime, inspect
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper, configure_mappers
 
 
 Base = declarative_base()
 
 
+@event.listens_for(Mapper, "before_configured")
+def import_models():
+    """imports every model module before the mappers are configured, in
+    DB mode the relationships name classes other modules define
+    (Place.amenities) and a model may be imported alone
+    """
+    if getenv('HBNB_TYPE_STORAGE') == 'db':
+        for module in models.classes.modules.values():
+            import_module(module)
+
+
 class BaseModel:
     """This class will defines all common attributes/methods
     for other classes
@@ -31,7 +47,7 @@ class BaseModel:
         if kwargs:
             for key, value in kwargs.items():
                 if key == "created_at" or key == "updated_at":
-                    value = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f")
+                    value = datetime.fromisoformat(value)
                 if key != "__class__":
                     setattr(self, key, value)
             if "id" not in kwargs:
@@ -44,6 +60,106 @@ class BaseModel:
             self.id = str(uuid.uuid4())
             self.created_at = self.updated_at = datetime.now()
 
+    @classmethod
+    def from_dicts(cls, dicts):
+        """builds many instances from to_dict() dictionaries in one call
+        The dictionaries are copied straight into the new instances,
+        skipping __init__ and the per-key setattr, and the dates are
+        parsed with datetime.fromisoformat.
+        Args:
+            dicts: iterable of dictionaries as returned by to_dict()
+        Return:
+            returns the list of instances
+        """
+        mapper = inspect(cls, raiseerr=False)
+        if mapper is not None:
+            if not mapper.configured:
+                configure_mappers()
+            new = mapper.class_manager.new_instance
+        else:
+            new = cls.__new__
+        parse = datetime.fromisoformat
+        objs = []
+        for value in dicts:
+            if ("id" not in value or "created_at" not in value
+                    or "updated_at" not in value):
+                objs.append(cls(**value))
+                continue
+            obj = new() if mapper is not None else new(cls)
+            attrs = obj.__dict__
+            attrs.update(value)
+            attrs.pop("__class__", None)
+            attrs["created_at"] = parse(attrs["created_at"])
+            attrs["updated_at"] = parse(attrs["updated_at"])
+            objs.append(obj)
+        return objs
+
+    @classmethod
+    def coerce(cls, name, value):
+        """converts a value to the type of the column of an attribute
+        Integer and Float columns take numbers or strings of numbers,
+        String columns take values no longer than their length, DateTime
+        columns take datetimes or ISO format strings. Attributes that are
+        not columns are left as they are.
+        Args:
+            name: name of the attribute
+            value: new value, often a string from the console
+        Return:
+            returns the value as the column stores it
+        Raises:
+            ValueError: if the value does not fit the column
+        """
+        table = getattr(cls, "__table__", None)
+        column = table.columns.get(name) if table is not None else None
+        if column is None:
+            return value
+        kind = column.type
+        if isinstance(kind, Integer):
+            if type(value) is float and value.is_integer():
+                value = int(value)
+            try:
+                if type(value) is str or type(value) is int:
+                    return int(value)
+            except ValueError:
+                pass
+            raise ValueError("{} takes an integer".format(name))
+        if isinstance(kind, Float):
+            try:
+                if type(value) in (str, int, float) and \
+                        math.isfinite(float(value)):
+                    return float(value)
+            except ValueError:
+                pass
+            raise ValueError("{} takes a number".format(name))
+        if isinstance(kind, String):
+            if type(value) not in (str, int, float):
+                raise ValueError("{} takes a string".format(name))
+            value = str(value)
+            if kind.length is not None and len(value) > kind.length:
+                raise ValueError("{} takes at most {} characters".format(
+                    name, kind.length))
+            return value
+        if isinstance(kind, DateTime):
+            try:
+                if isinstance(value, datetime):
+                    return value
+                if type(value) is str:
+                    return datetime.fromisoformat(value)
+            except ValueError:
+                pass
+            raise ValueError("{} takes an ISO format date".format(name))
+        return value
+
+    def __setattr__(self, name, value):
+        """sets an attribute and tells the storage the object changed
+        Args:
+            name: name of the attribute
+            value: new value
+        """
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            models.storage.touch(self)
+
     def __str__(self):
         """returns a string
         Return:
@@ -80,4 +196,4 @@ class BaseModel:
     def delete(self):
         """ delete object
         """
-        models.storage.delete(self)
\ No newline at end of file
+        models.storage.delete(self)
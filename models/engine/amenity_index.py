@@ -0,0 +1,127 @@
+#!/usr/bin/python3
+"""This module keeps, for each amenity, a bitmap of the Places having it,
+so that "places having all of these amenities" is an AND of integers"""
+
+
+class AmenityIndex:
+    """This class gives each Place a position and keeps, per amenity id,
+    an int whose bit at a Place's position is set when the Place has
+    the amenity
+    Attributes:
+        positions: position of each Place key
+        keys: Place key at each position, None for a free position
+        free: positions to reuse
+        amenities: amenity ids each Place key is indexed under
+        bitmaps: bitmap of each amenity id
+        pending: positions to set in the bitmaps, applied in bulk by
+            flush() so that reload() does not rebuild an int per Place
+    """
+
+    def __init__(self):
+        """Instantiation of the index
+        """
+        self.clear()
+
+    def clear(self):
+        """removes every Place
+        """
+        self.positions = {}
+        self.keys = []
+        self.free = []
+        self.amenities = {}
+        self.bitmaps = {}
+        self.pending = {}
+
+    def __len__(self):
+        """returns the number of Places in the index
+        """
+        return len(self.positions)
+
+    def set(self, key, amenity_ids):
+        """sets the amenities of a Place
+        Args:
+            key: storage key of the Place
+            amenity_ids: ids of its amenities
+        """
+        amenity_ids = frozenset(amenity_ids or ())
+        old = self.amenities.get(key, frozenset())
+        if key in self.positions and old == amenity_ids:
+            return
+        position = self.positions.get(key)
+        if position is None:
+            if self.free:
+                position = self.free.pop()
+                self.keys[position] = key
+            else:
+                position = len(self.keys)
+                self.keys.append(key)
+            self.positions[key] = position
+        for amenity_id in old - amenity_ids:
+            self.__clear_bit(amenity_id, position)
+        for amenity_id in amenity_ids - old:
+            self.pending.setdefault(amenity_id, []).append(position)
+        self.amenities[key] = amenity_ids
+
+    def remove(self, key):
+        """removes a Place
+        Args:
+            key: storage key of the Place
+        """
+        position = self.positions.pop(key, None)
+        if position is None:
+            return
+        for amenity_id in self.amenities.pop(key, ()):
+            self.__clear_bit(amenity_id, position)
+        self.keys[position] = None
+        self.free.append(position)
+
+    def __clear_bit(self, amenity_id, position):
+        """unsets the bit of a position in the bitmap of an amenity
+        """
+        self.flush((amenity_id,))
+        self.bitmaps[amenity_id] &= ~(1 << position)
+
+    def flush(self, amenity_ids=None):
+        """applies the pending positions to the bitmaps
+        Args:
+            amenity_ids: amenities to flush, all of them when None
+        """
+        if amenity_ids is None:
+            amenity_ids = list(self.pending)
+        for amenity_id in amenity_ids:
+            positions = self.pending.pop(amenity_id, None)
+            if not positions:
+                continue
+            bits = bytearray(max(positions) // 8 + 1)
+            for position in positions:
+                bits[position >> 3] |= 1 << (position & 7)
+            self.bitmaps[amenity_id] = (self.bitmaps.get(amenity_id, 0)
+                                        | int.from_bytes(bits, "little"))
+
+    def having_all(self, amenity_ids):
+        """returns the keys of the Places having every given amenity
+        Args:
+            amenity_ids: ids of the amenities
+        Return:
+            returns a sorted list of Place keys
+        """
+        amenity_ids = list(amenity_ids)
+        if not amenity_ids:
+            return sorted(self.positions)
+        self.flush(amenity_ids)
+        bits = -1
+        for amenity_id in amenity_ids:
+            bits &= self.bitmaps.get(amenity_id, 0)
+            if not bits:
+                return []
+        # find the set bits at C speed in the binary string of the int
+        digits = bin(bits)
+        last = len(digits) - 1
+        keys = self.keys
+        found = []
+        index = digits.find("1", 2)
+        while index != -1:
+            found.append(keys[last - index])
+            index = digits.find("1", index + 1)
+        found.sort()
+        return found
@@ -0,0 +1,223 @@
+#!/usr/bin/python3
+"""Read-through cache in front of a storage engine"""
+import threading
+from collections import OrderedDict
+from time import monotonic
+
+STALE = object()
+
+
+class CachedStorage:
+    """Storage engine wrapper caching all(cls), get() and count(cls)
+    Entries are keyed by class name. They leave the cache when it holds
+    more than size entries (least recently used first), ttl seconds
+    after they were loaded, and on every write: new(), delete() and
+    bulk_new() drop the entries of the class of the objects (and the
+    entries preloading relationships), save() and bulk_save() drop
+    everything. Anything else goes straight to the engine.
+    The cache keeps what the detach() of the engine returns, copies
+    belonging to no Session in DB mode, so the entries outlive the
+    close() of the teardown_appcontext hooks, and hands out what its
+    current() returns, the reloaded objects in file mode and the copies
+    added to the Session of the calling thread in DB mode.
+    Attributes:
+        hits: lookups answered by the cache
+        misses: lookups sent to the engine
+        evictions: entries dropped by the size bound or the ttl
+    """
+
+    def __init__(self, storage, size=1024, ttl=60):
+        """wraps a storage engine
+        Args:
+            storage: the FileStorage or DBStorage
+            size: maximum number of entries
+            ttl: lifetime of an entry, in seconds
+        """
+        self.__storage = storage
+        self.__size = size
+        self.__ttl = ttl
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__generation = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def __getattr__(self, name):
+        """everything not cached is the engine's"""
+        return getattr(self.__storage, name)
+
+    def all(self, cls=None, preload=None):
+        """returns a dictionary, cached when cls is given
+        Args:
+            cls: optional class (or class name) to filter on
+            preload: loading plan of DBStorage.all
+        Return:
+            returns a dictionary of __object
+        """
+        if not cls:
+            return self.__storage.all(cls, preload)
+        plan = None
+        if preload:
+            plan = tuple(getattr(entry, "__name__", entry)
+                         for entry in preload)
+        return self.__read((self.__name(cls), "all", plan),
+                           lambda: self.__storage.all(cls, preload),
+                           self.__current_all)
+
+    def get(self, cls, id):
+        """returns one object from its class and id, cached
+        Args:
+            cls: class (or class name) of the object
+            id: id of the object
+        Return:
+            returns the object, or None if there is no such object
+        """
+        return self.__read((self.__name(cls), "get", id),
+                           lambda: self.__storage.get(cls, id),
+                           self.__current_one)
+
+    def count(self, cls=None):
+        """returns the number of objects, cached
+        Args:
+            cls: optional class (or class name) to count
+        Return:
+            returns the number of objects of cls, or of all the objects
+        """
+        return self.__read((self.__name(cls), "count", None),
+                           lambda: self.__storage.count(cls),
+                           lambda count: count)
+
+    def new(self, obj):
+        """adds an object and drops the entries of its class
+        Args:
+            obj: given object
+        """
+        self.__storage.new(obj)
+        self.invalidate(type(obj).__name__)
+
+    def delete(self, obj=None):
+        """deletes an object and drops the entries of its class
+        Args:
+            obj: given object
+        """
+        self.__storage.delete(obj)
+        if obj is not None:
+            self.invalidate(type(obj).__name__)
+
+    def save(self):
+        """saves the changes and empties the cache
+        """
+        self.__storage.save()
+        self.invalidate()
+
+    def bulk_new(self, objects):
+        """adds many objects and drops the entries of their classes
+        Args:
+            objects: iterable of objects
+        Return:
+            returns the number of objects added
+        """
+        objects = list(objects)
+        count = self.__storage.bulk_new(objects)
+        for name in {type(obj).__name__ for obj in objects}:
+            self.invalidate(name)
+        return count
+
+    def bulk_save(self):
+        """saves the objects of bulk_new() and empties the cache
+        """
+        self.__storage.bulk_save()
+        self.invalidate()
+
+    def invalidate(self, name=None):
+        """drops entries, the ones of a class and the ones preloading
+        relationships (which may hold objects of that class), or all
+        Args:
+            name: optional class name
+        """
+        with self.__lock:
+            self.__generation += 1
+            if name is None:
+                self.__entries.clear()
+                return
+            for key in [key for key in self.__entries
+                        if key[0] in (name, None) or
+                        (key[1] == "all" and key[2])]:
+                del self.__entries[key]
+
+    def stats(self):
+        """returns the counters and the number of entries
+        """
+        with self.__lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions,
+                    "entries": len(self.__entries)}
+
+    def __read(self, key, load, current):
+        """returns a cached value, loading it on a miss
+        Args:
+            key: (class name, method, argument) key of the entry
+            load: function returning the value from the engine
+            current: function returning a cached value as handed to the
+                caller, or STALE if it can not be used any more
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] <= monotonic():
+                del self.__entries[key]
+                self.evictions += 1
+                entry = None
+            if entry is not None:
+                self.__entries.move_to_end(key)
+            generation = self.__generation
+        if entry is not None:
+            value = current(entry[1])
+            if value is not STALE:
+                with self.__lock:
+                    self.hits += 1
+                return value
+        value = load()
+        cached = self.__detach(value)
+        with self.__lock:
+            self.misses += 1
+            # a write in between may have made the value stale already
+            if generation == self.__generation:
+                self.__entries[key] = (monotonic() + self.__ttl, cached)
+                self.__entries.move_to_end(key)
+                while len(self.__entries) > self.__size:
+                    self.__entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def __detach(self, value):
+        """returns what to keep of a value loaded by the engine"""
+        if type(value) is dict:
+            copies = {}
+            return {key: self.__storage.detach(obj, copies)
+                    for key, obj in value.items()}
+        if value is None or type(value) is int:
+            return value
+        return self.__storage.detach(value)
+
+    def __current_all(self, objects):
+        """returns the objects of a cached all() to hand out"""
+        current = {}
+        for key, obj in objects.items():
+            obj = self.__storage.current(obj)
+            if obj is None:
+                return STALE
+            current[key] = obj
+        return current
+
+    def __current_one(self, obj):
+        """returns the object of a cached get() to hand out"""
+        if obj is None:
+            return None
+        obj = self.__storage.current(obj)
+        return STALE if obj is None else obj
+
+    @staticmethod
+    def __name(cls):
+        """returns the name of a class, None stays None"""
+        if cls is None or type(cls) is str:
+            return cls
+        return cls.__name__
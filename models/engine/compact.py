@@ -0,0 +1,196 @@
+#!/usr/bin/python3
+"""This module builds slotted, memory-compact stand-ins for the models,
+used by FileStorage in compact mode"""
+from datetime import datetime
+import uuid
+import models
+from models.base_model import BaseModel
+
+_compact = {}
+
+
+class CompactRecord:
+    """This class is the base of the compact stand-ins. Columns live in
+    slots, other attributes in an optional dictionary.
+    Class attributes:
+        columns: names of the columns, one slot each
+        defaults: values of unset non-column attributes
+    Attributes:
+        _extra: attributes that are not columns, None until one is set
+    """
+    __slots__ = ("_extra",)
+    columns = ()
+    defaults = {}
+
+    def __init__(self, *args, **kwargs):
+        """Instantiation of a compact record
+        Args:
+            args: it won't be used
+            kwargs: attributes, as given to the model
+        """
+        self._extra = None
+        for key, value in kwargs.items():
+            if key == "created_at" or key == "updated_at":
+                value = datetime.fromisoformat(value)
+            if key != "__class__":
+                self.__set(key, value)
+        if "id" not in kwargs:
+            self.__set("id", str(uuid.uuid4()))
+        if "created_at" not in kwargs:
+            self.__set("created_at", datetime.now())
+        if "updated_at" not in kwargs:
+            self.__set("updated_at", datetime.now())
+
+    @classmethod
+    def from_dicts(cls, dicts):
+        """builds many records from to_dict() dictionaries in one call
+        Args:
+            dicts: iterable of dictionaries as returned by to_dict()
+        Return:
+            returns the list of records
+        """
+        parse = datetime.fromisoformat
+        columns = cls.columns
+        objs = []
+        for value in dicts:
+            if ("id" not in value or "created_at" not in value
+                    or "updated_at" not in value):
+                objs.append(cls(**value))
+                continue
+            obj = cls.__new__(cls)
+            extra = None
+            for key, item in value.items():
+                if key in columns:
+                    object.__setattr__(obj, key, item)
+                elif key != "__class__":
+                    if extra is None:
+                        extra = {}
+                    extra[key] = item
+            object.__setattr__(obj, "_extra", extra)
+            object.__setattr__(obj, "created_at", parse(value["created_at"]))
+            object.__setattr__(obj, "updated_at", parse(value["updated_at"]))
+            objs.append(obj)
+        return objs
+
+    def __set(self, name, value):
+        """stores an attribute without telling the storage
+        """
+        if name in self.columns or hasattr(type(self), name):
+            object.__setattr__(self, name, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[name] = value
+
+    def __setattr__(self, name, value):
+        """sets an attribute and tells the storage the object changed
+        Args:
+            name: name of the attribute
+            value: new value
+        """
+        if name == "_extra":
+            object.__setattr__(self, name, value)
+            return
+        self.__set(name, value)
+        models.storage.touch(self)
+
+    def __getattr__(self, name):
+        """returns the attributes not found in the slots: unset columns
+        are None like on the models, then come the extra attributes and
+        the defaults; a list or dictionary default is copied into the
+        extra attributes of the record, so records never share it
+        """
+        if name in self.columns:
+            return None
+        extra = object.__getattribute__(self, "_extra")
+        if extra is not None and name in extra:
+            return extra[name]
+        if name in self.defaults:
+            value = self.defaults[name]
+            if type(value) is list or type(value) is dict:
+                value = value.copy()
+                self.__set(name, value)
+            return value
+        raise AttributeError("'{}' object has no attribute '{}'"
+                             .format(type(self).__name__, name))
+
+    def attributes(self):
+        """returns a dictionary of the attributes set on the record,
+        the counterpart of a model's __dict__
+        """
+        attrs = {}
+        for name in self.columns:
+            try:
+                attrs[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        if self._extra:
+            attrs.update(self._extra)
+        return attrs
+
+    def __str__(self):
+        """returns a string
+        Return:
+            returns a string of class name, id, and dictionary
+        """
+        return "[{}] ({}) {}".format(
+            type(self).__name__, self.id, self.attributes())
+
+    def __repr__(self):
+        """return a string representaion
+        """
+        return self.__str__()
+
+    def save(self):
+        """updates the public instance attribute updated_at to current
+        """
+        self.updated_at = datetime.now()
+        models.storage.new(self)
+        models.storage.save()
+
+    def to_dict(self):
+        """creates dictionary of the class  and returns
+        Return:
+            returns a dictionary of all the key values of the record
+        """
+        my_dict = self.attributes()
+        my_dict["__class__"] = type(self).__name__
+        my_dict["created_at"] = self.created_at.isoformat()
+        my_dict["updated_at"] = self.updated_at.isoformat()
+        return my_dict
+
+    def delete(self):
+        """ delete object
+        """
+        models.storage.delete(self)
+
+
+def compact_class(model):
+    """returns the compact stand-in of a model class
+    It is named after the model and keeps its columns (as slots), its
+    properties and its plain class attributes (as defaults).
+    Args:
+        model: BaseModel or one of its subclasses
+    """
+    if model in _compact:
+        return _compact[model]
+    table = getattr(model, "__table__", None)
+    if table is not None:
+        columns = tuple(column.name for column in table.columns)
+    else:
+        columns = ("id", "created_at", "updated_at")
+    namespace = {"__slots__": columns, "__module__": model.__module__,
+                 "__doc__": model.__doc__, "columns": frozenset(columns),
+                 "defaults": {}}
+    for klass in reversed(model.__mro__):
+        if not issubclass(klass, BaseModel):
+            continue
+        for name, value in vars(klass).items():
+            if name.startswith("_") or name in columns:
+                continue
+            if isinstance(value, property):
+                namespace[name] = value
+            elif isinstance(value, (str, int, float, list, dict, tuple)):
+                namespace["defaults"][name] = value
+    _compact[model] = type(model.__name__, (CompactRecord,), namespace)
+    return _compact[model]
@@ -1,84 +1,455 @@
 #!/usr/bin/python3
 """ new class for sqlAlchemy """
 from os import getenv
-from sqlalchemy.orm import sessionmaker, scoped_session
-from sqlalchemy import (create_engine)
+from time import time
+from sqlalchemy.orm import (sessionmaker, scoped_session, joinedload,
+                            selectinload, make_transient_to_detached)
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import (create_engine, func, inspect, and_, or_)
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.declarative import declarative_base
 from models.base_model import Base
 from models.state import State
 from models.city import City
 from models.user import User
-from models.place import Place
+from models.place import Place, place_amenity
 from models.review import Review
 from models.amenity import Amenity
+from models.engine.geo import bounding_boxes, rank
+
+classes = {"State": State, "City": City, "User": User, "Place": Place,
+           "Review": Review, "Amenity": Amenity}
 
 
 class DBStorage:
-    """ create tables in environmental"""
+    """ create tables in environmental
+    Attributes:
+        __engine: the Engine and its connection pool
+        __session: scoped_session registry, handing each thread its own
+            Session until close() removes it
+        version: number bumped by every write of this process
+        modified: time of the last write, in seconds since the epoch
+    """
     __engine = None
     __session = None
+    version = 0
+    modified = time()
 
     def __init__(self):
+        """connects to HBNB_DB_URL, or to the HBNB_MYSQL_* database
+        The connection pool is tuned by HBNB_DB_POOL_SIZE,
+        HBNB_DB_MAX_OVERFLOW, HBNB_DB_POOL_RECYCLE (seconds) and
+        HBNB_DB_POOL_TIMEOUT (seconds), the SQLAlchemy defaults are kept
+        for the ones that are not set
+        """
         user = getenv("HBNB_MYSQL_USER")
         passwd = getenv("HBNB_MYSQL_PWD")
         db = getenv("HBNB_MYSQL_DB")
         host = getenv("HBNB_MYSQL_HOST")
         env = getenv("HBNB_ENV")
+        url = getenv("HBNB_DB_URL")
 
-        self.__engine = create_engine('mysql+mysqldb://{}:{}@{}/{}'
-                                      .format(user, passwd, host, db),
-                                      pool_pre_ping=True)
+        if url is None:
+            url = ('mysql+mysqldb://{}:{}@{}/{}'
+                   .format(user, passwd, host, db))
+        pool = {}
+        for option, name in (("pool_size", "HBNB_DB_POOL_SIZE"),
+                             ("max_overflow", "HBNB_DB_MAX_OVERFLOW"),
+                             ("pool_recycle", "HBNB_DB_POOL_RECYCLE"),
+                             ("pool_timeout", "HBNB_DB_POOL_TIMEOUT")):
+            if getenv(name):
+                pool[option] = int(getenv(name))
+        self.__engine = create_engine(url, pool_pre_ping=True, **pool)
 
         if env == "test":
             Base.metadata.drop_all(self.__engine)
 
-    def all(self, cls=None):
+    def all(self, cls=None, preload=None):
         """returns a dictionary
+        Args:
+            cls: optional class (or class name) to filter on
+            preload: optional loading plan, the relationships to fetch
+                together with the objects instead of one SELECT per
+                object, e.g. ["cities"], ["cities.places"] or [City]
         Return:
             returns a dictionary of __object
         """
         dic = {}
         if cls:
             if type(cls) is str:
-                cls = eval(cls)
-            query = self.__session.query(cls)
+                cls = classes[cls]
+            lista = [cls]
+        else:
+            lista = classes.values()
+        for clase in lista:
+            query = self.__session.query(clase)
+            if preload:
+                query = query.options(*self.__plan(clase, preload))
             for elem in query:
                 key = "{}.{}".format(type(elem).__name__, elem.id)
                 dic[key] = elem
-        else:
-            lista = [State, City, User, Place, Review, Amenity]
-            for clase in lista:
-                query = self.__session.query(clase)
-                for elem in query:
-                    key = "{}.{}".format(type(elem).__name__, elem.id)
-                    dic[key] = elem
         return (dic)
 
+    def get(self, cls, id):
+        """returns one object from its class and id, with a primary key
+        lookup (no query when the object is already in the session)
+        Args:
+            cls: class (or class name) of the object
+            id: id of the object
+        Return:
+            returns the object, or None if there is no such object
+        """
+        if type(cls) is str:
+            cls = classes.get(cls)
+        if cls not in classes.values() or id is None:
+            return None
+        return self.__session.get(cls, id)
+
+    def count(self, cls=None):
+        """returns the number of rows, with SELECT COUNT(*)
+        Args:
+            cls: optional class (or class name) to count
+        Return:
+            returns the number of objects of cls, or of all the objects
+        """
+        if cls:
+            if type(cls) is str:
+                cls = classes.get(cls)
+            lista = [cls] if cls in classes.values() else []
+        else:
+            lista = classes.values()
+        return sum(self.__session.query(func.count(clase.id)).scalar()
+                   for clase in lista)
+
+    def stream(self, cls=None):
+        """iterates over the objects, or the objects of a class, class by
+        class in id order, fetching them 1000 at a time with iter_all()
+        Args:
+            cls: optional class (or class name) to filter on
+        Return:
+            returns an iterator over the objects, none for a class that
+            has no table (BaseModel)
+        """
+        if cls:
+            if type(cls) is str:
+                cls = classes.get(cls)
+            lista = [cls] if cls in classes.values() else []
+        else:
+            lista = classes.values()
+        for clase in lista:
+            yield from self.iter_all(clase)
+
+    def iter_all(self, cls, order_by="id", after=None, limit=None):
+        """iterates over the objects of a class in order, one page at a
+        time (keyset pagination)
+        The rows are streamed from a server side cursor, 1000 at a time,
+        and pages start with a WHERE on the sort key instead of OFFSET.
+        Args:
+            cls: class (or class name) to list
+            order_by: column to sort on, ties are broken on id and NULL
+                comes first
+            after: id of the last object of the previous page
+            limit: maximum number of objects, None for no limit
+        Return:
+            returns an iterator over the objects
+        """
+        if type(cls) is str:
+            cls = classes[cls]
+        column = getattr(cls, order_by)
+        query = self.__session.query(cls)
+        if after is not None:
+            if order_by == "id":
+                query = query.filter(cls.id > after)
+            else:
+                last = self.get(cls, after)
+                if last is None:
+                    raise ValueError("no object {}.{}"
+                                     .format(cls.__name__, after))
+                value = getattr(last, order_by)
+                if value is None:
+                    query = query.filter(or_(column.isnot(None),
+                                             and_(column.is_(None),
+                                                  cls.id > after)))
+                else:
+                    query = query.filter(or_(column > value,
+                                             and_(column == value,
+                                                  cls.id > after)))
+        if order_by == "id":
+            query = query.order_by(cls.id)
+        else:
+            query = query.order_by(column, cls.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return iter(query.yield_per(1000))
+
+    @staticmethod
+    def __plan(cls, preload):
+        """builds the loader options of a loading plan
+        Collections are loaded with one extra SELECT ... IN per level,
+        many-to-one relationships are joined to the main query. Entries
+        that do not apply to cls are ignored, so the same plan can be
+        used for all the classes.
+        Args:
+            cls: class being queried
+            preload: relationship paths (dotted names) or related classes
+        Return:
+            returns a list of loader options
+        """
+        options = []
+        for entry in preload:
+            if type(entry) is str:
+                names = entry.split(".")
+            else:
+                names = [rel.key for rel in inspect(cls).relationships
+                         if rel.mapper.class_ is entry]
+                if len(names) != 1:
+                    continue
+            option = None
+            current = cls
+            for name in names:
+                rel = inspect(current).relationships.get(name)
+                if rel is None:
+                    option = None
+                    break
+                attr = getattr(current, name)
+                load = selectinload if rel.uselist else joinedload
+                if option is None:
+                    option = load(attr)
+                else:
+                    option = getattr(option, load.__name__)(attr)
+                current = rel.mapper.class_
+            if option is not None:
+                options.append(option)
+        return options
+
+    def nearby(self, latitude, longitude, radius_km, limit=None):
+        """returns the Places within radius_km of a point
+        The bounding box of the circle (two across the antimeridian) is
+        looked up through the latitude/longitude index, the distances are
+        checked in Python.
+        Args:
+            latitude: latitude of the point
+            longitude: longitude of the point
+            radius_km: search radius, in km
+            limit: maximum number of Places
+        Return:
+            returns a list of Place objects sorted by distance, then id
+        """
+        boxes = [and_(Place.latitude.between(min_lat, max_lat),
+                      Place.longitude.between(min_lon, max_lon))
+                 for min_lat, min_lon, max_lat, max_lon
+                 in bounding_boxes(latitude, longitude, radius_km)]
+        places = {place.id: place for place in self.__session.query(Place)
+                  .filter(or_(*boxes))}
+        found = rank(((place.id, place.latitude, place.longitude)
+                      for place in places.values()),
+                     latitude, longitude, radius_km, limit)
+        return [places[_id] for _, _id in found]
+
+    def within_box(self, min_lat, min_lon, max_lat, max_lon):
+        """returns the Places inside a latitude/longitude box
+        Return:
+            returns a list of Place objects sorted by id
+        """
+        return (self.__session.query(Place)
+                .filter(Place.latitude.between(min_lat, max_lat),
+                        Place.longitude.between(min_lon, max_lon))
+                .order_by(Place.id).all())
+
+    def filter_places(self, city_ids=None, min_price=None, max_price=None,
+                      min_rooms=None, min_guests=None, amenity_ids=None):
+        """returns the Places matching every given predicate, with a
+        single query (the amenities as in places_with_amenities)
+        Args:
+            city_ids: ids of the cities the Place may be in
+            min_price: lowest price_by_night
+            max_price: highest price_by_night
+            min_rooms: lowest number_rooms
+            min_guests: lowest max_guest
+            amenity_ids: ids of amenities the Place must all have
+        Return:
+            returns a list of Place objects sorted by id
+        """
+        query = self.__session.query(Place)
+        if city_ids is not None:
+            query = query.filter(Place.city_id.in_(set(city_ids)))
+        if min_price is not None:
+            query = query.filter(Place.price_by_night >= min_price)
+        if max_price is not None:
+            query = query.filter(Place.price_by_night <= max_price)
+        if min_rooms is not None:
+            query = query.filter(Place.number_rooms >= min_rooms)
+        if min_guests is not None:
+            query = query.filter(Place.max_guest >= min_guests)
+        if amenity_ids is not None:
+            query = self.__having(query, amenity_ids)
+        return query.order_by(Place.id).all()
+
+    def places_with_amenities(self, amenity_ids):
+        """returns the Places having every given amenity, with a single
+        grouped query over place_amenity
+        Args:
+            amenity_ids: ids of the amenities
+        Return:
+            returns a list of Place objects sorted by id
+        """
+        query = self.__having(self.__session.query(Place), amenity_ids)
+        return query.order_by(Place.id).all()
+
+    def __having(self, query, amenity_ids):
+        """restricts a query of Places to those having every given
+        amenity
+        Args:
+            query: query of Places
+            amenity_ids: ids of the amenities
+        Return:
+            returns the query
+        """
+        amenity_ids = set(amenity_ids)
+        if amenity_ids:
+            matches = (self.__session.query(place_amenity.c.place_id)
+                       .filter(place_amenity.c.amenity_id.in_(amenity_ids))
+                       .group_by(place_amenity.c.place_id)
+                       .having(func.count() == len(amenity_ids)))
+            query = query.filter(Place.id.in_(matches))
+        return query
+
     def new(self, obj):
         """add a new element in the table
+        An object of no Session any more (closed, or copied by detach())
+        is merged into the current one, which may hold the same row
         """
-        self.__session.add(obj)
+        if inspect(obj).detached:
+            self.__session.merge(obj)
+        else:
+            self.__session.add(obj)
+        self.__changed()
+
+    def bulk_new(self, objects):
+        """inserts many objects with one executemany INSERT per table,
+        in the current transaction, without going through the unit of
+        work: the objects are not attached to the session and their
+        relationships (e.g. Place.amenities) are not saved
+        Args:
+            objects: iterable of objects, parents before their children
+        Return:
+            returns the number of objects inserted
+        """
+        rows = {}
+        for obj in objects:
+            rows.setdefault(type(obj), []).append(obj.__dict__)
+        tables = Base.metadata.sorted_tables
+        for cls in sorted(rows, key=lambda cls: tables.index(cls.__table__)):
+            columns = [attr.key for attr in inspect(cls).column_attrs]
+            self.__session.bulk_insert_mappings(
+                cls, [{key: row[key] for key in columns if key in row}
+                      for row in rows[cls]])
+        self.__changed()
+        return sum(len(group) for group in rows.values())
+
+    def bulk_save(self):
+        """commits the objects inserted by bulk_new()
+        """
+        self.__session.commit()
+        self.__changed()
+
+    def detach(self, obj, copies=None):
+        """returns a copy of an object, and of the relationships loaded
+        with it, that belongs to no Session: what a cache can keep and
+        hand out after close(). The copy reads like a loaded object and
+        is saved as an UPDATE once given back to new()
+        Args:
+            obj: the object
+            copies: copies made so far, by id of the original
+        Return:
+            returns the copy
+        """
+        if copies is None:
+            copies = {}
+        if obj is None or id(obj) in copies:
+            return copies.get(id(obj))
+        mapper = inspect(type(obj))
+        copy = mapper.class_manager.new_instance()
+        copies[id(obj)] = copy
+        values = obj.__dict__
+        copy.__dict__.update({attr.key: values[attr.key]
+                              for attr in mapper.column_attrs
+                              if attr.key in values})
+        make_transient_to_detached(copy)
+        for rel in mapper.relationships:
+            if rel.key in values:
+                value = values[rel.key]
+                if rel.uselist:
+                    value = [self.detach(child, copies) for child in value]
+                else:
+                    value = self.detach(value, copies)
+                set_committed_value(copy, rel.key, value)
+        return copy
+
+    def current(self, obj):
+        """returns the object to hand out for one kept by detach(), in
+        the Session of the calling thread so that the relationships not
+        loaded with the copy load on access: the object the Session
+        already has, else the copy itself added to it (close() detaches
+        it again), or, while the Session of another thread holds the
+        copy, a copy merged without a query
+        Args:
+            obj: the detached copy
+        Return:
+            returns the object of the Session, or None if a rollback
+            expired the copy while it was in a Session
+        """
+        session = self.__session()
+        state = inspect(obj)
+        found = session.identity_map.get(state.key)
+        if found is not None:
+            return found
+        if state.expired_attributes:
+            return None
+        if state.session_id is None:
+            try:
+                session.add(obj)
+                return obj
+            except InvalidRequestError:
+                pass
+        return session.merge(obj, load=False)
+
+    def touch(self, obj):
+        """nothing to do, the session tracks attribute changes itself
+        """
+        pass
 
     def save(self):
         """save changes
         """
         self.__session.commit()
+        self.__changed()
+
+    def __changed(self):
+        """bumps version and modified after a write
+        """
+        self.version += 1
+        self.modified = time()
 
     def delete(self, obj=None):
         """delete an element in the table
         """
         if obj:
-            self.session.delete(obj)
+            if inspect(obj).detached:
+                obj = self.__session.merge(obj)
+            self.__session.delete(obj)
+            self.__changed()
 
     def reload(self):
         """configuration
         """
         Base.metadata.create_all(self.__engine)
         sec = sessionmaker(bind=self.__engine, expire_on_commit=False)
-        Session = scoped_session(sec)
-        self.__session = Session()
+        self.__session = scoped_session(sec)
 
     def close(self):
-        """ calls remove()
+        """ calls remove(): closes the Session of the calling thread (the
+        end of a request) and gives its connection back to the pool, the
+        next call of that thread starts a new Session
         """
-        self.__session.close()
+        self.__session.remove()
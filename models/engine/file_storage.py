@@ -1,14 +1,24 @@
 #!/usr/bin/python3
 """This is the file storage class for AirBnB"""
 import json
-from models.base_model import BaseModel
-from models.user import User
-from models.state import State
-from models.city import City
-from models.amenity import Amenity
-from models.place import Place
-from models.review import Review
-import shlex
+import os
+from bisect import bisect_right
+from contextlib import contextmanager
+from datetime import datetime
+from os import getenv
+from time import time
+from models import classes
+from models.engine.journal import Journal
+from models.engine.json_stream import iter_items
+from models.engine.lazy_objects import Deferred, LazyObjects
+from models.engine.compact import compact_class
+from models.engine import place_table
+from models.engine.geo import GeoIndex
+from models.engine.amenity_index import AmenityIndex
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 
 class FileStorage:
@@ -16,28 +26,279 @@ class FileStorage:
     deserializes JSON file to instances
     Attributes:
         __file_path: path to the JSON file
-        __objects: objects will be stored
+        __objects: objects will be stored, a LazyObjects in lazy mode
+        __by_class: objects of __objects bucketed by class name, kept
+            in step with __objects by new(), delete() and reload()
+        __by_fk: reverse foreign key indexes, (class name, column) ->
+            foreign key value -> objects holding that value
+        __fk_values: foreign key values each object was indexed under
+        __fk_columns: foreign key columns of each class, by class name
+        __journal: Journal logging the mutations between two snapshots
+            of __file_path, None to rewrite the whole file on save()
+        __journal_limit: journal records that trigger a compaction
+        __pending: keys changed since the last save(), with their
+            object or None once deleted
+        __fragments: '"key": {...}' JSON text of each object as of its
+            last serialization, dropped whenever the object changes
+        __classes: classes reloaded objects are built with, by name,
+            models.classes unless compact, imported on first use
+        __places: PlaceTable of the stored Places, None without NumPy
+        __geo: GeoIndex of the stored Places, by key
+        __amenities: AmenityIndex of the stored Places, by key
+        __sorted: sorted (rank, key) lists of the iter_all() orders, by
+            class name then attribute, dropped whenever the class changes
+        __stamp: path, generation and (inode, mtime, size) of the file
+            and the journal as of the last save() or reload(), None
+            once the objects were rebuilt by hand (__reindex())
+        version: number bumped by every change of the objects, written
+            here or reloaded from a file another process changed
+        modified: time of the last change, in seconds since the epoch
     """
     __file_path = "file.json"
     __objects = {}
+    __by_class = {}
+    __by_fk = {}
+    __fk_values = {}
+    __fk_columns = {}
+    __journal = None
+    __journal_limit = 10000
+    __pending = {}
+    __fragments = {}
+    __classes = classes
+    __places = place_table.PlaceTable() if place_table.numpy else None
+    __geo = GeoIndex()
+    __amenities = AmenityIndex()
+    __sorted = {}
+    __stamp = None
+    version = 0
+    modified = time()
 
-    def all(self, cls=None):
+    def __init__(self):
+        """Instantiation of the storage
+        Setting HBNB_FILE_JOURNAL turns on the journaled mode,
+        setting HBNB_FILE_LAZY builds reloaded objects on first access,
+        setting HBNB_FILE_COMPACT reloads objects as compact records
+        """
+        if getenv("HBNB_FILE_JOURNAL"):
+            self.__journal = Journal(self.__file_path + ".journal")
+        if getenv("HBNB_FILE_LAZY"):
+            self.__objects = LazyObjects(self.__build)
+        if getenv("HBNB_FILE_COMPACT"):
+            self.__classes = {name: compact_class(cls)
+                              for name, cls in classes.items()}
+
+    def all(self, cls=None, preload=None):
         """returns a dictionary
+        Args:
+            cls: optional class (or class name) to filter on
+            preload: loading plan of DBStorage.all, ignored here since
+                the relations are read from the in-memory indexes
         Return:
             returns a dictionary of __object
         """
-        dic = {}
         if cls:
-            dictionary = self.__objects
-            for key in dictionary:
-                partition = key.replace('.', ' ')
-                partition = shlex.split(partition)
-                if (partition[0] == cls.__name__):
-                    dic[key] = self.__objects[key]
-            return (dic)
+            if type(cls) is not str:
+                cls = cls.__name__
+            bucket = self.__by_class.get(cls, {})
+            if type(self.__objects) is LazyObjects:
+                return {key: self.__objects[key] for key in list(bucket)}
+            return dict(bucket)
         else:
             return self.__objects
 
+    def get(self, cls, id):
+        """returns one object from its class and id
+        Args:
+            cls: class (or class name) of the object
+            id: id of the object
+        Return:
+            returns the object, or None if there is no such object
+        """
+        if type(cls) is not str:
+            cls = cls.__name__
+        return self.__objects.get("{}.{}".format(cls, id))
+
+    def count(self, cls=None):
+        """returns the number of objects
+        Args:
+            cls: optional class (or class name) to count
+        Return:
+            returns the number of objects of cls, or of all the objects
+        """
+        if cls:
+            if type(cls) is not str:
+                cls = cls.__name__
+            return len(self.__by_class.get(cls, ()))
+        return len(self.__objects)
+
+    def stream(self, cls=None):
+        """iterates over the objects, or the objects of a class, in the
+        order of all(), without copying them into a dictionary
+        In lazy mode the objects not built yet are built for the
+        iteration only and not kept, so they are to be read only.
+        Args:
+            cls: optional class (or class name) to filter on
+        Return:
+            returns an iterator over the objects
+        """
+        if cls:
+            if type(cls) is not str:
+                cls = cls.__name__
+            keys = list(self.__by_class.get(cls, ()))
+        else:
+            keys = list(dict.keys(self.__objects))
+        for key in keys:
+            # dict.get does not build a Deferred object in lazy mode
+            obj = dict.get(self.__objects, key)
+            if type(obj) is Deferred:
+                obj = self.__make(obj.load())
+            if obj is not None:
+                yield obj
+
+    def iter_all(self, cls, order_by="id", after=None, limit=None):
+        """iterates over the objects of a class in order, one page at a
+        time (keyset pagination)
+        A page is a slice of a sorted index of the class, kept until the
+        class changes, so walking a class page by page sorts it once.
+        Args:
+            cls: class (or class name) to list
+            order_by: attribute to sort on, ties are broken on id and
+                None comes first
+            after: id of the last object of the previous page
+            limit: maximum number of objects, None for no limit
+        Return:
+            returns an iterator over the objects
+        """
+        if type(cls) is not str:
+            cls = cls.__name__
+        entries = self.__sorted.setdefault(cls, {}).get(order_by)
+        if entries is None:
+            entries = sorted(self.__rank(key, obj, order_by) for key, obj
+                             in self.__by_class.get(cls, {}).items())
+            self.__sorted[cls][order_by] = entries
+        start = 0
+        if after is not None:
+            key = "{}.{}".format(cls, after)
+            if order_by == "id":
+                cursor = (True, after, key)
+            else:
+                obj = dict.get(self.__objects, key)
+                if obj is None:
+                    raise ValueError("no object {}".format(key))
+                cursor = self.__rank(key, obj, order_by)
+            start = bisect_right(entries, cursor)
+        stop = len(entries)
+        if limit is not None:
+            stop = min(stop, start + limit)
+        return self.__page(entries, start, stop)
+
+    def __page(self, entries, start, stop):
+        """yields the objects of a slice of a sorted index
+        Args:
+            entries: sorted (rank, key) list
+            start: index of the first entry
+            stop: index after the last entry
+        """
+        for i in range(start, stop):
+            obj = self.__objects.get(entries[i][2])
+            if obj is not None:
+                yield obj
+
+    @staticmethod
+    def __rank(key, obj, column):
+        """returns the sort entry of an object
+        Dates are compared as ISO strings, the form they have in the
+        records of Deferred objects.
+        Args:
+            key: key of the object in __objects
+            obj: the object or its Deferred placeholder
+            column: attribute to sort on
+        Return:
+            returns a (not None, value, key) tuple
+        """
+        if type(obj) is Deferred:
+            value = obj.load().get(column)
+        else:
+            value = getattr(obj, column, None)
+        if type(value) is datetime:
+            value = value.isoformat()
+        return (value is not None, value, key)
+
+    def related(self, cls, column, value):
+        """returns the objects of a class pointing to a given row
+        Args:
+            cls: class (or class name) holding the foreign key
+            column: name of the foreign key column, e.g. "state_id"
+            value: id the foreign key must be equal to
+        Return:
+            returns a list of the matching objects
+        """
+        if type(cls) is not str:
+            cls = cls.__name__
+        bucket = self.__by_fk.get((cls, column), {}).get(value, {})
+        if type(self.__objects) is LazyObjects:
+            return [self.__objects[key] for key in list(bucket)]
+        return list(bucket.values())
+
+    def filter_places(self, city_ids=None, min_price=None, max_price=None,
+                      min_rooms=None, min_guests=None, amenity_ids=None):
+        """returns the Places matching every given predicate
+        The predicates are evaluated on the columns of __places and the
+        bitmaps of __amenities, or by a scan of the Places when NumPy is
+        not installed.
+        Args:
+            city_ids: ids of the cities the Place may be in
+            min_price: lowest price_by_night
+            max_price: highest price_by_night
+            min_rooms: lowest number_rooms
+            min_guests: lowest max_guest
+            amenity_ids: ids of amenities the Place must all have
+        Return:
+            returns a list of Place objects
+        """
+        criteria = dict(city_ids=city_ids, min_price=min_price,
+                        max_price=max_price, min_rooms=min_rooms,
+                        min_guests=min_guests)
+        if self.__places is None:
+            return place_table.scan(self.all("Place").values(),
+                                    amenity_ids=amenity_ids, **criteria)
+        keys = self.__places.filter(**criteria)
+        if amenity_ids is not None:
+            having = set(self.__amenities.having_all(amenity_ids))
+            keys = [key for key in keys if key in having]
+        return [self.__objects[key] for key in keys]
+
+    def places_with_amenities(self, amenity_ids):
+        """returns the Places having every given amenity
+        Args:
+            amenity_ids: ids of the amenities
+        Return:
+            returns a list of Place objects sorted by id
+        """
+        return [self.__objects[key]
+                for key in self.__amenities.having_all(amenity_ids)]
+
+    def nearby(self, latitude, longitude, radius_km, limit=None):
+        """returns the Places within radius_km of a point
+        Args:
+            latitude: latitude of the point
+            longitude: longitude of the point
+            radius_km: search radius, in km
+            limit: maximum number of Places
+        Return:
+            returns a list of Place objects sorted by distance, then id
+        """
+        found = self.__geo.nearby(latitude, longitude, radius_km, limit)
+        return [self.__objects[key] for _, key in found]
+
+    def within_box(self, min_lat, min_lon, max_lat, max_lon):
+        """returns the Places inside a latitude/longitude box
+        Return:
+            returns a list of Place objects sorted by id
+        """
+        return [self.__objects[key] for key in
+                self.__geo.within(min_lat, min_lon, max_lat, max_lon)]
+
     def new(self, obj):
         """sets __object to given obj
         Args:
@@ -46,26 +307,357 @@ class FileStorage:
         if obj:
             key = "{}.{}".format(type(obj).__name__, obj.id)
             self.__objects[key] = obj
+            self.__index(key, obj)
+            self.__sorted.pop(type(obj).__name__, None)
+            self.__pending[key] = obj
+            self.__fragments.pop(key, None)
+            self.__changed()
+
+    def bulk_new(self, objects):
+        """adds many objects, to be written by a single bulk_save()
+        Args:
+            objects: iterable of objects
+        Return:
+            returns the number of objects added
+        """
+        count = 0
+        names = set()
+        for obj in objects:
+            key = "{}.{}".format(type(obj).__name__, obj.id)
+            self.__objects[key] = obj
+            self.__index(key, obj)
+            self.__pending[key] = obj
+            self.__fragments.pop(key, None)
+            names.add(type(obj).__name__)
+            count += 1
+        for name in names:
+            self.__sorted.pop(name, None)
+        self.__changed()
+        return count
+
+    def bulk_save(self):
+        """writes the objects added by bulk_new(), in one pass over the
+        objects like save()
+        """
+        self.save()
+
+    def detach(self, obj, copies=None):
+        """returns what a cache can keep of an object, the object itself
+        Args:
+            obj: the object
+            copies: unused, see DBStorage.detach
+        """
+        return obj
+
+    def current(self, obj):
+        """returns the stored object with the key of a kept object, the
+        same object unless reload() replaced it since
+        Args:
+            obj: the object
+        Return:
+            returns the stored object, or None if there is none any more
+        """
+        return self.__objects.get(
+            "{}.{}".format(type(obj).__name__, obj.id))
+
+    def touch(self, obj):
+        """marks a stored object as changed, called by BaseModel on
+        every attribute assignment, and moves it in the indexes
+        Args:
+            obj: the object
+        """
+        key = "{}.{}".format(type(obj).__name__, getattr(obj, "id", None))
+        # dict.get does not build a Deferred object in lazy mode
+        if dict.get(self.__objects, key) is obj:
+            self.__fragments.pop(key, None)
+            self.__pending[key] = obj
+            self.__sorted.pop(type(obj).__name__, None)
+            self.__changed()
+            self.__index(key, obj)
 
     def save(self):
         """serialize the file path to JSON file path
+        The file is locked, and first read again if another process
+        saved it since this one last read or wrote it, so that the
+        objects others saved are kept next to the changes made here. In
+        journaled mode only the pending changes are appended to the
+        journal, which is folded back into the file once it holds
+        __journal_limit records.
+        """
+        with self.__locked(True) as lock:
+            self.__merge(lock)
+            journal = self.__journal
+            if journal is None:
+                self.__pending.clear()
+                self.__dump(self.__file_path)
+            elif (journal.records + len(self.__pending) >=
+                  self.__journal_limit or
+                  not os.path.exists(self.__file_path)):
+                self.__compact()
+            else:
+                journal.repair()
+                journal.append((key, None if obj is None else obj.to_dict())
+                               for key, obj in self.__pending.items())
+                self.__pending.clear()
+            self.__bump(lock)
+            self.__stamp = self.__files(lock)
+
+    def compact(self):
+        """folds the journal into a new snapshot of __file_path, with
+        the file locked as in save()
+        """
+        with self.__locked(True) as lock:
+            self.__merge(lock)
+            self.__compact()
+            self.__bump(lock)
+            self.__stamp = self.__files(lock)
+
+    def __compact(self):
+        """writes the snapshot of compact()
+        The snapshot replaces the file atomically before the journal is
+        emptied, so replaying a journal left over by a crash in between
+        only rewrites records the snapshot already holds.
+        """
+        self.__pending.clear()
+        self.__dump(self.__file_path)
+        if self.__journal is not None:
+            self.__journal.truncate()
+
+    def __dump(self, path):
+        """writes every object to a JSON file
+        Only the objects changed since their last serialization go
+        through to_dict(), the others reuse their cached fragment, and
+        objects not built yet in lazy mode are copied as read. The file
+        is written next to path then renamed over it, so readers see the
+        old file or the new one, never a part of it.
+        Args:
+            path: path of the file
         """
-        my_dict = {}
-        for key, value in self.__objects.items():
-            my_dict[key] = value.to_dict()
-        with open(self.__file_path, 'w', encoding="UTF-8") as f:
-            json.dump(my_dict, f)
+        fragments = self.__fragments
+        parts = []
+        for key, value in dict.items(self.__objects):
+            fragment = fragments.get(key)
+            if type(value) is Deferred:
+                fragment = "{}: {}".format(json.dumps(key), value.text)
+            elif fragment is None:
+                fragment = "{}: {}".format(json.dumps(key),
+                                           json.dumps(value.to_dict()))
+                fragments[key] = fragment
+            parts.append(fragment)
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        try:
+            with open(tmp_path, 'w', encoding="UTF-8") as f:
+                f.write("{" + ", ".join(parts) + "}")
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
 
     def reload(self):
         """serialize the file path to JSON file path
+        Nothing is read when the file and the journal are as this storage
+        last read or wrote them. Otherwise the objects are replaced by
+        those of the file, read one object at a time with the classes of
+        the classes registry, and the changes not saved yet are applied
+        again. In lazy mode objects are kept as Deferred placeholders
+        until first accessed.
+        """
+        with self.__locked(False) as lock:
+            stamp = self.__files(lock)
+            if stamp == self.__stamp:
+                return
+            self.__read()
+            self.__stamp = stamp
+            self.__changed()
+
+    def __merge(self, lock):
+        """reads the file again before a save if another process saved
+        it since this storage last read or wrote it
+        A file this storage never read (a new __file_path, objects
+        rebuilt by hand) is overwritten as before.
+        Args:
+            lock: file descriptor of the lock file, held exclusively
+        """
+        stamp = self.__stamp
+        if stamp is None or stamp[0] != self.__file_path:
+            return
+        if self.__files(lock) != stamp:
+            self.__read()
+            self.__changed()
+
+    def __read(self):
+        """replaces the objects by those of the file and the journal,
+        then applies again the pending changes
         """
+        objects = self.__objects
+        dict.clear(objects)
+        self.__reindex()
+        lazy = type(objects) is LazyObjects
+        records = []
         try:
             with open(self.__file_path, 'r', encoding="UTF-8") as f:
-                for key, value in (json.load(f)).items():
-                    value = eval(value["__class__"])(**value)
-                    self.__objects[key] = value
+                for key, value, text in iter_items(f):
+                    if lazy:
+                        self.__put(key, Deferred(text), value)
+                    else:
+                        records.append((key, value))
         except FileNotFoundError:
             pass
+        made = self.__make_all(value for key, value in records)
+        for (key, value), obj in zip(records, made):
+            self.__put(key, obj, value)
+        if self.__journal is not None:
+            records = list(self.__journal.replay())
+            made = iter(self.__make_all(value for key, value in records
+                                        if value is not None))
+            for key, value in records:
+                if value is None:
+                    if key in objects:
+                        dict.__delitem__(objects, key)
+                        self.__unindex(key)
+                else:
+                    self.__put(key, next(made), value)
+        for key, obj in self.__pending.items():
+            if obj is None:
+                if key in objects:
+                    dict.__delitem__(objects, key)
+                    self.__unindex(key)
+            else:
+                objects[key] = obj
+                self.__index(key, obj)
+                self.__sorted.pop(key.split('.', 1)[0], None)
+
+    @contextmanager
+    def __locked(self, exclusive):
+        """holds the advisory lock of the file, on <file>.lock, which
+        also keeps the generation of the file (see __bump)
+        Readers go without a lock while no save made the lock file, and
+        everyone does where fcntl is missing (Windows).
+        Args:
+            exclusive: True to write the file, False to read it
+        Return:
+            yields the file descriptor of the lock file, None if there is
+            none
+        """
+        path = self.__file_path + ".lock"
+        binary = getattr(os, "O_BINARY", 0)
+        try:
+            if exclusive:
+                fd = os.open(path, os.O_RDWR | os.O_CREAT | binary, 0o644)
+            else:
+                fd = os.open(path, os.O_RDONLY | binary)
+        except FileNotFoundError:
+            fd = None
+        if fd is None:
+            yield None
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield fd
+        finally:
+            # closing the file releases the lock
+            os.close(fd)
+
+    @staticmethod
+    def __generation(lock):
+        """returns the generation kept in the lock file, 0 if none
+        Args:
+            lock: file descriptor of the lock file, or None
+        """
+        if lock is None:
+            return 0
+        # lseek and read rather than pread, which Windows lacks
+        os.lseek(lock, 0, os.SEEK_SET)
+        try:
+            return int(os.read(lock, 32) or 0)
+        except ValueError:
+            return 0
+
+    def __bump(self, lock):
+        """adds one to the generation of the file after a save, which
+        tells readers the file changed even when its mtime and size did
+        not (two saves within the resolution of the mtime)
+        Args:
+            lock: file descriptor of the lock file, held exclusively
+        """
+        if lock is not None:
+            generation = self.__generation(lock) + 1
+            os.lseek(lock, 0, os.SEEK_SET)
+            os.write(lock, b"%020d\n" % generation)
+
+    def __files(self, lock=None):
+        """returns the path and generation of the file and the (inode,
+        mtime, size) of the file and of the journal
+        Args:
+            lock: file descriptor of the lock file, or None
+        """
+        paths = [self.__file_path]
+        if self.__journal is not None:
+            paths.append(self.__journal.path)
+        stamp = [self.__file_path, self.__generation(lock)]
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                stamp.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def __changed(self):
+        """bumps version and modified after a change of the objects
+        """
+        self.version += 1
+        self.modified = time()
+
+    def __put(self, key, obj, value):
+        """stores a reloaded object
+        Args:
+            key: key of the object
+            obj: the object or its Deferred placeholder
+            value: dictionary of the object
+        """
+        self.__objects[key] = obj
+        self.__fragments.pop(key, None)
+        self.__index(key, obj, value)
+        self.__sorted.pop(key.split('.', 1)[0], None)
+
+    def __make(self, value):
+        """builds an object from its dictionary
+        Args:
+            value: dictionary of the object
+        """
+        return self.__classes[value["__class__"]].from_dicts((value,))[0]
+
+    def __make_all(self, values):
+        """builds objects from their dictionaries, with one from_dicts()
+        call per class
+        Args:
+            values: iterable of dictionaries of objects
+        Return:
+            returns the list of objects, in the order of values
+        """
+        values = list(values)
+        by_class = {}
+        for value in values:
+            by_class.setdefault(value["__class__"], []).append(value)
+        made = {name: iter(self.__classes[name].from_dicts(group))
+                for name, group in by_class.items()}
+        return [next(made[value["__class__"]]) for value in values]
+
+    def __build(self, key, value):
+        """builds a Deferred object of lazy mode in place
+        Args:
+            key: key of the object
+            value: dictionary of the object
+        Return:
+            returns the object
+        """
+        obj = self.__make(value)
+        dict.__setitem__(self.__objects, key, obj)
+        self.__index(key, obj, value)
+        return obj
 
     def delete(self, obj=None):
         """ delete an existing element
@@ -73,9 +665,113 @@ class FileStorage:
         if obj:
             key = "{}.{}".format(type(obj).__name__, obj.id)
             del self.__objects[key]
+            self.__unindex(key)
+            self.__pending[key] = None
+            self.__fragments.pop(key, None)
+            self.__changed()
 
     def close(self):
-        """ calls reload()
+        """ calls reload(), which reads the file again only if another
+        process saved it
         """
         self.reload()
 
+    def __reindex(self):
+        """rebuilds every index from __objects, which no longer holds what
+        the file did: the next reload() reads it again
+        """
+        self.__stamp = None
+        self.__by_class.clear()
+        self.__by_fk.clear()
+        self.__fk_values.clear()
+        self.__fragments.clear()
+        self.__sorted.clear()
+        if self.__places is not None:
+            self.__places.clear()
+        self.__geo.clear()
+        self.__amenities.clear()
+        for key, obj in dict.items(self.__objects):
+            self.__index(key, obj)
+
+    def __index(self, key, obj, record=None):
+        """adds (or moves) an object in the indexes
+        Args:
+            key: key of the object in __objects
+            obj: the object or its Deferred placeholder
+            record: dictionary of the object, if already at hand
+        """
+        name = key.split('.', 1)[0]
+        self.__by_class.setdefault(name, {})[key] = obj
+        if self.__foreign_keys(name) and record is None and \
+                type(obj) is Deferred:
+            record = obj.load()
+        self.__index_fk(key, obj, record)
+        if name == "Place":
+            if record is not None:
+                get = record.get
+            else:
+                def get(attr):
+                    return getattr(obj, attr, None)
+            if self.__places is not None:
+                self.__places.upsert(key, get)
+            self.__geo.add(key, get("latitude"), get("longitude"))
+            self.__amenities.set(key, get("amenity_ids"))
+
+    def __unindex(self, key):
+        """removes a key from the indexes
+        Args:
+            key: key of the object in __objects
+        """
+        self.__by_class.get(key.split('.', 1)[0], {}).pop(key, None)
+        self.__sorted.pop(key.split('.', 1)[0], None)
+        self.__unindex_fk(key)
+        if self.__places is not None:
+            self.__places.remove(key)
+        self.__geo.remove(key)
+        self.__amenities.remove(key)
+
+    def __index_fk(self, key, obj, record=None):
+        """adds (or moves) an object in the foreign key indexes
+        Args:
+            key: key of the object in __objects
+            obj: the object or its Deferred placeholder
+            record: dictionary of the object, if already at hand
+        """
+        name = key.split('.', 1)[0]
+        self.__unindex_fk(key)
+        values = []
+        for column in self.__foreign_keys(name):
+            if record is not None:
+                value = record.get(column)
+            else:
+                value = getattr(obj, column, None)
+            if value is not None:
+                self.__by_fk.setdefault((name, column), {}) \
+                    .setdefault(value, {})[key] = obj
+                values.append((column, value))
+        if values:
+            self.__fk_values[key] = values
+
+    def __unindex_fk(self, key):
+        """removes a key from the foreign key indexes
+        Args:
+            key: key of the object in __objects
+        """
+        name = key.split('.', 1)[0]
+        for column, value in self.__fk_values.pop(key, ()):
+            objects = self.__by_fk[(name, column)][value]
+            del objects[key]
+            if not objects:
+                del self.__by_fk[(name, column)][value]
+
+    def __foreign_keys(self, name):
+        """returns the foreign key columns declared on a model
+        Args:
+            name: name of the model class
+        """
+        if name not in self.__fk_columns:
+            table = getattr(classes.get(name), "__table__", None)
+            columns = table.columns if table is not None else ()
+            self.__fk_columns[name] = tuple(
+                column.name for column in columns if column.foreign_keys)
+        return self.__fk_columns[name]
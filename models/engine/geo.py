@@ -0,0 +1,187 @@
+#!/usr/bin/python3
+"""This module holds the geometry shared by the storage engines and the
+grid index FileStorage keeps on Place latitude/longitude"""
+from math import asin, cos, floor, radians, sin, sqrt
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.195
+
+
+def coordinates(latitude, longitude):
+    """returns (latitude, longitude) as floats, None when either one is
+    missing, not a number or out of range
+    """
+    try:
+        latitude, longitude = float(latitude), float(longitude)
+    except (TypeError, ValueError):
+        return None
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        return None
+    return latitude, longitude
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """returns the great-circle distance between two points, in km
+    """
+    lat1, lon1, lat2, lon2 = map(radians, (lat1, lon1, lat2, lon2))
+    a = (sin((lat2 - lat1) / 2) ** 2
+         + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(a)))
+
+
+def bounding_box(latitude, longitude, radius_km):
+    """returns the (min_lat, min_lon, max_lat, max_lon) box holding every
+    point within radius_km of a point; the longitudes span the whole
+    range near the poles, and are clamped to [-180, 180], see
+    bounding_boxes() for the points across the antimeridian
+    """
+    min_lat, min_lon, max_lat, max_lon = _box(latitude, longitude,
+                                              radius_km)
+    return min_lat, max(-180.0, min_lon), max_lat, min(180.0, max_lon)
+
+
+def bounding_boxes(latitude, longitude, radius_km):
+    """returns the boxes holding every point within radius_km of a point:
+    the box of bounding_box(), or two boxes when it crosses the
+    antimeridian, the part past 180 (or -180) wrapped to the other side
+    """
+    min_lat, min_lon, max_lat, max_lon = _box(latitude, longitude,
+                                              radius_km)
+    if max_lon - min_lon >= 360:
+        return [(min_lat, -180.0, max_lat, 180.0)]
+    if min_lon < -180:
+        return [(min_lat, -180.0, max_lat, max_lon),
+                (min_lat, min_lon + 360, max_lat, 180.0)]
+    if max_lon > 180:
+        return [(min_lat, min_lon, max_lat, 180.0),
+                (min_lat, -180.0, max_lat, max_lon - 360)]
+    return [(min_lat, min_lon, max_lat, max_lon)]
+
+
+def _box(latitude, longitude, radius_km):
+    """returns the box of bounding_box() before the longitudes are
+    clamped
+    """
+    delta = radius_km / KM_PER_DEGREE
+    min_lat = max(-90.0, latitude - delta)
+    max_lat = min(90.0, latitude + delta)
+    widest = max(abs(min_lat), abs(max_lat))
+    if widest >= 89.9:
+        return min_lat, -180.0, max_lat, 180.0
+    delta_lon = delta / cos(radians(widest))
+    return min_lat, longitude - delta_lon, max_lat, longitude + delta_lon
+
+
+def rank(points, latitude, longitude, radius_km, limit=None):
+    """orders candidate points by distance to a point
+    Args:
+        points: iterable of (id, latitude, longitude)
+        latitude: latitude of the center
+        longitude: longitude of the center
+        radius_km: points further away are dropped
+        limit: maximum number of results
+    Return:
+        returns a list of (distance in km, id) sorted by distance then id
+    """
+    found = []
+    for _id, lat, lon in points:
+        distance = haversine(latitude, longitude, lat, lon)
+        if distance <= radius_km:
+            found.append((distance, _id))
+    found.sort()
+    return found if limit is None else found[:limit]
+
+
+class GeoIndex:
+    """This class buckets points in a grid of cells of cell_size degrees
+    Attributes:
+        cell_size: side of a cell, in degrees
+        cells: points of each (row, column) cell, id -> (lat, lon)
+        points: cell and coordinates of each id
+    """
+
+    def __init__(self, cell_size=0.05):
+        """Instantiation of the index
+        Args:
+            cell_size: side of a cell, in degrees
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+        self.points = {}
+
+    def __len__(self):
+        """returns the number of points in the index
+        """
+        return len(self.points)
+
+    def __cell(self, latitude, longitude):
+        """returns the cell holding a point
+        """
+        return (floor(latitude / self.cell_size),
+                floor(longitude / self.cell_size))
+
+    def clear(self):
+        """removes every point
+        """
+        self.cells.clear()
+        self.points.clear()
+
+    def add(self, _id, latitude, longitude):
+        """adds or moves a point, removes it if its coordinates are not
+        usable
+        """
+        self.remove(_id)
+        point = coordinates(latitude, longitude)
+        if point is None:
+            return
+        cell = self.__cell(*point)
+        self.cells.setdefault(cell, {})[_id] = point
+        self.points[_id] = (cell, point)
+
+    def remove(self, _id):
+        """removes a point if present
+        """
+        entry = self.points.pop(_id, None)
+        if entry is not None:
+            cell = self.cells[entry[0]]
+            del cell[_id]
+            if not cell:
+                del self.cells[entry[0]]
+
+    def __candidates(self, min_lat, min_lon, max_lat, max_lon):
+        """yields (id, lat, lon) of the points in the cells overlapping
+        a box, walking whichever is smaller: the cells of the box or the
+        occupied cells
+        """
+        low = self.__cell(min_lat, min_lon)
+        high = self.__cell(max_lat, max_lon)
+        span = (high[0] - low[0] + 1) * (high[1] - low[1] + 1)
+        if span > len(self.cells):
+            cells = (points for cell, points in self.cells.items()
+                     if low[0] <= cell[0] <= high[0]
+                     and low[1] <= cell[1] <= high[1])
+        else:
+            cells = (self.cells.get((row, column), {})
+                     for row in range(low[0], high[0] + 1)
+                     for column in range(low[1], high[1] + 1))
+        for points in cells:
+            for _id, (lat, lon) in points.items():
+                yield _id, lat, lon
+
+    def within(self, min_lat, min_lon, max_lat, max_lon):
+        """returns the ids of the points inside a box, sorted
+        """
+        return sorted(_id for _id, lat, lon in self.__candidates(
+            min_lat, min_lon, max_lat, max_lon)
+            if min_lat <= lat <= max_lat and min_lon <= lon <= max_lon)
+
+    def nearby(self, latitude, longitude, radius_km, limit=None):
+        """returns (distance in km, id) of the points within radius_km of
+        a point, sorted by distance then id
+        """
+        candidates = {}
+        for box in bounding_boxes(latitude, longitude, radius_km):
+            for _id, lat, lon in self.__candidates(*box):
+                candidates[_id] = (_id, lat, lon)
+        return rank(candidates.values(), latitude, longitude, radius_km,
+                    limit)
@@ -0,0 +1,101 @@
+#!/usr/bin/python3
+"""This is the append-only journal used by FileStorage"""
+import json
+import os
+
+
+class Journal:
+    """This class appends object mutations to a log file, one JSON
+    record per line, and replays them
+    Attributes:
+        path: path to the log file
+        records: number of records written since the last truncate
+    """
+
+    def __init__(self, path):
+        """Instantiation of the journal
+        Args:
+            path: path to the log file
+        """
+        self.path = path
+        self.records = 0
+
+    def append(self, changes):
+        """appends one record per change to the log
+        Args:
+            changes: iterable of (key, dictionary) pairs, a dictionary
+                of None records the deletion of key
+        """
+        lines = []
+        for key, value in changes:
+            if value is None:
+                lines.append(json.dumps({"key": key, "deleted": True}))
+            else:
+                lines.append(json.dumps({"key": key, "value": value}))
+        if lines:
+            with open(self.path, 'a', encoding="UTF-8") as f:
+                f.write("\n".join(lines) + "\n")
+            self.records += len(lines)
+
+    def replay(self):
+        """yields the (key, dictionary) pairs recorded in the log
+        A last record cut short by a crash is dropped, empty lines are
+        skipped, any other unreadable record raises ValueError. The file
+        is only read, see repair().
+        """
+        self.records = 0
+        try:
+            with open(self.path, 'r', encoding="UTF-8") as f:
+                lines = f.read().split("\n")
+        except FileNotFoundError:
+            return
+        # a complete log ends with a newline, leaving an empty last item
+        tail = lines.pop()
+        for number, line in enumerate(lines, 1):
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                raise ValueError("{}: corrupt record on line {}"
+                                 .format(self.path, number))
+            self.records += 1
+            yield record["key"], record.get("value")
+        if tail:
+            try:
+                record = json.loads(tail)
+            except ValueError:
+                return
+            self.records += 1
+            yield record["key"], record.get("value")
+
+    def repair(self):
+        """cuts the last record of the log if a crash left it short, or
+        ends it with its newline, so that appends start on a fresh line;
+        to be called with the log locked against other writers and
+        readers
+        """
+        try:
+            with open(self.path, 'rb+') as f:
+                if f.seek(0, os.SEEK_END) == 0:
+                    return
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) == b"\n":
+                    return
+                f.seek(0)
+                data = f.read()
+                start = data.rfind(b"\n") + 1
+                try:
+                    json.loads(data[start:])
+                except ValueError:
+                    f.truncate(start)
+                    return
+                f.write(b"\n")
+        except FileNotFoundError:
+            pass
+
+    def truncate(self):
+        """empties the log
+        """
+        open(self.path, 'w', encoding="UTF-8").close()
+        self.records = 0
@@ -0,0 +1,111 @@
+#!/usr/bin/python3
+"""This module reads the members of a JSON object one at a time"""
+import json
+import re
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r'[ \t\n\r]*')
+
+
+class _Reader:
+    """This class buffers a text file for incremental decoding
+    Attributes:
+        f: the file
+        chunk_size: number of characters read at a time
+        buf: characters read and not yet dropped
+        pos: position of the next character to decode in buf
+        eof: True once the file is exhausted
+    """
+
+    def __init__(self, f, chunk_size):
+        """Instantiation of the reader
+        Args:
+            f: the text file
+            chunk_size: number of characters read at a time
+        """
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """reads one more chunk, returns False at the end of the file
+        """
+        if self.eof:
+            return False
+        if self.pos > self.chunk_size:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf += chunk
+        return True
+
+    def peek(self):
+        """skips whitespace, returns the next character or "" at the end
+        """
+        while True:
+            self.pos = _whitespace.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self.fill():
+                return self.buf[self.pos:self.pos + 1]
+
+    def expect(self, char):
+        """consumes the next non blank character, which must be char
+        """
+        if self.peek() != char:
+            raise json.JSONDecodeError("Expecting '{}'".format(char),
+                                       self.buf, self.pos)
+        self.pos += 1
+
+    def decode(self):
+        """decodes the next JSON value
+        Return:
+            returns the value and its JSON text
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # a number could go on in the next chunk
+            if end < len(self.buf) or not self.fill():
+                break
+        text = self.buf[self.pos:end]
+        self.pos = end
+        return value, text
+
+
+def iter_items(f, chunk_size=1 << 16):
+    """yields the members of the JSON object held in a text file
+    Only one member is decoded at a time, the file is never loaded
+    whole. Malformed input raises json.JSONDecodeError (a ValueError)
+    like json.load().
+    Args:
+        f: the text file
+        chunk_size: number of characters read at a time
+    Return:
+        yields (key, value, JSON text of value) tuples
+    """
+    reader = _Reader(f, chunk_size)
+    if reader.peek() == "":
+        raise json.JSONDecodeError("Expecting value", reader.buf, 0)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key, _ = reader.decode()
+        if type(key) is not str:
+            raise json.JSONDecodeError("Expecting property name",
+                                       reader.buf, reader.pos)
+        reader.expect(":")
+        value, text = reader.decode()
+        yield key, value, text
+        if reader.peek() == "}":
+            return
+        reader.expect(",")
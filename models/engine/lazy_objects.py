@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+"""This module holds the dictionary used by FileStorage in lazy mode"""
+import json
+
+
+class Deferred:
+    """This class stands for a stored object not built yet
+    Attributes:
+        text: JSON text of the object, as read from the file
+    """
+    __slots__ = ("text",)
+
+    def __init__(self, text):
+        """Instantiation of the placeholder
+        Args:
+            text: JSON text of the object
+        """
+        self.text = text
+
+    def load(self):
+        """returns the dictionary of the object
+        """
+        return json.loads(self.text)
+
+
+class LazyObjects(dict):
+    """This class is a dictionary of stored objects whose values may be
+    Deferred placeholders, built into objects on first access
+    Attributes:
+        build: function called with (key, dictionary) to build an object
+    """
+
+    def __init__(self, build):
+        """Instantiation of the dictionary
+        Args:
+            build: function called with (key, dictionary) that returns
+                the object and puts it back in the dictionary
+        """
+        super().__init__()
+        self.build = build
+
+    def __getitem__(self, key):
+        """returns the object of a key, building it if needed
+        """
+        value = super().__getitem__(key)
+        if type(value) is Deferred:
+            value = self.build(key, value.load())
+        return value
+
+    def __iter__(self):
+        """iterates over the keys, overridden so that dict(self) goes
+        through __getitem__
+        """
+        return iter(self.keys())
+
+    def get(self, key, default=None):
+        """returns the object of a key or default
+        """
+        if key in self:
+            return self[key]
+        return default
+
+    def pop(self, key, *default):
+        """removes a key and returns its object
+        """
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return super().pop(key, *default)
+
+    def values(self):
+        """returns the list of objects
+        """
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        """returns the list of (key, object) pairs
+        """
+        return [(key, self[key]) for key in self.keys()]
+
+    def copy(self):
+        """returns a plain dictionary of the objects
+        """
+        return dict(self.items())
@@ -0,0 +1,177 @@
+#!/usr/bin/python3
+"""This module keeps the searchable columns of the stored Places in
+NumPy arrays so that filters run vectorized"""
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NUMERIC = ("price_by_night", "number_rooms", "max_guest",
+           "latitude", "longitude")
+
+
+def number(value):
+    """returns value as a float, NaN when missing or not a number
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def scan(places, city_ids=None, min_price=None, max_price=None,
+         min_rooms=None, min_guests=None, amenity_ids=None):
+    """filters Place objects one by one, see PlaceTable.filter
+    Args:
+        places: iterable of Place objects
+        amenity_ids: ids of amenities the Place must all have
+    Return:
+        returns the list of matching places
+    """
+    if city_ids is not None:
+        city_ids = set(city_ids)
+    if amenity_ids is not None:
+        amenity_ids = set(amenity_ids)
+    result = []
+    for place in places:
+        if city_ids is not None and place.city_id not in city_ids:
+            continue
+        price = number(place.price_by_night)
+        if min_price is not None and not price >= min_price:
+            continue
+        if max_price is not None and not price <= max_price:
+            continue
+        if (min_rooms is not None
+                and not number(place.number_rooms) >= min_rooms):
+            continue
+        if (min_guests is not None
+                and not number(place.max_guest) >= min_guests):
+            continue
+        if (amenity_ids is not None
+                and not amenity_ids.issubset(place.amenity_ids or ())):
+            continue
+        result.append(place)
+    return result
+
+
+class PlaceTable:
+    """This class stores one row per Place: the NUMERIC columns as
+    float arrays (NaN when unset) and city_id as an integer code
+    Attributes:
+        size: number of rows in use, dead ones included
+        keys: storage key of each row, None for a dead row
+        rows: row of each storage key
+        alive: True for the rows holding a Place
+        columns: array of each NUMERIC column
+        city: city code of each row, -1 when unset
+        city_codes: code of each city_id
+        free: dead rows to reuse
+    """
+
+    def __init__(self, capacity=1024):
+        """Instantiation of the table
+        Args:
+            capacity: number of rows allocated up front
+        """
+        self.capacity = capacity
+        self.clear()
+
+    def clear(self):
+        """removes every row
+        """
+        self.size = 0
+        self.keys = []
+        self.rows = {}
+        self.free = []
+        self.city_codes = {}
+        self.alive = numpy.zeros(self.capacity, dtype=bool)
+        self.city = numpy.full(self.capacity, -1, dtype=numpy.int32)
+        self.columns = {name: numpy.full(self.capacity, numpy.nan)
+                        for name in NUMERIC}
+
+    def __len__(self):
+        """returns the number of Places in the table
+        """
+        return len(self.rows)
+
+    def __grow(self):
+        """doubles the number of allocated rows
+        """
+        old = self.capacity
+        self.capacity *= 2
+        self.alive = numpy.concatenate(
+            (self.alive, numpy.zeros(old, dtype=bool)))
+        self.city = numpy.concatenate(
+            (self.city, numpy.full(old, -1, dtype=numpy.int32)))
+        for name in NUMERIC:
+            self.columns[name] = numpy.concatenate(
+                (self.columns[name], numpy.full(old, numpy.nan)))
+
+    def upsert(self, key, get):
+        """adds or updates the row of a Place
+        Args:
+            key: storage key of the Place
+            get: function returning the value of an attribute by name
+        """
+        row = self.rows.get(key)
+        if row is None:
+            if self.free:
+                row = self.free.pop()
+                self.keys[row] = key
+            else:
+                if self.size == self.capacity:
+                    self.__grow()
+                row = self.size
+                self.size += 1
+                self.keys.append(key)
+            self.rows[key] = row
+            self.alive[row] = True
+        for name in NUMERIC:
+            self.columns[name][row] = number(get(name))
+        city_id = get("city_id")
+        if city_id is None:
+            self.city[row] = -1
+        else:
+            self.city[row] = self.city_codes.setdefault(
+                city_id, len(self.city_codes))
+
+    def remove(self, key):
+        """removes the row of a Place
+        Args:
+            key: storage key of the Place
+        """
+        row = self.rows.pop(key, None)
+        if row is not None:
+            self.alive[row] = False
+            self.keys[row] = None
+            self.free.append(row)
+
+    def filter(self, city_ids=None, min_price=None, max_price=None,
+               min_rooms=None, min_guests=None):
+        """returns the keys of the Places matching every given predicate
+        Args:
+            city_ids: ids of the cities the Place may be in
+            min_price: lowest price_by_night
+            max_price: highest price_by_night
+            min_rooms: lowest number_rooms
+            min_guests: lowest max_guest
+        Return:
+            returns a list of storage keys
+        """
+        n = self.size
+        mask = self.alive[:n].copy()
+        columns = self.columns
+        if min_price is not None:
+            mask &= columns["price_by_night"][:n] >= min_price
+        if max_price is not None:
+            mask &= columns["price_by_night"][:n] <= max_price
+        if min_rooms is not None:
+            mask &= columns["number_rooms"][:n] >= min_rooms
+        if min_guests is not None:
+            mask &= columns["max_guest"][:n] >= min_guests
+        if city_ids is not None:
+            codes = [self.city_codes[city_id] for city_id in city_ids
+                     if city_id in self.city_codes]
+            mask &= numpy.isin(self.city[:n], codes)
+        keys = self.keys
+        return [keys[row] for row in numpy.flatnonzero(mask)]
@@ -3,9 +3,11 @@
 from sqlalchemy.ext.declarative import declarative_base
 from models.base_model import BaseModel, Base
 from sqlalchemy import Column, Table, String, Integer, Float, ForeignKey
+from sqlalchemy import Index
 from sqlalchemy.orm import relationship
 from os import getenv
 import models
+from models.review import Review
 
 
 place_amenity = Table("place_amenity", Base.metadata,
@@ -35,6 +37,8 @@ class Place(BaseModel, Base):
         amenity_ids: list of Amenity ids
     """
     __tablename__ = "places"
+    __table_args__ = (Index("ix_places_latitude_longitude",
+                            "latitude", "longitude"),)
     city_id = Column(String(60), ForeignKey("cities.id"), nullable=False)
     user_id = Column(String(60), ForeignKey("users.id"), nullable=False)
     name = Column(String(128), nullable=False)
@@ -57,19 +61,8 @@ class Place(BaseModel, Base):
     else:
         @property
         def reviews(self):
-            """ Returns list of reviews.id """
-            var = models.storage.all()
-            lista = []
-            result = []
-            for key in var:
-                review = key.replace('.', ' ')
-                review = shlex.split(review)
-                if (review[0] == 'Review'):
-                    lista.append(var[key])
-            for elem in lista:
-                if (elem.place_id == self.id):
-                    result.append(elem)
-            return (result)
+            """ Returns the list of Review objects of this place """
+            return models.storage.related(Review, "place_id", self.id)
 
         @property
         def amenities(self):
@@ -78,6 +71,12 @@ class Place(BaseModel, Base):
 
         @amenities.setter
         def amenities(self, obj=None):
-            """ Appends amenity ids to the attribute """
-            if type(obj) is Amenity and obj.id not in self.amenity_ids:
-                self.amenity_ids.append(obj.id)
\ No newline at end of file
+            """ Appends amenity ids to the attribute
+            The list is copied rather than appended to, so that the
+            class-level default is never shared between places and the
+            assignment reaches the storage amenity index. The class is
+            checked by name so that compact Amenity records are taken.
+            """
+            if (type(obj).__name__ == "Amenity"
+                    and obj.id not in self.amenity_ids):
+                self.amenity_ids = self.amenity_ids + [obj.id]
@@ -0,0 +1,210 @@
+#!/usr/bin/python3
+"""Defines unittests for api/v1/app.py.
+Unittest classes:
+    TestAPI
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import unittest
+from os import getenv
+from models import storage
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.state import State
+from models.user import User
+from api.v1.app import API
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)))))
+
+
+def call(app, method, path, body=b""):
+    """sends one request to an ASGI application
+    Return:
+        returns the status, the headers and the body messages
+    """
+    path, _, query = path.partition("?")
+    scope = {"type": "http", "method": method, "path": path,
+             "query_string": query.encode(), "headers": []}
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start, chunks = sent[0], sent[1:]
+    return start["status"], dict(start["headers"]), chunks
+
+
+class TestAPI(unittest.TestCase):
+    """Unittests for the API application"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = API(threads=2, batch=2)
+        cls.user = User(email="a@b.c", password="pwd")
+        cls.state = State(name="Nevada")
+        cls.other = State(name="Utah")
+        cls.cities = [City(name="city_{}".format(i), state_id=cls.state.id)
+                      for i in range(3)]
+        cls.wifi = Amenity(name="Wifi")
+        cls.places = [Place(name="place_{}".format(i), user_id=cls.user.id,
+                            city_id=cls.cities[i % 2].id)
+                      for i in range(4)]
+        for place in cls.places[:3]:
+            if getenv("HBNB_TYPE_STORAGE") == "db":
+                place.amenities.append(cls.wifi)
+            else:
+                place.amenities = cls.wifi
+        for obj in ([cls.user, cls.state, cls.other, cls.wifi] +
+                    cls.cities + cls.places):
+            storage.new(obj)
+        storage.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.executor.shutdown()
+        for obj in cls.places + cls.cities + [cls.wifi, cls.other,
+                                              cls.state, cls.user]:
+            storage.delete(obj)
+        storage.save()
+
+    def get(self, path, method="GET", body=b""):
+        """returns the status and the decoded JSON body of a request"""
+        status, _, chunks = call(self.app, method, path, body)
+        return status, json.loads(b"".join(chunk["body"]
+                                           for chunk in chunks))
+
+    def ids(self, objs):
+        """returns the sorted ids of objects"""
+        return sorted(obj.id for obj in objs)
+
+    @unittest.skipIf(getenv("HBNB_TYPE_STORAGE") == "db",
+                     "not using FileStorage")
+    def test_other_process(self):
+        """In file mode a request sees what another process saved"""
+        code = ("import models\n"
+                "from models.state import State\n"
+                "state = State(name='Oregon')\n"
+                "models.storage.new(state)\n"
+                "models.storage.save()\n"
+                "print(state.id)\n")
+        id = subprocess.run([sys.executable, "-c", code], check=True,
+                            capture_output=True, text=True,
+                            env=dict(os.environ, PYTHONPATH=ROOT)
+                            ).stdout.strip()
+        try:
+            status, state = self.get("/api/v1/states/" + id)
+            self.assertEqual((status, state["name"]), (200, "Oregon"))
+        finally:
+            storage.close()
+            storage.delete(storage.get(State, id))
+            storage.save()
+
+    def test_status(self):
+        """GET /api/v1/status"""
+        self.assertEqual(self.get("/api/v1/status"), (200, {"status": "OK"}))
+
+    def test_stats(self):
+        """GET /api/v1/stats counts every class"""
+        status, stats = self.get("/api/v1/stats")
+        self.assertEqual(status, 200)
+        self.assertEqual(stats["states"], storage.count(State))
+        self.assertEqual(stats["places"], storage.count(Place))
+
+    def test_list_streamed(self):
+        """Lists are sent in chunks of batch objects"""
+        status, headers, chunks = call(self.app, "GET", "/api/v1/cities")
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b"content-type"], b"application/json")
+        self.assertGreater(len(chunks), 2)
+        self.assertTrue(all(chunk.get("more_body") for chunk in chunks[:-1]))
+        self.assertFalse(chunks[-1].get("more_body"))
+        cities = json.loads(b"".join(chunk["body"] for chunk in chunks))
+        self.assertEqual([city["id"] for city in cities],
+                         self.ids(storage.all(City).values()))
+        self.assertNotIn("places", cities[0])
+
+    def test_pagination(self):
+        """limit and after walk a list page by page"""
+        every = self.ids(storage.all(City).values())
+        status, page = self.get("/api/v1/cities?limit=1")
+        self.assertEqual([city["id"] for city in page], every[:1])
+        status, page = self.get("/api/v1/cities?limit=5&after=" + every[0])
+        self.assertEqual([city["id"] for city in page], every[1:6])
+        self.assertEqual(self.get("/api/v1/cities?after=" + every[-1]),
+                         (200, []))
+        self.assertEqual(self.get("/api/v1/cities?limit=0"), (200, []))
+        self.assertEqual(self.get("/api/v1/cities?limit=-1")[0], 400)
+        self.assertEqual(self.get("/api/v1/cities?limit=a")[0], 400)
+
+    def test_get(self):
+        """GET /api/v1/<kind>/<id>"""
+        status, state = self.get("/api/v1/states/" + self.state.id)
+        self.assertEqual(status, 200)
+        self.assertEqual(state["name"], "Nevada")
+        self.assertEqual(state["__class__"], "State")
+        self.assertEqual(self.get("/api/v1/states/nope"),
+                         (404, {"error": "Not found"}))
+        self.assertEqual(self.get("/api/v1/users")[0], 404)
+
+    def test_nested(self):
+        """The cities of a state and the places of a city"""
+        status, cities = self.get(
+            "/api/v1/states/{}/cities".format(self.state.id))
+        self.assertEqual([city["id"] for city in cities],
+                         self.ids(self.cities))
+        status, places = self.get(
+            "/api/v1/cities/{}/places".format(self.cities[1].id))
+        self.assertEqual([place["id"] for place in places],
+                         self.ids(self.places[1::2]))
+        self.assertEqual(self.get("/api/v1/cities/nope/places")[0], 404)
+
+    def test_places_search(self):
+        """POST /api/v1/places_search"""
+        search = "/api/v1/places_search"
+        status, places = self.get(search, "POST", json.dumps(
+            {"states": [self.state.id], "amenities": [self.wifi.id]}
+        ).encode())
+        self.assertEqual(status, 200)
+        self.assertEqual([place["id"] for place in places],
+                         self.ids(self.places[:3]))
+        status, places = self.get(search, "POST", json.dumps(
+            {"cities": [self.cities[0].id]}).encode())
+        self.assertEqual([place["id"] for place in places],
+                         self.ids(self.places[::2]))
+        status, places = self.get(search, "POST", json.dumps(
+            {"states": [self.other.id]}).encode())
+        self.assertEqual(places, [])
+        self.assertEqual(self.get(search, "POST", b"{")[0], 400)
+        self.assertEqual(self.get(search)[0], 405)
+
+    def test_lifespan(self):
+        """The thread pool is stopped on shutdown"""
+        app = API(threads=1)
+        messages = [{"type": "lifespan.startup"},
+                    {"type": "lifespan.shutdown"}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message["type"])
+
+        asyncio.run(app({"type": "lifespan"}, receive, send))
+        self.assertEqual(sent, ["lifespan.startup.complete",
+                                "lifespan.shutdown.complete"])
+        with self.assertRaises(RuntimeError):
+            app.executor.submit(print)
+
+
+if __name__ == "__main__":
+    unittest.main()
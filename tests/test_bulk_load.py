@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+"""Defines unittests for bulk_load.py.
+Unittest classes:
+    TestBulkLoad
+"""
+import json
+import unittest
+from os import getenv
+from unittest.mock import patch
+import models
+from bulk_load import load
+from models.base_model import BaseModel
+from models.state import State
+
+
+class TestBulkLoad(unittest.TestCase):
+    """Unittests for load()"""
+
+    def test_bad_lines(self):
+        """Unreadable lines and unknown classes are refused with their
+        line number"""
+        for line in ("{oops", '{"__class__": "Nope"}', '[1]'):
+            with patch.object(models.storage, "bulk_new") as bulk_new:
+                with self.assertRaisesRegex(ValueError, "^line 2: "):
+                    load(["\n", line], 10)
+            bulk_new.assert_not_called()
+
+    def test_groups(self):
+        """Objects go to bulk_new() built with their classes"""
+        lines = [json.dumps(State(name="A").to_dict())]
+        if getenv("HBNB_TYPE_STORAGE") != "db":
+            lines.append(json.dumps(BaseModel().to_dict()))
+        with patch.object(models.storage, "bulk_new",
+                          side_effect=len) as bulk_new:
+            self.assertEqual(load(lines, 10), len(lines))
+        objects = bulk_new.call_args.args[0]
+        self.assertEqual([type(obj) for obj in objects],
+                         [State, BaseModel][:len(lines)])
+
+    def test_no_table_in_db_mode(self):
+        """BaseModel has no table to go to in DB mode"""
+        line = json.dumps(BaseModel().to_dict())
+        with patch.dict("os.environ", {"HBNB_TYPE_STORAGE": "db"}), \
+                patch.object(models.storage, "bulk_new") as bulk_new:
+            with self.assertRaisesRegex(
+                    ValueError, "line 1: .*BaseModel has no table"):
+                load([line], 10)
+        bulk_new.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/python3
+"""Defines unittests for the streamed all command of console.py.
+Unittest classes:
+    TestAll
+"""
+import json
+import re
+from ast import literal_eval
+import unittest
+from io import StringIO
+from unittest.mock import patch
+import models
+from console import HBNBCommand
+
+
+class TestAll(unittest.TestCase):
+    """Unittests for all and <class>.all()"""
+
+    def setUp(self):
+        self.console = HBNBCommand()
+        self.states = [models.classes["State"](name=name)
+                       for name in ("Nevada", "Utah", "Nevada")]
+        for state in self.states:
+            models.storage.new(state)
+        self.ids = [state.id for state in self.states]
+
+    def tearDown(self):
+        for state in self.states:
+            if models.storage.get("State", state.id) is not None:
+                models.storage.delete(state)
+        models.storage.save()
+
+    def run_command(self, line):
+        """Runs a command without storage.all(), returns its output"""
+        with patch("sys.stdout", new_callable=StringIO) as out, \
+                patch.object(models.storage, "all",
+                             side_effect=AssertionError("not streamed")):
+            self.console.onecmd(line)
+        return out.getvalue()
+
+    def listed(self, output):
+        """Returns the ids of the test states in a list output"""
+        return [id for id in self.ids for line in literal_eval(output)
+                if "({})".format(id) in line]
+
+    def json_listed(self, output):
+        """Returns the ids of the test states in a JSON lines output"""
+        ids = [json.loads(line)["id"] for line in output.splitlines()]
+        return [id for id in ids if id in self.ids]
+
+    def test_same_output(self):
+        """Without options the output is the list print() wrote"""
+        expected = str([str(obj) for obj in
+                        models.storage.stream("State")]) + "\n"
+        # in DB mode objects read again get a new _sa_instance_state
+        address = re.compile(r" at 0x[0-9a-f]+")
+        for line in ("all State", "State.all()"):
+            self.assertEqual(address.sub("", self.run_command(line)),
+                             address.sub("", expected))
+        self.assertTrue(self.run_command("all").startswith("["))
+        self.assertEqual(self.run_command("all Amenity name=nope"), "[]\n")
+        self.assertTrue(self.run_command("all BaseModel").startswith("["))
+
+    def test_json(self):
+        """--json writes one to_dict() per line"""
+        output = self.run_command("all State --json")
+        for line in output.splitlines():
+            self.assertEqual(json.loads(line)["__class__"], "State")
+        self.assertEqual(sorted(self.json_listed(output)), sorted(self.ids))
+
+    def test_filters(self):
+        """Attributes must equal the values, typed per class"""
+        output = self.run_command("all State name=Nevada --json")
+        self.assertEqual(sorted(self.json_listed(output)),
+                         sorted(id for id in self.ids if id != self.ids[1]))
+        self.assertEqual(self.listed(self.run_command(
+            'all name="Utah"')), [self.ids[1]])
+        self.assertEqual(self.run_command(
+            "all Place max_guest=many"),
+            "** invalid value: max_guest takes an integer **\n")
+
+    def test_limit_offset(self):
+        """--limit and --offset slice the matching instances"""
+        def ids(line):
+            return [json.loads(text)["id"] for text
+                    in self.run_command(line).splitlines()]
+        every = ids("all State --json name=Nevada")
+        self.assertEqual(ids("all State --json --limit 1 --offset 1 "
+                             "name=Nevada"), every[1:2])
+        self.assertEqual(ids("all State --json --offset=1"),
+                         ids("all State --json")[1:])
+        self.assertEqual(self.run_command("all State --limit=0"), "[]\n")
+
+    def test_errors(self):
+        """Bad classes, options and arguments"""
+        self.assertEqual(self.run_command("all Nope"),
+                         "** class doesn't exist **\n")
+        self.assertEqual(self.run_command("all State --limit x"),
+                         "** invalid option --limit **\n")
+        self.assertEqual(self.run_command("all State --top"),
+                         "** invalid option --top **\n")
+        self.assertEqual(self.run_command("all State City"),
+                         "** invalid argument City **\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
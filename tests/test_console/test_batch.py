@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+"""Defines unittests for the batch mode of console.py.
+Unittest classes:
+    TestBatch
+"""
+import unittest
+from io import StringIO
+from unittest.mock import patch
+import models
+from console import HBNBCommand
+
+
+class TestBatch(unittest.TestCase):
+    """Unittests for HBNBCommand.run_batch"""
+
+    def setUp(self):
+        self.console = HBNBCommand()
+        self.ids = []
+
+    def tearDown(self):
+        for id in self.ids:
+            obj = models.storage.get("State", id)
+            if obj is not None:
+                models.storage.delete(obj)
+        models.storage.save()
+
+    def run_batch(self, lines, every):
+        """Runs lines, returns the timings, the report and the number of
+        storage saves"""
+        report = StringIO()
+        with patch.object(models.storage, "save") as save, \
+                patch("sys.stdout", new_callable=StringIO) as out:
+            try:
+                timings = self.console.run_batch(lines, every, report)
+            finally:
+                self.ids.extend(line for line in out.getvalue().split()
+                                if len(line) == 36)
+        return timings, report.getvalue(), save.call_count
+
+    def test_flushes(self):
+        """The storage is saved once per every changing commands and at
+        the end"""
+        lines = ['create State name="s_{}"\n'.format(i) for i in range(5)]
+        timings, report, saves = self.run_batch(
+            ["# comment\n", "\n"] + lines + ["State.count()\n"], 2)
+        self.assertEqual(saves, 3)
+        self.assertEqual(timings["create"][0], 5)
+        self.assertEqual(timings["count"][0], 1)
+        self.assertEqual(timings["(flush)"][0], 3)
+        self.assertEqual(len(self.ids), 5)
+        for id in self.ids:
+            self.assertIsNotNone(models.storage.get("State", id))
+        self.assertIn("6 commands in", report)
+        self.assertIn("3 flushes", report)
+        self.assertIsNone(self.console.every)
+
+    def test_read_only(self):
+        """Commands changing nothing do not save"""
+        self.assertEqual(self.run_batch(["count State", "all City"], 1)[2],
+                         0)
+
+    def test_failure(self):
+        """The changes made before a failing command are saved"""
+        with patch.object(self.console, "do_count",
+                          side_effect=RuntimeError), \
+                self.assertRaises(RuntimeError):
+            self.run_batch(['create State name="a"', "count State"], 10)
+        self.assertEqual(self.console.unsaved, 0)
+
+    def test_quit(self):
+        """quit ends the batch"""
+        timings = self.run_batch(["quit", "create State"], 10)[0]
+        self.assertNotIn("create", timings)
+
+    def test_interactive(self):
+        """Out of batch mode every changing command saves"""
+        with patch.object(models.storage, "save") as save, \
+                patch("sys.stdout", new_callable=StringIO) as out:
+            self.console.onecmd('create State name="Nevada"')
+            self.ids.append(out.getvalue().strip())
+            self.console.onecmd("update State {} name Utah".format(
+                self.ids[0]))
+        self.assertEqual(save.call_count, 2)
+        self.assertEqual(models.storage.get("State", self.ids[0]).name,
+                         "Utah")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/python3
+"""Defines unittests for the <class>.<method>(<args>) commands of
+console.py.
+Unittest classes:
+    TestParseCall
+    TestCalls
+"""
+import unittest
+from io import StringIO
+from unittest.mock import patch
+import models
+from console import HBNBCommand, Unquoted, parse_call
+
+
+class TestParseCall(unittest.TestCase):
+    """Unittests for parse_call"""
+
+    def test_no_args(self):
+        """Calls without arguments"""
+        self.assertEqual(parse_call("State.all()"), ("State", "all", []))
+        self.assertEqual(parse_call("State.count( )"),
+                         ("State", "count", []))
+
+    def test_strings(self):
+        """Quoted strings keep their spaces, commas and escapes"""
+        self.assertEqual(
+            parse_call('User.update("1", "name", "Betty, \\"B\\" Holberton")'),
+            ("User", "update", ["1", "name", 'Betty, "B" Holberton']))
+
+    def test_bare(self):
+        """Unquoted arguments are kept as Unquoted text"""
+        self.assertEqual(parse_call("Place.update(1-2, max_guest, 4)"),
+                         ("Place", "update", ["1-2", "max_guest", "4"]))
+        args = parse_call("Place.update(1, latitude, -3.5)")[2]
+        self.assertEqual(args, ["1", "latitude", "-3.5"])
+        self.assertEqual([type(arg) for arg in args], [Unquoted] * 3)
+
+    def test_dict(self):
+        """A dictionary is one argument"""
+        self.assertEqual(
+            parse_call('User.update("1", {"first_name": "John Smith", '
+                       "'age': 89, \"tags\": {\"a\": [1, 2]}})"),
+            ("User", "update", ["1", {"first_name": "John Smith", "age": 89,
+                                      "tags": {"a": [1, 2]}}]))
+
+    def test_not_calls(self):
+        """Lines that are not calls, or with a bad dictionary"""
+        self.assertIsNone(parse_call("State.all"))
+        self.assertIsNone(parse_call("all State"))
+        self.assertIsNone(parse_call('User.update("1", {"a": })'))
+        self.assertIsNone(parse_call('User.update("1", {1, 2})'))
+
+
+class TestCalls(unittest.TestCase):
+    """Unittests for the dispatch of the calls"""
+
+    def setUp(self):
+        self.console = HBNBCommand()
+        self.state = models.classes["State"](name="Nevada")
+        models.storage.new(self.state)
+
+    def tearDown(self):
+        if models.storage.get("State", self.state.id) is not None:
+            models.storage.delete(self.state)
+        models.storage.save()
+
+    def run_command(self, line):
+        """Runs a command, returns its output"""
+        with patch("sys.stdout", new_callable=StringIO) as out:
+            self.console.stdout = out
+            self.console.onecmd(line)
+        return out.getvalue()
+
+    def test_update_dict(self):
+        """A dictionary update sets every attribute with one save"""
+        with patch.object(self.console, "save") as save:
+            self.run_command('State.update("{}", {{"name": "New York", '
+                             '"motto": "Excelsior"}})'.format(self.state.id))
+        save.assert_called_once_with(self.state)
+        self.assertEqual(self.state.name, "New York")
+        self.assertEqual(self.state.motto, "Excelsior")
+
+    def test_update_spaces(self):
+        """Values with spaces reach the object whole"""
+        self.run_command('State.update("{}", "name", "Las Vegas")'.format(
+            self.state.id))
+        self.assertEqual(self.state.name, "Las Vegas")
+
+    def test_show(self):
+        """show and count, with the messages of the plain commands"""
+        self.assertIn(self.state.id, self.run_command(
+            'State.show("{}")'.format(self.state.id)))
+        self.assertEqual(self.run_command("State.count()"),
+                         self.run_command("count State"))
+        self.assertEqual(self.run_command('State.show("nope")'),
+                         "** no instance found **\n")
+        self.assertEqual(self.run_command("Nope.show(1)"),
+                         "** class doesn't exist **\n")
+        self.assertEqual(self.run_command("State.show()"),
+                         "** instance id missing **\n")
+        self.assertEqual(self.run_command(
+            'State.update("{}")'.format(self.state.id)),
+            "** attribute name missing **\n")
+        self.assertIn("Unknown syntax", self.run_command("State.nope()"))
+
+    def test_destroy(self):
+        """destroy deletes the instance"""
+        self.run_command('State.destroy("{}")'.format(self.state.id))
+        self.assertIsNone(models.storage.get("State", self.state.id))
+
+
+if __name__ == "__main__":
+    unittest.main()
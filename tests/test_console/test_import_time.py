@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+"""Defines the import-time budget of console.py, measured with
+python -X importtime in a new interpreter.
+Unittest classes:
+    TestImportTime
+"""
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+# cumulative import time of console, in ms; about 11 ms when written,
+# 330 ms when importing it also imported SQLAlchemy and loaded file.json
+BUDGET = 100
+
+
+def importtime(code):
+    """runs code in a new interpreter with -X importtime
+    Args:
+        code: Python statements
+    Return:
+        returns the cumulative import time, in microseconds, of each
+        imported module, by name
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=ROOT, capture_output=True, text=True,
+                            check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if fields[1].strip().isdigit():
+            modules[fields[2].strip()] = int(fields[1])
+    return modules
+
+
+def run(code, **env):
+    """runs code in a new interpreter
+    Args:
+        code: Python statements
+        env: environment variables to set
+    Return:
+        returns its standard output
+    """
+    return subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                          capture_output=True, text=True, check=True,
+                          env=dict(os.environ, **env)).stdout
+
+
+class TestImportTime(unittest.TestCase):
+    """Unittests for the startup cost of console.py"""
+
+    def test_console_budget(self):
+        """console imports within BUDGET ms"""
+        self.assertLess(importtime("import console")["console"] / 1000,
+                        BUDGET)
+
+    def test_nothing_loaded(self):
+        """Importing console imports no model, engine or SQLAlchemy"""
+        modules = run("import console, sys\nprint(*sys.modules)").split()
+        loaded = [name for name in modules
+                  if name.split(".")[0] == "sqlalchemy"
+                  or name.startswith("models.")]
+        self.assertEqual(loaded, [])
+
+    def test_lazy_storage(self):
+        """models.storage is built on first access, once"""
+        run("import models, sys\n"
+            "assert 'storage' not in vars(models)\n"
+            "assert 'State' in models.classes\n"
+            "assert 'models.state' not in sys.modules\n"
+            "storage = models.storage\n"
+            "assert models.storage is storage\n"
+            "assert models.classes['State'].__name__ == 'State'\n")
+
+    def test_db_classes(self):
+        """In DB mode a class can be used before the storage is built"""
+        run("import models\n"
+            "models.classes['State'](name='California')\n",
+            HBNB_TYPE_STORAGE="db", HBNB_DB_URL="sqlite://")
+
+    def test_db_model_alone(self):
+        """In DB mode a model module can be imported and used alone"""
+        run("from models.state import State\n"
+            "State(name='California')\n",
+            HBNB_TYPE_STORAGE="db", HBNB_DB_URL="sqlite://")
+
+
+if __name__ == "__main__":
+    unittest.main()
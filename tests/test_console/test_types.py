@@ -0,0 +1,161 @@
+#!/usr/bin/python3
+"""Defines unittests for the conversion of the values given to create and
+update to the types of the columns of the models.
+Unittest classes:
+    TestTypes
+    TestTypes_compact
+"""
+import unittest
+from io import StringIO
+from os import getenv
+from unittest.mock import patch
+import models
+from console import HBNBCommand, Unquoted, convert, parameter
+
+
+class TestTypes(unittest.TestCase):
+    """Unittests for typed create and update commands"""
+
+    def setUp(self):
+        self.console = HBNBCommand()
+        self.ids = []
+
+    def tearDown(self):
+        for id in self.ids:
+            obj = models.storage.get("Place", id)
+            if obj is not None:
+                models.storage.delete(obj)
+        models.storage.save()
+
+    def run_command(self, line):
+        """Runs a command, returns its output"""
+        with patch("sys.stdout", new_callable=StringIO) as out, \
+                patch.object(models.storage, "save"):
+            self.console.onecmd(line)
+        return out.getvalue()
+
+    def create(self, params):
+        """Creates a Place (of no real city or user), returns it"""
+        id = self.run_command('create Place city_id="0" user_id="0" ' +
+                              params).strip()
+        self.ids.append(id)
+        return models.storage.get("Place", id)
+
+    def test_parameter(self):
+        """Parameters are strings, unquoted ones become numbers only
+        where the attribute is not a column"""
+        self.assertEqual(parameter("4"), "4")
+        self.assertIs(type(parameter("4")), Unquoted)
+        self.assertEqual(parameter('"My_little_\\"house\\""'),
+                         'My little "house"')
+        self.assertIs(type(parameter('"4"')), str)
+        self.assertEqual(parameter("Lazy_Cat"), "Lazy Cat")
+        Place = models.classes["Place"]
+        self.assertEqual(convert(Place, "nickname", parameter("4")), 4)
+        self.assertEqual(convert(Place, "nickname", parameter("-3.5")),
+                         -3.5)
+        self.assertEqual(convert(Place, "nickname", parameter('"4"')), "4")
+        self.assertEqual(convert(Place, "name", parameter("0123")), "0123")
+
+    def test_text_columns(self):
+        """String columns keep the text of number-looking values"""
+        place = self.create("name=0123 description=1e3 max_guest=007")
+        self.assertEqual((place.name, place.description, place.max_guest),
+                         ("0123", "1e3", 7))
+        self.run_command('Place.update("{}", "name", 00042)'
+                         .format(place.id))
+        self.assertEqual(place.name, "00042")
+        self.run_command("update Place {} description 1e3"
+                         .format(place.id))
+        self.assertEqual(place.description, "1e3")
+        with patch("sys.stdout", new_callable=StringIO) as out:
+            self.console.onecmd("all Place name=00042")
+        self.assertIn(place.id, out.getvalue())
+
+    def test_create(self):
+        """create stores numbers as numbers"""
+        place = self.create('name="My_house" max_guest=4 latitude=37 '
+                            'price_by_night="100"')
+        self.assertEqual(place.name, "My house")
+        self.assertIs(type(place.max_guest), int)
+        self.assertEqual(place.max_guest, 4)
+        self.assertIs(type(place.latitude), float)
+        self.assertEqual(place.price_by_night, 100)
+
+    def test_create_invalid(self):
+        """create rejects values not fitting their column, creating
+        nothing"""
+        count = models.storage.count("Place")
+        self.assertEqual(self.run_command("create Place max_guest=4.5"),
+                         "** invalid value: max_guest takes an integer **\n")
+        self.assertEqual(self.run_command("create Place latitude=north"),
+                         "** invalid value: latitude takes a number **\n")
+        self.assertEqual(self.run_command("create Place name"),
+                         "** invalid parameter name **\n")
+        self.assertEqual(models.storage.count("Place"), count)
+
+    def test_update(self):
+        """update converts its value, dictionaries too"""
+        place = self.create('name="Home"')
+        self.run_command("update Place {} number_rooms 3".format(place.id))
+        self.assertEqual(place.number_rooms, 3)
+        self.run_command('update Place {} name "Big house"'.format(place.id))
+        self.assertEqual(place.name, "Big house")
+        self.run_command('Place.update("{}", {{"longitude": "-122.4", '
+                         '"max_guest": "6"}})'.format(place.id))
+        self.assertEqual((place.longitude, place.max_guest), (-122.4, 6))
+
+    def test_update_invalid(self):
+        """update changes nothing when a value does not fit"""
+        place = self.create('name="Home" max_guest=2')
+        self.assertEqual(self.run_command(
+            'Place.update("{}", {{"name": "Hut", "max_guest": "many"}})'
+            .format(place.id)),
+            "** invalid value: max_guest takes an integer **\n")
+        self.assertEqual((place.name, place.max_guest), ("Home", 2))
+
+
+@unittest.skipIf(getenv("HBNB_TYPE_STORAGE") == "db", "not using FileStorage")
+class TestTypes_compact(unittest.TestCase):
+    """Unittests for typed commands on compact records"""
+
+    def setUp(self):
+        from models.engine.compact import compact_class
+        from models.engine.file_storage import FileStorage
+        self.storage = FileStorage()
+        self.storage._FileStorage__classes = {
+            name: compact_class(cls)
+            for name, cls in models.classes.items()}
+        self.state = compact_class(models.classes["State"])(
+            name="California")
+        self.storage.new(self.state)
+        self.console = HBNBCommand()
+
+    def run_command(self, line):
+        """Runs a command on the compact storage, returns its output"""
+        with patch("sys.stdout", new_callable=StringIO) as out, \
+                patch.object(models, "storage", self.storage), \
+                patch.object(self.storage, "save"):
+            self.console.onecmd(line)
+        return out.getvalue()
+
+    def test_update(self):
+        """update converts the values of compact records"""
+        self.run_command("update State {} name Nevada"
+                         .format(self.state.id))
+        self.assertEqual(self.state.name, "Nevada")
+        line = 'State.update("{}", "name", {})'.format(
+            self.state.id, "x" * 200)
+        self.assertEqual(
+            self.run_command(line),
+            "** invalid value: name takes at most 128 characters **\n")
+
+    def test_all(self):
+        """all filters compact records"""
+        self.assertIn(self.state.id,
+                      self.run_command("all State name=California"))
+        self.assertEqual(self.run_command("all State name=Cal"), "[]\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ Unittest classes:
 """
 from fileinput import lineno
 import unittest
+import unittest.mock
 from models import storage
 from models.base_model import BaseModel
 from models.engine.file_storage import FileStorage
@@ -275,5 +276,43 @@ class TestBaseModel_to_Dict_Method(unittest.TestCase):
             b1.to_dict(None)
 
 
+class TestBaseModel_from_dicts(unittest.TestCase):
+    """Unittests for testing the from_dicts class method."""
+
+    def test_round_trip(self):
+        """Instances built from to_dict() match the originals"""
+        b1, b2 = BaseModel(), BaseModel()
+        b1.name = "first"
+        objs = BaseModel.from_dicts([b1.to_dict(), b2.to_dict()])
+        self.assertEqual([o.to_dict() for o in objs],
+                         [b1.to_dict(), b2.to_dict()])
+        self.assertEqual(objs[0].__dict__, b1.__dict__)
+        self.assertIsInstance(objs[0].created_at, datetime)
+
+    def test_mapped_class(self):
+        """Mapped models get a usable instance state"""
+        from models.place import Place
+        p1 = Place(name="house", number_rooms=3)
+        p2, = Place.from_dicts([p1.to_dict()])
+        self.assertIs(type(p2), Place)
+        self.assertEqual(p2.to_dict(), p1.to_dict())
+        self.assertIsNone(p2.description)
+        p2.name = "flat"
+        self.assertEqual(p2.name, "flat")
+
+    def test_missing_dates(self):
+        """Dictionaries without dates go through __init__"""
+        b1, = BaseModel.from_dicts([{"id": "123", "__class__": "BaseModel"}])
+        self.assertEqual(b1.id, "123")
+        self.assertIsInstance(b1.updated_at, datetime)
+
+    def test_no_setattr(self):
+        """Bulk built instances do not go through __setattr__"""
+        b1 = BaseModel()
+        with unittest.mock.patch.object(BaseModel, "__setattr__") as hook:
+            BaseModel.from_dicts([b1.to_dict()] * 3)
+        hook.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+""" Module for testing the amenity bitmap index"""
+import unittest
+import json
+import os
+import tempfile
+from models import storage
+from models.amenity import Amenity
+from models.engine.amenity_index import AmenityIndex
+from models.place import Place
+
+
+class test_amenity_index(unittest.TestCase):
+    """ Class to test AmenityIndex """
+
+    def setUp(self):
+        """ Index a few places """
+        self.index = AmenityIndex()
+        self.index.set("a", ["wifi", "pool"])
+        self.index.set("b", ["wifi"])
+        self.index.set("c", ["pool", "parking", "wifi"])
+        self.index.set("d", [])
+
+    def test_having_all(self):
+        """ Every listed amenity must be present """
+        self.assertEqual(self.index.having_all(["wifi"]), ["a", "b", "c"])
+        self.assertEqual(self.index.having_all(["wifi", "pool"]),
+                         ["a", "c"])
+        self.assertEqual(self.index.having_all(["parking", "wifi"]), ["c"])
+        self.assertEqual(self.index.having_all(["sauna"]), [])
+        self.assertEqual(self.index.having_all([]), ["a", "b", "c", "d"])
+
+    def test_updates(self):
+        """ Changing or removing a place updates the bitmaps """
+        self.index.set("a", ["parking"])
+        self.assertEqual(self.index.having_all(["wifi"]), ["b", "c"])
+        self.assertEqual(self.index.having_all(["parking"]), ["a", "c"])
+        self.index.remove("c")
+        self.index.set("e", ["wifi", "pool"])
+        self.assertEqual(self.index.having_all(["wifi", "pool"]), ["e"])
+        self.assertEqual(len(self.index), 4)
+
+    def test_many_positions(self):
+        """ Bitmaps span many bytes """
+        index = AmenityIndex()
+        for i in range(1000):
+            index.set("{:04d}".format(i), ["even"] if i % 2 else ["odd"])
+        self.assertEqual(len(index.having_all(["even"])), 500)
+        self.assertEqual(index.having_all(["odd"])[-1], "0998")
+
+
+class test_storage_amenities(unittest.TestCase):
+    """ Class to test the amenity queries of FileStorage """
+
+    def setUp(self):
+        """ Store two places with amenities """
+        self.clear()
+        self.wifi, self.pool = Amenity(name="Wifi"), Amenity(name="Pool")
+        self.first = Place(price_by_night=100)
+        self.second = Place(price_by_night=200)
+        for place in (self.first, self.second):
+            storage.new(place)
+            place.amenities = self.wifi
+        self.first.amenities = self.pool
+
+    def tearDown(self):
+        """ Drop the stored places """
+        self.clear()
+
+    def clear(self):
+        """ Empty the storage and its indexes """
+        storage.all().clear()
+        storage._FileStorage__pending.clear()
+        storage._FileStorage__reindex()
+
+    def test_amenity_ids_not_shared(self):
+        """ Each place has its own list of amenity ids """
+        self.assertEqual(self.first.amenity_ids, [self.wifi.id, self.pool.id])
+        self.assertEqual(self.second.amenity_ids, [self.wifi.id])
+        self.assertEqual(Place.amenity_ids, [])
+
+    def test_places_with_amenities(self):
+        """ Setting Place.amenities is indexed right away """
+        self.assertEqual(storage.places_with_amenities([self.wifi.id]),
+                         sorted([self.first, self.second],
+                                key=lambda p: p.id))
+        self.assertEqual(storage.places_with_amenities(
+            [self.wifi.id, self.pool.id]), [self.first])
+
+    def test_filter_places(self):
+        """ Amenities combine with the other filters """
+        self.assertEqual(storage.filter_places(
+            min_price=150, amenity_ids=[self.wifi.id]), [self.second])
+        self.assertEqual(storage.filter_places(
+            min_price=150, amenity_ids=[self.pool.id]), [])
+
+    def test_reload(self):
+        """ Saved amenity ids are indexed on reload """
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        storage._FileStorage__file_path = path
+        try:
+            storage.save()
+            self.clear()
+            storage.reload()
+            found = storage.places_with_amenities([self.pool.id])
+            self.assertEqual([p.id for p in found], [self.first.id])
+        finally:
+            del storage._FileStorage__file_path
+            os.remove(path)
+            os.remove(path + ".lock")
+
+
+if __name__ == "__main__":
+    unittest.main()
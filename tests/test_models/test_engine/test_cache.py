@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/cache.py.
+Unittest classes:
+    TestCachedStorage
+"""
+import json
+import os
+import unittest
+from unittest import mock
+from models import storage
+from models.engine import cache
+from models.engine.cache import CachedStorage
+from models.engine.file_storage import FileStorage
+from models.city import City
+from models.state import State
+
+
+@unittest.skipIf(type(storage) is not FileStorage, "not using FileStorage")
+class TestCachedStorage(unittest.TestCase):
+    """Unittests for the CachedStorage wrapper"""
+
+    def setUp(self):
+        storage.all().clear()
+        storage._FileStorage__pending.clear()
+        storage._FileStorage__reindex()
+        storage._FileStorage__file_path = "test_cache.json"
+        self.cache = CachedStorage(storage, size=4, ttl=60)
+        self.state = State(name="California")
+        self.cache.new(self.state)
+
+    def tearDown(self):
+        del storage._FileStorage__file_path
+        for path in ("test_cache.json", "test_cache.json.lock"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def test_hits_and_misses(self):
+        """Lookups go to the engine once"""
+        with mock.patch.object(storage, "all", wraps=storage.all) as all:
+            first = self.cache.all(State)
+            second = self.cache.all("State")
+        all.assert_called_once_with(State, None)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertIs(self.cache.get(State, self.state.id), self.state)
+        self.assertIs(self.cache.get(State, self.state.id), self.state)
+        self.assertEqual(self.cache.count(State), 1)
+        self.assertEqual(self.cache.stats(), {"hits": 2, "misses": 3,
+                                              "evictions": 0, "entries": 3})
+
+    def test_all_without_class(self):
+        """all() of every class is not cached"""
+        self.assertIs(self.cache.all(), storage.all())
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_invalidation(self):
+        """Writes drop the entries of their class"""
+        self.cache.all(State)
+        self.cache.all(City)
+        self.cache.count()
+        other = State(name="Nevada")
+        self.cache.new(other)
+        self.assertEqual(self.cache.stats()["entries"], 1)
+        self.assertIn("State." + other.id, self.cache.all(State))
+        self.cache.delete(other)
+        self.assertNotIn("State." + other.id, self.cache.all(State))
+        self.cache.save()
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_preload_invalidation(self):
+        """Entries preloading relationships are dropped on any write"""
+        self.cache.all(State, preload=[City])
+        self.cache.new(City(state_id=self.state.id))
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_lru(self):
+        """The least recently used entries go first"""
+        for i in range(4):
+            self.cache.get(State, i)
+        self.cache.get(State, 0)
+        self.cache.get(State, 4)
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+        self.cache.get(State, 0)
+        self.assertEqual(self.cache.hits, 2)
+        self.cache.get(State, 1)
+        self.assertEqual(self.cache.misses, 6)
+
+    def test_ttl(self):
+        """Entries expire ttl seconds after they were loaded"""
+        with mock.patch.object(cache, "monotonic", return_value=100):
+            self.cache.count(State)
+        with mock.patch.object(cache, "monotonic", return_value=159):
+            self.cache.count(State)
+        with mock.patch.object(cache, "monotonic", return_value=160):
+            self.cache.count(State)
+        self.assertEqual(self.cache.stats(), {"hits": 1, "misses": 2,
+                                              "evictions": 1, "entries": 1})
+
+    def test_close(self):
+        """Hits after close() hand the objects reloaded by the engine"""
+        self.cache.save()
+        self.cache.all(State)
+        # another process saves the file
+        with open("test_cache.json") as f:
+            saved = json.load(f)
+        saved["State." + self.state.id]["name"] = "Oregon"
+        with open("test_cache.json", "w") as f:
+            json.dump(saved, f)
+        self.cache.close()
+        reloaded = storage.get(State, self.state.id)
+        self.assertIsNot(reloaded, self.state)
+        self.assertIs(self.cache.all(State)["State." + self.state.id],
+                      reloaded)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_delegation(self):
+        """Anything else is the engine's"""
+        self.assertEqual(self.cache.related(City, "state_id", "x"), [])
+        self.assertEqual(list(self.cache.iter_all(State)), [self.state])
+
+
+if __name__ == "__main__":
+    unittest.main()
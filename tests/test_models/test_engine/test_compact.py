@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+""" Module for testing the compact model stand-ins"""
+import unittest
+import json
+import os
+import tempfile
+from datetime import datetime
+from models import storage
+from models.engine.compact import compact_class, CompactRecord
+from models.engine.file_storage import FileStorage, classes
+from models.city import City
+from models.place import Place
+from models.state import State
+
+
+class test_compact(unittest.TestCase):
+    """ Class to test compact_class and CompactRecord """
+
+    def setUp(self):
+        """ A State and its compact copy """
+        self.state = State(name="California")
+        self.compact, = compact_class(State).from_dicts(
+            [self.state.to_dict()])
+
+    def tearDown(self):
+        """ Drop what the tests stored """
+        storage.all().clear()
+        storage._FileStorage__pending.clear()
+        storage._FileStorage__reindex()
+
+    def test_class(self):
+        """ The stand-in is a slotted class named after the model """
+        cls = compact_class(State)
+        self.assertIs(cls, type(self.compact))
+        self.assertTrue(issubclass(cls, CompactRecord))
+        self.assertEqual(cls.__name__, "State")
+        self.assertFalse(hasattr(self.compact, "__dict__"))
+        self.assertIn("name", cls.__slots__)
+
+    def test_same_surface(self):
+        """ Attributes, to_dict() and str() match the model """
+        self.assertEqual(self.compact.to_dict(), self.state.to_dict())
+        self.assertEqual(self.compact.name, "California")
+        self.assertIsInstance(self.compact.created_at, datetime)
+        self.assertEqual(str(self.compact), "[State] ({}) {}".format(
+            self.state.id, self.compact.attributes()))
+
+    def test_unset_and_extra_attributes(self):
+        """ Unset columns are None, other attributes are kept aside """
+        place, = compact_class(Place).from_dicts([Place().to_dict()])
+        self.assertIsNone(place.latitude)
+        self.assertEqual(place.amenity_ids, [])
+        with self.assertRaises(AttributeError):
+            place.nickname
+        place.nickname = "home"
+        self.assertEqual(place.nickname, "home")
+        self.assertEqual(place.to_dict()["nickname"], "home")
+
+    def test_mutable_defaults(self):
+        """ Records do not share a list default """
+        first, second = compact_class(Place).from_dicts(
+            [Place().to_dict(), Place().to_dict()])
+        first.amenity_ids.append("a1")
+        self.assertEqual(first.amenity_ids, ["a1"])
+        self.assertEqual(second.amenity_ids, [])
+        self.assertEqual(compact_class(Place).defaults["amenity_ids"], [])
+
+    def test_amenities(self):
+        """ Compact Amenity records can be added to a Place """
+        from models.amenity import Amenity
+        place = compact_class(Place)()
+        amenity = compact_class(Amenity)(name="Wifi")
+        place.amenities = amenity
+        place.amenities = State()
+        self.assertEqual(place.amenity_ids, [amenity.id])
+
+    def test_new_record(self):
+        """ Records can be created like models """
+        city = compact_class(City)(name="Fresno")
+        self.assertEqual(city.name, "Fresno")
+        self.assertEqual(type(city.id), str)
+        self.assertIsInstance(city.updated_at, datetime)
+
+    def test_properties(self):
+        """ Model properties work on records """
+        storage.new(self.compact)
+        city = City(state_id=self.state.id, name="Fresno")
+        storage.new(city)
+        self.assertEqual(self.compact.cities, [city])
+
+    def test_touch(self):
+        """ Setting an attribute of a stored record marks it changed """
+        storage.new(self.compact)
+        storage._FileStorage__pending.clear()
+        self.compact.name = "Nevada"
+        self.assertIn("State." + self.state.id,
+                      storage._FileStorage__pending)
+
+    def test_reload_compact(self):
+        """ A compact storage reloads records """
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            with open(path, "w") as f:
+                json.dump({"State." + self.state.id: self.state.to_dict()}, f)
+            compact = FileStorage()
+            compact._FileStorage__file_path = path
+            compact._FileStorage__classes = {
+                name: compact_class(cls) for name, cls in classes.items()}
+            compact.reload()
+            state = compact.all(State)["State." + self.state.id]
+            self.assertIs(type(state), compact_class(State))
+            state.name = "Oregon"
+            compact.save()
+            with open(path) as f:
+                self.assertEqual(json.load(f)["State." + self.state.id]
+                                 ["name"], "Oregon")
+        finally:
+            os.remove(path)
+            os.remove(path + ".lock")
+
+
+if __name__ == "__main__":
+    unittest.main()
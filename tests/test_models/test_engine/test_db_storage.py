@@ -0,0 +1,414 @@
+#!/usr/bin/python3
+"""Defines unittests for models/engine/db_storage.py.
+The tests only run with HBNB_TYPE_STORAGE=db, e.g. against a local
+SQLite file:
+    HBNB_TYPE_STORAGE=db HBNB_DB_URL=sqlite:////tmp/hbnb.db \\
+        python3 -m unittest tests/test_models/test_engine/test_db_storage.py
+Unittest classes:
+    TestDBStorage_preload
+    TestDBStorage_get_count
+    TestDBStorage_iter_all
+    TestDBStorage_sessions
+    TestDBStorage_bulk
+    TestDBStorage_cache
+    TestDBStorage_filter_places
+"""
+import os
+import threading
+import unittest
+from os import getenv
+from unittest import mock
+from sqlalchemy import event
+from models import storage
+from models.engine.cache import CachedStorage
+from models.engine.db_storage import DBStorage
+from models.state import State
+from models.city import City
+from models.amenity import Amenity
+from models.place import Place
+from models.user import User
+
+
+@unittest.skipIf(getenv("HBNB_TYPE_STORAGE") != "db", "not using DBStorage")
+class TestDBStorage_preload(unittest.TestCase):
+    """Unittests for the loading plan of DBStorage.all"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.states = []
+        for i in range(5):
+            state = State(name="state{}".format(i))
+            storage.new(state)
+            for j in range(3):
+                storage.new(City(name="city{}".format(j),
+                                 state_id=state.id))
+            cls.states.append(state.id)
+        storage.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        for key, obj in storage.all(State).items():
+            if obj.id in cls.states:
+                storage.delete(obj)
+        storage.save()
+        storage.close()
+        storage.reload()
+
+    def setUp(self):
+        storage.close()
+        storage.reload()
+        self.queries = []
+        self.engine = storage._DBStorage__engine
+        event.listen(self.engine, "before_cursor_execute", self.count)
+
+    def tearDown(self):
+        event.remove(self.engine, "before_cursor_execute", self.count)
+
+    def count(self, conn, cursor, statement, parameters, context, many):
+        self.queries.append(statement)
+
+    def walk(self, states):
+        """Touches the cities of the test states"""
+        names = []
+        for state in states.values():
+            if state.id in self.states:
+                names.extend(city.name for city in state.cities)
+        return names
+
+    def test_lazy(self):
+        """Without a plan every state loads its cities on its own"""
+        self.assertEqual(len(self.walk(storage.all(State))), 15)
+        self.assertGreaterEqual(len(self.queries), 1 + len(self.states))
+
+    def test_preload(self):
+        """The cities come with a single extra query"""
+        names = self.walk(storage.all(State, preload=["cities"]))
+        self.assertEqual(len(names), 15)
+        self.assertEqual(len(self.queries), 2)
+
+    def test_preload_class(self):
+        """A related class can be used instead of the relationship name"""
+        self.walk(storage.all("State", preload=[City]))
+        self.assertEqual(len(self.queries), 2)
+
+    def test_preload_path(self):
+        """Dotted paths preload one level per query"""
+        states = storage.all(State, preload=["cities.places"])
+        for state in states.values():
+            for city in state.cities:
+                city.places
+        self.assertEqual(len(self.queries), 3)
+
+    def test_preload_all_classes(self):
+        """Plans that do not apply to a class are ignored"""
+        objs = storage.all(preload=["cities"])
+        self.walk({k: v for k, v in objs.items() if type(v) is State})
+        self.assertEqual(len(self.queries), 7)
+
+
+@unittest.skipIf(getenv("HBNB_TYPE_STORAGE") != "db", "not using DBStorage")
+class TestDBStorage_get_count(unittest.TestCase):
+    """Unittests for the get and count methods of DBStorage"""
+
+    def setUp(self):
+        self.state = State(name="California")
+        storage.new(self.state)
+        storage.save()
+
+    def tearDown(self):
+        storage.delete(self.state)
+        storage.save()
+
+    def test_get(self):
+        """get() is a primary key lookup"""
+        self.assertIs(storage.get(State, self.state.id), self.state)
+        self.assertIs(storage.get("State", self.state.id), self.state)
+        self.assertIsNone(storage.get(State, "missing"))
+        self.assertIsNone(storage.get("BaseModel", self.state.id))
+
+    def test_count(self):
+        """count() runs one COUNT(*) per class"""
+        states = storage.count(State)
+        self.assertEqual(states, len(storage.all(State)))
+        self.assertEqual(storage.count(), len(storage.all()))
+        self.assertEqual(storage.count("BaseModel"), 0)
+        storage.new(State(name="Nevada"))
+        storage.save()
+        self.assertEqual(storage.count("State"), states + 1)
+        for obj in storage.all(State).values():
+            if obj.name == "Nevada":
+                storage.delete(obj)
+        storage.save()
+
+
+@unittest.skipIf(getenv("HBNB_TYPE_STORAGE") != "db", "not using DBStorage")
+class TestDBStorage_iter_all(unittest.TestCase):
+    """Unittests for the keyset pagination of DBStorage"""
+
+    def setUp(self):
+        self.states = [State(name=name) for name in "bacabd"]
+        for state in self.states:
+            storage.new(state)
+        storage.save()
+        self.ids = {state.id for state in self.states}
+
+    def tearDown(self):
+        for state in self.states:
+            storage.delete(state)
+        storage.save()
+
+    def walk(self, order_by, limit):
+        """Returns the test states, one page of limit objects at a time"""
+        found, after = [], None
+        while True:
+            page = list(storage.iter_all(State, order_by, after, limit))
+            if not page:
+                return found
+            found.extend(s for s in page if s.id in self.ids)
+            after = page[-1].id
+
+    def test_by_id(self):
+        """Pages follow the ids"""
+        self.assertEqual(self.walk("id", 4),
+                         sorted(self.states, key=lambda s: s.id))
+
+    def test_by_name(self):
+        """Pages follow the names, ties broken on id"""
+        self.assertEqual(self.walk("name", 2),
+                         sorted(self.states, key=lambda s: (s.name, s.id)))
+
+    def test_stream(self):
+        """stream() walks a class in id order, or every class"""
+        found = [s for s in storage.stream("State") if s.id in self.ids]
+        self.assertEqual(found, sorted(self.states, key=lambda s: s.id))
+        self.assertEqual(len([s for s in storage.stream()
+                              if s.id in self.ids]), len(self.states))
+        self.assertEqual(list(storage.stream("BaseModel")), [])
+
+    def test_missing_cursor(self):
+        """A cursor on another column must be an existing id"""
+        with self.assertRaises(ValueError):
+            storage.iter_all(State, "name", "missing")
+
+
+@unittest.skipIf(getenv("HBNB_TYPE_STORAGE") != "db", "not using DBStorage")
+class TestDBStorage_sessions(unittest.TestCase):
+    """Unittests for the connection pool and the Session lifecycle"""
+
+    def test_pool_settings(self):
+        """The pool is tuned by the HBNB_DB_POOL_* variables"""
+        env = {"HBNB_DB_POOL_SIZE": "3", "HBNB_DB_MAX_OVERFLOW": "2",
+               "HBNB_DB_POOL_RECYCLE": "60", "HBNB_DB_POOL_TIMEOUT": "7"}
+        with mock.patch.dict(os.environ, env):
+            os.environ.pop("HBNB_ENV", None)
+            pool = DBStorage()._DBStorage__engine.pool
+        self.assertEqual(pool.size(), 3)
+        self.assertEqual(pool.timeout(), 7)
+        self.assertEqual(pool._recycle, 60)
+
+    def test_session_per_thread(self):
+        """Each thread works with its own Session"""
+        registry = storage._DBStorage__session
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(registry()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(sessions[0], registry())
+
+    def test_close(self):
+        """close() ends the Session of the thread, not the registry"""
+        state = State(name="Oregon")
+        storage.new(state)
+        storage.save()
+        registry = storage._DBStorage__session
+        session = registry()
+        storage.close()
+        self.assertIsNot(registry(), session)
+        found = storage.get(State, state.id)
+        self.assertEqual(found.name, "Oregon")
+        self.assertIsNot(found, state)
+        storage.delete(found)
+        storage.save()
+
+
+@unittest.skipIf(getenv("HBNB_TYPE_STORAGE") != "db", "not using DBStorage")
+class TestDBStorage_bulk(unittest.TestCase):
+    """Unittests for the bulk insert of DBStorage"""
+
+    def setUp(self):
+        self.queries = []
+        self.engine = storage._DBStorage__engine
+        event.listen(self.engine, "before_cursor_execute", self.count)
+
+    def tearDown(self):
+        event.remove(self.engine, "before_cursor_execute", self.count)
+
+    def count(self, conn, cursor, statement, parameters, context, many):
+        if statement.startswith("INSERT"):
+            self.queries.append((statement.split()[2], many))
+
+    def test_bulk(self):
+        """One executemany INSERT per table, parents first"""
+        state = State(name="Texas")
+        cities = [City(name="c{}".format(i), state_id=state.id)
+                  for i in range(50)]
+        self.assertEqual(storage.bulk_new(cities + [state]), 51)
+        storage.bulk_save()
+        self.assertEqual(self.queries, [("states", False), ("cities", True)])
+        storage.close()
+        found = storage.get(State, state.id)
+        self.assertEqual(found.name, "Texas")
+        self.assertEqual(len(found.cities), 50)
+        storage.delete(found)
+        storage.save()
+
+
+@unittest.skipIf(getenv("HBNB_TYPE_STORAGE") != "db", "not using DBStorage")
+class TestDBStorage_cache(unittest.TestCase):
+    """Unittests for a CachedStorage in front of DBStorage"""
+
+    def setUp(self):
+        self.cache = CachedStorage(storage)
+        self.state = State(name="Utah")
+        self.cache.new(self.state)
+        self.cache.new(City(name="Provo", state_id=self.state.id))
+        self.cache.save()
+        storage.close()
+
+    def tearDown(self):
+        self.cache.delete(self.cache.get(State, self.state.id))
+        self.cache.save()
+
+    def test_across_close(self):
+        """Hits after close() need no Session and no query"""
+        states = self.cache.all(State, preload=["cities"])
+        self.cache.get(State, self.state.id)
+        storage.close()
+        queries = []
+
+        def count(conn, cursor, statement, parameters, context, many):
+            queries.append(statement)
+
+        engine = storage._DBStorage__engine
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            again = self.cache.all(State, preload=["cities"])
+            state = again["State." + self.state.id]
+            self.assertEqual([c.name for c in state.cities], ["Provo"])
+            self.assertEqual(self.cache.get(State, self.state.id).name,
+                             "Utah")
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+        self.assertEqual(queries, [])
+        self.assertEqual(self.cache.hits, 2)
+        self.assertEqual(states.keys(), again.keys())
+        state.name = "Deseret"
+        self.cache.new(state)
+        self.cache.save()
+        storage.close()
+        self.assertEqual(storage.get(State, self.state.id).name, "Deseret")
+
+    def test_relationship_on_hit(self):
+        """Relationships not loaded on the miss load on a hit"""
+        self.cache.get(State, self.state.id)
+        storage.close()
+        state = self.cache.get(State, self.state.id)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual([c.name for c in state.cities], ["Provo"])
+        self.assertIs(self.cache.get(State, self.state.id), state)
+
+    def test_hit_without_merge(self):
+        """Hits hand out the cached copy, in the Session of the caller"""
+        self.cache.all(State)
+        storage.close()
+        first = self.cache.all(State)["State." + self.state.id]
+        storage.close()
+        second = self.cache.all(State)["State." + self.state.id]
+        self.assertIs(first, second)
+        self.assertEqual([c.name for c in second.cities], ["Provo"])
+        found = []
+
+        def other():
+            state = self.cache.get(State, self.state.id)
+            found.append((state, [c.name for c in state.cities]))
+            storage.close()
+
+        self.cache.get(State, self.state.id)
+        thread = threading.Thread(target=other)
+        thread.start()
+        thread.join()
+        self.assertIsNot(found[0][0], self.cache.get(State, self.state.id))
+        self.assertEqual(found[0][1], ["Provo"])
+
+    def test_hit_after_rollback(self):
+        """A copy expired by a rollback is loaded again"""
+        self.cache.get(State, self.state.id)
+        storage.close()
+        self.cache.get(State, self.state.id)
+        storage._DBStorage__session.rollback()
+        storage.close()
+        self.assertEqual(self.cache.get(State, self.state.id).name, "Utah")
+        self.assertEqual(self.cache.misses, 2)
+
+
+@unittest.skipIf(getenv("HBNB_TYPE_STORAGE") != "db", "not using DBStorage")
+class TestDBStorage_filter_places(unittest.TestCase):
+    """Unittests for DBStorage.filter_places"""
+
+    def setUp(self):
+        self.user = User(email="a@b.c", password="pwd")
+        self.state = State(name="Utah")
+        self.cities = [City(name=name, state_id=self.state.id)
+                       for name in ("Provo", "Ogden")]
+        self.wifi = Amenity(name="Wifi")
+        self.places = [Place(name=str(i), user_id=self.user.id,
+                             city_id=self.cities[i % 2].id,
+                             price_by_night=i * 100)
+                       for i in range(4)]
+        self.places[0].amenities.append(self.wifi)
+        self.places[3].amenities.append(self.wifi)
+        for obj in [self.user, self.state, self.wifi] + self.cities:
+            storage.new(obj)
+        for place in self.places:
+            storage.new(place)
+        storage.save()
+        storage.close()
+
+    def tearDown(self):
+        for obj in [self.state, self.wifi, self.user]:
+            storage.delete(storage.get(type(obj), obj.id))
+        storage.save()
+
+    def ids(self, places):
+        """Returns the names of the test places"""
+        return [place.name for place in places if place.user_id ==
+                self.user.id]
+
+    def test_filter(self):
+        """Every predicate narrows the result, sorted by id"""
+        places = storage.filter_places()
+        self.assertEqual(places, sorted(places, key=lambda p: p.id))
+        self.assertCountEqual(self.ids(places), ["0", "1", "2", "3"])
+        self.assertCountEqual(self.ids(storage.filter_places(
+            city_ids=[self.cities[1].id])), ["1", "3"])
+        self.assertCountEqual(self.ids(storage.filter_places(
+            city_ids=[self.cities[1].id], min_price=200)), ["3"])
+        self.assertCountEqual(self.ids(storage.filter_places(
+            amenity_ids=[self.wifi.id], max_price=200)), ["0"])
+        self.assertEqual(storage.filter_places(city_ids=[]), [])
+
+    def test_nearby_antimeridian(self):
+        """nearby() finds the places on both sides of 180"""
+        place = storage.get(Place, self.places[0].id)
+        place.latitude, place.longitude = -17.0, 179.9
+        place = storage.get(Place, self.places[1].id)
+        place.latitude, place.longitude = -17.0, -179.9
+        storage.save()
+        self.assertEqual(self.ids(storage.nearby(-17, 179.95, 20)),
+                         ["0", "1"])
+        self.assertEqual(self.ids(storage.nearby(-17, -179.95, 20)),
+                         ["1", "0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
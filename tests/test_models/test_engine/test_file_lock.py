@@ -0,0 +1,160 @@
+#!/usr/bin/python3
+""" Module for testing FileStorage shared by several processes"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from models import storage
+from models.engine import file_storage
+from models.engine.file_storage import FileStorage
+from models.state import State
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)))))
+# each worker process adds STATES States, reloading and saving each time
+WORKER = """
+import sys
+import models
+from models.state import State
+for i in range({states}):
+    models.storage.reload()
+    state = State(name="{{}}-{{}}".format(sys.argv[1], i))
+    models.storage.new(state)
+    models.storage.save()
+"""
+
+
+@unittest.skipIf(type(storage) is not FileStorage, "not using FileStorage")
+class test_file_lock(unittest.TestCase):
+    """ Class to test the locked, merged and generation checked saves """
+
+    def setUp(self):
+        """ Point the storage at a file of a temporary directory """
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "file.json")
+        storage._FileStorage__file_path = self.path
+        self.clear()
+        storage.reload()
+
+    def tearDown(self):
+        """ Restore the storage and remove the temporary files """
+        self.clear()
+        del storage._FileStorage__file_path
+        for name in os.listdir(self.tmp):
+            os.remove(os.path.join(self.tmp, name))
+        os.rmdir(self.tmp)
+
+    def clear(self):
+        """ Empty the objects shared by every FileStorage """
+        storage.all().clear()
+        storage._FileStorage__pending.clear()
+        storage._FileStorage__reindex()
+
+    def run_workers(self, count, states, **env):
+        """ Runs count worker processes at once in the directory of the
+        file, each adding states States """
+        code = WORKER.format(states=states)
+        env = dict(os.environ, PYTHONPATH=ROOT, **env)
+        env.pop("HBNB_TYPE_STORAGE", None)
+        workers = [subprocess.Popen([sys.executable, "-c", code, str(i)],
+                                    cwd=self.tmp, env=env,
+                                    stderr=subprocess.PIPE)
+                   for i in range(count)]
+        for worker in workers:
+            _, err = worker.communicate(timeout=120)
+            self.assertEqual(worker.returncode, 0, err.decode())
+
+    def saved(self):
+        """ Keys of the file """
+        with open(self.path) as f:
+            return set(json.load(f))
+
+    def test_reload_skips_unchanged_file(self):
+        """ reload() reads the file only after another process saved it """
+        state = State(name="A")
+        storage.new(state)
+        storage.save()
+        with mock.patch.object(file_storage, "iter_items") as read:
+            storage.reload()
+            storage.close()
+        read.assert_not_called()
+        self.assertIs(storage.get(State, state.id), state)
+        self.run_workers(1, 1)
+        storage.reload()
+        self.assertIsNot(storage.get(State, state.id), state)
+        self.assertEqual(storage.count(State), 2)
+
+    def test_generation(self):
+        """ Every save bumps the generation of the lock file """
+        storage.save()
+        with open(self.path + ".lock") as f:
+            first = int(f.read())
+        storage.save()
+        with open(self.path + ".lock") as f:
+            self.assertEqual(int(f.read()), first + 1)
+
+    def test_save_merges(self):
+        """ A save keeps what others saved since, and the changes made
+        here, deletions included, win """
+        kept, changed, deleted = State(name="A"), State(name="B"), \
+            State(name="C")
+        for state in (kept, changed, deleted):
+            storage.new(state)
+        storage.save()
+        self.run_workers(1, 2)
+        changed.name = "D"
+        storage.delete(deleted)
+        storage.save()
+        names = {value["name"] for value in json.load(open(self.path))
+                 .values()}
+        self.assertEqual(names, {"A", "D", "0-0", "0-1"})
+        self.assertEqual(storage.count(State), 4)
+
+    def test_atomic_write(self):
+        """ A failing save leaves the file as it was """
+        storage.new(State(name="A"))
+        storage.save()
+        before = self.saved()
+        storage.new(State(name="B"))
+        with mock.patch.object(file_storage.json, "dumps",
+                               side_effect=OSError):
+            with self.assertRaises(OSError):
+                storage.save()
+        self.assertEqual(self.saved(), before)
+        self.assertEqual(os.listdir(self.tmp).count("file.json"), 1)
+        self.assertEqual([name for name in os.listdir(self.tmp)
+                          if name.endswith(".tmp")], [])
+
+    def test_stress(self):
+        """ Processes saving at once lose no object """
+        self.run_workers(6, 20)
+        self.assertEqual(len(self.saved()), 120)
+
+    def test_stress_journal(self):
+        """ Processes appending to one journal lose no object """
+        self.run_workers(6, 20, HBNB_FILE_JOURNAL="1")
+        storage._FileStorage__journal = file_storage.Journal(
+            self.path + ".journal")
+        try:
+            storage.reload()
+            self.assertEqual(storage.count(State), 120)
+        finally:
+            del storage._FileStorage__journal
+
+    def test_without_pread(self):
+        """ The generation needs neither pread nor pwrite (Windows) """
+        storage.save()
+        with mock.patch.object(file_storage, "fcntl", None), \
+                mock.patch.object(os, "pread", side_effect=AttributeError), \
+                mock.patch.object(os, "pwrite", side_effect=AttributeError):
+            storage.save()
+            storage.reload()
+        with open(self.path + ".lock") as f:
+            self.assertEqual(int(f.read()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ import unittest
 from models.base_model import BaseModel
 from models import storage
 import os
+import json
 
 
 class test_fileStorage(unittest.TestCase):
@@ -16,6 +17,7 @@ class test_fileStorage(unittest.TestCase):
             del_list.append(key)
         for key in del_list:
             del storage._FileStorage__objects[key]
+        storage._FileStorage__reindex()
 
     def tearDown(self):
         """ Remove storage file at end of tests """
@@ -23,6 +25,8 @@ class test_fileStorage(unittest.TestCase):
             os.remove('file.json')
         except:
             pass
+        if os.path.exists('file.json.lock'):
+            os.remove('file.json.lock')
 
     def test_obj_list_empty(self):
         """ __objects is initially empty """
@@ -106,4 +110,242 @@ class test_fileStorage(unittest.TestCase):
         """ FileStorage object storage created """
         from models.engine.file_storage import FileStorage
         print(type(storage))
-        self.assertEqual(type(storage), FileStorage)
\ No newline at end of file
+        self.assertEqual(type(storage), FileStorage)
+
+    def test_all_by_class(self):
+        """ all(cls) only returns objects of that class """
+        from models.state import State
+        from models.city import City
+        state = State()
+        city = City()
+        storage.new(state)
+        storage.new(city)
+        self.assertEqual(list(storage.all(State).values()), [state])
+        self.assertEqual(list(storage.all('City').values()), [city])
+
+    def test_all_by_class_after_delete(self):
+        """ Deleted objects leave the class index """
+        from models.state import State
+        state = State()
+        storage.new(state)
+        storage.delete(state)
+        self.assertEqual(storage.all(State), {})
+
+    def test_all_by_class_after_reload(self):
+        """ Reloaded objects are indexed by class """
+        from models.state import State
+        state = State()
+        storage.new(state)
+        storage.save()
+        del storage._FileStorage__objects['State.' + state.id]
+        storage._FileStorage__reindex()
+        storage.reload()
+        self.assertIn('State.' + state.id, storage.all(State))
+
+    def test_reload_batches_classes(self):
+        """ reload() builds the objects with one from_dicts() per class
+        and keeps the order of the file """
+        from unittest import mock
+        from models.state import State
+        objs = [State(), BaseModel(), State(), BaseModel()]
+        for obj in objs:
+            storage.new(obj)
+        storage.save()
+        keys = list(storage.all())
+        storage.all().clear()
+        storage._FileStorage__reindex()
+        with mock.patch.object(State, "from_dicts",
+                               wraps=State.from_dicts) as from_dicts:
+            storage.reload()
+        self.assertEqual(from_dicts.call_count, 1)
+        self.assertEqual(list(storage.all()), keys)
+        self.assertEqual([type(obj) for obj in storage.all().values()],
+                         [State, BaseModel, State, BaseModel])
+
+    def test_get(self):
+        """ get() returns one object from its class and id """
+        from models.state import State
+        state = State()
+        storage.new(state)
+        self.assertIs(storage.get(State, state.id), state)
+        self.assertIs(storage.get('State', state.id), state)
+        self.assertIsNone(storage.get('City', state.id))
+        self.assertIsNone(storage.get(State, "missing"))
+
+    def test_count(self):
+        """ count() counts all the objects or the objects of a class """
+        from models.state import State
+        states = [State(), State()]
+        for state in states:
+            storage.new(state)
+        storage.new(BaseModel())
+        self.assertEqual(storage.count(), 3)
+        self.assertEqual(storage.count(State), 2)
+        self.assertEqual(storage.count('BaseModel'), 1)
+        self.assertEqual(storage.count('City'), 0)
+        storage.delete(states[0])
+        self.assertEqual(storage.count(State), 1)
+
+    def test_stream(self):
+        """ stream() walks the objects in the order of all() """
+        from models.state import State
+        objs = [State(), BaseModel(), State()]
+        for obj in objs:
+            storage.new(obj)
+        self.assertEqual(list(storage.stream()),
+                         list(storage.all().values()))
+        self.assertEqual(list(storage.stream(State)), [objs[0], objs[2]])
+        self.assertEqual(list(storage.stream('City')), [])
+
+    def test_iter_all(self):
+        """ iter_all() walks a class in id order, page by page """
+        from models.state import State
+        states = [State() for i in range(7)]
+        for state in states:
+            storage.new(state)
+        storage.new(BaseModel())
+        ids = sorted(state.id for state in states)
+        self.assertEqual([s.id for s in storage.iter_all(State)], ids)
+        pages, after = [], None
+        while True:
+            page = list(storage.iter_all('State', after=after, limit=3))
+            if not page:
+                break
+            pages.append([s.id for s in page])
+            after = page[-1].id
+        self.assertEqual(pages, [ids[:3], ids[3:6], ids[6:]])
+
+    def test_iter_all_order_by(self):
+        """ iter_all() sorts on any attribute, ties broken on id """
+        from models.state import State
+        states = [State(name=name) for name in "bacab"] + [State()]
+        for state in states:
+            storage.new(state)
+        expected = sorted(states, key=lambda s: (s.name is not None,
+                                                 s.name or "", s.id))
+        self.assertEqual(list(storage.iter_all(State, "name")), expected)
+        page = list(storage.iter_all(State, "name", expected[2].id, 2))
+        self.assertEqual(page, expected[3:5])
+        with self.assertRaises(ValueError):
+            list(storage.iter_all(State, "name", "missing"))
+
+    def test_iter_all_follows_changes(self):
+        """ The sorted index is rebuilt after the class changes """
+        from models.state import State
+        first, second = State(name="a"), State(name="b")
+        storage.new(first)
+        storage.new(second)
+        self.assertEqual(list(storage.iter_all(State, "name")),
+                         [first, second])
+        first.name = "c"
+        self.assertEqual(list(storage.iter_all(State, "name")),
+                         [second, first])
+        storage.delete(second)
+        self.assertEqual(list(storage.iter_all(State, "name")), [first])
+
+    def test_bulk_new(self):
+        """ bulk_new() indexes the objects, bulk_save() writes them once """
+        from unittest import mock
+        from models.state import State
+        from models.city import City
+        state = State()
+        cities = [City(state_id=state.id) for i in range(3)]
+        self.assertEqual(storage.bulk_new([state] + cities), 4)
+        self.assertEqual(storage.count(City), 3)
+        self.assertCountEqual(state.cities, cities)
+        with mock.patch.object(storage, "save") as save:
+            storage.bulk_save()
+        save.assert_called_once_with()
+        storage.bulk_save()
+        with open('file.json') as f:
+            self.assertEqual(len(json.load(f)), 4)
+
+    def test_version(self):
+        """ version follows writes and files changed by others """
+        from models.state import State
+        state = State()
+        version = storage.version
+        storage.new(state)
+        state.name = "Nevada"
+        storage.save()
+        self.assertEqual(storage.version, version + 2)
+        storage.reload()
+        self.assertEqual(storage.version, version + 2)
+        with open('file.json') as f:
+            saved = json.load(f)
+        saved['State.' + state.id]['name'] = "Utah"
+        with open('file.json', 'w') as f:
+            json.dump(saved, f)
+        storage.reload()
+        self.assertEqual(storage.version, version + 3)
+        self.assertEqual(storage.get(State, state.id).name, "Utah")
+
+    def test_related(self):
+        """ related() returns the objects holding a foreign key """
+        from models.state import State
+        from models.city import City
+        state = State()
+        storage.new(state)
+        cities = [City(state_id=state.id), City(state_id=state.id)]
+        for city in cities:
+            storage.new(city)
+        storage.new(City(state_id="other"))
+        self.assertCountEqual(storage.related(City, "state_id", state.id),
+                              cities)
+        self.assertCountEqual(state.cities, cities)
+
+    def test_related_follows_updates(self):
+        """ Foreign key changes saved through new() move the object """
+        from models.state import State
+        from models.city import City
+        first, second = State(), State()
+        city = City(state_id=first.id)
+        storage.new(city)
+        city.state_id = second.id
+        storage.new(city)
+        self.assertEqual(first.cities, [])
+        self.assertEqual(second.cities, [city])
+        storage.delete(city)
+        self.assertEqual(second.cities, [])
+
+    def test_related_follows_setattr(self):
+        """ Foreign key changes saved by save() alone move the object """
+        from models.state import State
+        from models.city import City
+        first, second = State(), State()
+        city = City(state_id=first.id)
+        storage.new(city)
+        storage.save()
+        city.state_id = second.id
+        storage.save()
+        self.assertEqual(first.cities, [])
+        self.assertEqual(second.cities, [city])
+
+    def test_place_reviews(self):
+        """ Place.reviews uses the place_id index """
+        from models.place import Place
+        from models.review import Review
+        place = Place()
+        review = Review(place_id=place.id, user_id="u")
+        storage.new(review)
+        self.assertEqual(place.reviews, [review])
+        self.assertEqual(storage.related("Review", "user_id", "u"), [review])
+
+    def test_save_reencodes_changed_objects_only(self):
+        """ save() reuses the JSON of objects that did not change """
+        from unittest import mock
+        first, second = BaseModel(), BaseModel()
+        storage.new(first)
+        storage.new(second)
+        storage.save()
+        first.name = "changed"
+        with mock.patch.object(BaseModel, "to_dict",
+                               autospec=True,
+                               side_effect=BaseModel.to_dict) as to_dict:
+            storage.save()
+        self.assertEqual([c.args[0] for c in to_dict.call_args_list],
+                         [first])
+        with open('file.json') as f:
+            saved = json.load(f)
+        self.assertEqual(saved['BaseModel.' + first.id]['name'], "changed")
+        self.assertEqual(saved['BaseModel.' + second.id], second.to_dict())
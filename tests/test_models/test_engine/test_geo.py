@@ -0,0 +1,173 @@
+#!/usr/bin/python3
+""" Module for testing the geospatial helpers and index"""
+import unittest
+import os
+import random
+import tempfile
+from models import storage
+from models.engine import geo
+from models.place import Place
+
+
+class test_geometry(unittest.TestCase):
+    """ Class to test the distance and box helpers """
+
+    def test_haversine(self):
+        """ Paris to London is about 344 km """
+        self.assertAlmostEqual(geo.haversine(48.8566, 2.3522,
+                                             51.5074, -0.1278), 343.6, 0)
+
+    def test_bounding_box(self):
+        """ Points on the circle fall inside the box """
+        min_lat, min_lon, max_lat, max_lon = geo.bounding_box(60, 10, 50)
+        for lat, lon in ((60.449, 10), (59.551, 10), (60, 10.899),
+                         (60, 9.101)):
+            self.assertLess(geo.haversine(60, 10, lat, lon), 50)
+            self.assertTrue(min_lat <= lat <= max_lat)
+            self.assertTrue(min_lon <= lon <= max_lon)
+        self.assertEqual(geo.bounding_box(89.99, 0, 10)[1::2], (-180, 180))
+
+    def test_antimeridian(self):
+        """ A box crossing 180 is split in two, wrapped to -180 """
+        boxes = geo.bounding_boxes(0, 179.9, 50)
+        self.assertEqual(len(boxes), 2)
+        self.assertEqual((boxes[0][3], boxes[1][1]), (180, -180))
+        self.assertTrue(boxes[1][1] <= -179.8 <= boxes[1][3])
+        self.assertEqual(len(geo.bounding_boxes(0, -179.9, 50)), 2)
+        self.assertEqual(geo.bounding_boxes(60, 10, 50),
+                         [geo.bounding_box(60, 10, 50)])
+        self.assertEqual(geo.bounding_boxes(89.99, 179, 10),
+                         [geo.bounding_box(89.99, 179, 10)])
+
+    def test_coordinates(self):
+        """ Strings are converted, unusable values are None """
+        self.assertEqual(geo.coordinates("1.5", 2), (1.5, 2.0))
+        for lat, lon in ((None, 1), ("x", 1), (91, 0), (0, 181)):
+            self.assertIsNone(geo.coordinates(lat, lon))
+
+
+class test_geo_index(unittest.TestCase):
+    """ Class to test GeoIndex """
+
+    def setUp(self):
+        """ Index random points around San Francisco """
+        rand = random.Random(1)
+        self.points = {"p{:03d}".format(i): (37.7 + rand.uniform(-1, 1),
+                                             -122.4 + rand.uniform(-1, 1))
+                       for i in range(500)}
+        self.index = geo.GeoIndex(cell_size=0.1)
+        for _id, (lat, lon) in self.points.items():
+            self.index.add(_id, lat, lon)
+
+    def test_nearby_matches_brute_force(self):
+        """ nearby() returns what ranking every point returns """
+        brute = geo.rank(((_id, lat, lon) for _id, (lat, lon)
+                          in self.points.items()), 37.7, -122.4, 25)
+        self.assertEqual(self.index.nearby(37.7, -122.4, 25), brute)
+        self.assertEqual(self.index.nearby(37.7, -122.4, 25, limit=5),
+                         brute[:5])
+        self.assertEqual(self.index.nearby(37.7, -122.4, 5000),
+                         geo.rank(((_id, lat, lon) for _id, (lat, lon)
+                                   in self.points.items()),
+                                  37.7, -122.4, 5000))
+
+    def test_antimeridian(self):
+        """ nearby() finds the points on both sides of 180 """
+        self.index.add("east", 0, 179.95)
+        self.index.add("west", 0, -179.95)
+        for lon in (179.99, -179.99):
+            self.assertEqual(sorted(_id for distance, _id
+                                    in self.index.nearby(0, lon, 20)),
+                             ["east", "west"])
+
+    def test_within(self):
+        """ within() returns the sorted ids inside the box """
+        expected = sorted(_id for _id, (lat, lon) in self.points.items()
+                          if 37.5 <= lat <= 38 and -122.5 <= lon <= -122)
+        self.assertEqual(self.index.within(37.5, -122.5, 38, -122),
+                         expected)
+
+    def test_move_and_remove(self):
+        """ Points can move, be removed or lose their coordinates """
+        self.index.add("p000", 10, 10)
+        self.assertEqual(self.index.nearby(10, 10, 1), [(0.0, "p000")])
+        self.index.add("p000", None, 10)
+        self.assertEqual(self.index.nearby(10, 10, 1), [])
+        self.index.remove("p001")
+        self.index.remove("missing")
+        self.assertEqual(len(self.index), 498)
+
+
+class test_storage_geo(unittest.TestCase):
+    """ Class to test FileStorage.nearby and within_box """
+
+    def setUp(self):
+        """ Store three Places """
+        self.clear()
+        self.near = Place(latitude=37.70, longitude=-122.40)
+        self.close = Place(latitude="37.71", longitude="-122.40")
+        self.far = Place(latitude=40.0, longitude=-74.0)
+        for place in (self.near, self.close, self.far, Place()):
+            storage.new(place)
+
+    def tearDown(self):
+        """ Drop the stored Places """
+        self.clear()
+
+    def clear(self):
+        """ Empty the storage and its indexes """
+        storage.all().clear()
+        storage._FileStorage__pending.clear()
+        storage._FileStorage__reindex()
+
+    def test_nearby(self):
+        """ Places come nearest first """
+        self.assertEqual(storage.nearby(37.7, -122.4, 10),
+                         [self.near, self.close])
+        self.assertEqual(storage.nearby(37.72, -122.4, 10, limit=1),
+                         [self.close])
+
+    def test_antimeridian(self):
+        """ Places on both sides of 180 are found """
+        east = Place(latitude=-17.0, longitude=179.9)
+        west = Place(latitude=-17.0, longitude=-179.9)
+        storage.new(east)
+        storage.new(west)
+        self.assertEqual(storage.nearby(-17, 179.95, 20), [east, west])
+        self.assertEqual(storage.nearby(-17, -179.95, 20), [west, east])
+
+    def test_within_box(self):
+        """ Places in the box come sorted by id """
+        self.assertEqual(storage.within_box(37, -123, 38, -122),
+                         sorted([self.near, self.close], key=lambda p: p.id))
+
+    def test_follows_setattr(self):
+        """ The index follows attributes set then saved by save() """
+        from unittest import mock
+        from models.engine.file_storage import FileStorage
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            with mock.patch.object(FileStorage, "_FileStorage__file_path",
+                                   path):
+                storage.save()
+                self.near.latitude = 40.0
+                storage.save()
+        finally:
+            for name in (path, path + ".lock"):
+                if os.path.exists(name):
+                    os.remove(name)
+        self.assertEqual(storage.nearby(40, -122.4, 5), [self.near])
+        self.assertEqual(storage.nearby(37.7, -122.4, 10), [self.close])
+
+    def test_follows_updates(self):
+        """ The index follows new() and delete() """
+        self.far.latitude, self.far.longitude = 37.70, -122.41
+        storage.new(self.far)
+        self.assertEqual(len(storage.nearby(37.7, -122.4, 10)), 3)
+        storage.delete(self.near)
+        self.assertNotIn(self.near, storage.nearby(37.7, -122.4, 10))
+
+
+if __name__ == "__main__":
+    unittest.main()
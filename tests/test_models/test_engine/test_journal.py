@@ -0,0 +1,153 @@
+#!/usr/bin/python3
+""" Module for testing the journaled file storage"""
+import unittest
+import os
+import tempfile
+from models import storage
+from models.engine.journal import Journal
+from models.state import State
+
+
+class test_journal(unittest.TestCase):
+    """ Class to test FileStorage in journaled mode """
+
+    def setUp(self):
+        """ Point the storage at a temporary snapshot and journal """
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "file.json")
+        self.journal = Journal(self.path + ".journal")
+        storage._FileStorage__file_path = self.path
+        storage._FileStorage__journal = self.journal
+        self.clear()
+
+    def tearDown(self):
+        """ Restore the storage and remove the temporary files """
+        self.clear()
+        del storage._FileStorage__file_path
+        del storage._FileStorage__journal
+        for name in os.listdir(self.tmp):
+            os.remove(os.path.join(self.tmp, name))
+        os.rmdir(self.tmp)
+
+    def clear(self):
+        """ Empty the objects shared by every FileStorage """
+        storage.all().clear()
+        storage._FileStorage__pending.clear()
+        storage._FileStorage__reindex()
+
+    def lines(self):
+        """ Lines of the journal file """
+        with open(self.journal.path) as f:
+            return f.read().splitlines()
+
+    def test_first_save_writes_snapshot(self):
+        """ Without a snapshot, save() writes one """
+        storage.new(State(name="A"))
+        storage.save()
+        self.assertTrue(os.path.exists(self.path))
+        self.assertEqual(self.journal.records, 0)
+
+    def test_save_appends(self):
+        """ Later saves append one record per change """
+        state = State(name="A")
+        storage.new(state)
+        storage.save()
+        state.name = "B"
+        storage.new(state)
+        other = State(name="C")
+        storage.new(other)
+        storage.save()
+        storage.delete(other)
+        storage.save()
+        self.assertEqual(len(self.lines()), 3)
+        self.clear()
+        storage.reload()
+        self.assertEqual(list(storage.all(State)), ["State." + state.id])
+        self.assertEqual(storage.all()["State." + state.id].name, "B")
+
+    def test_truncated_tail_is_dropped(self):
+        """ A record cut short by a crash is ignored on reload """
+        first, second = State(name="A"), State(name="B")
+        storage.new(first)
+        storage.save()
+        storage.new(second)
+        storage.save()
+        with open(self.journal.path, "r+") as f:
+            f.truncate(os.path.getsize(self.journal.path) - 10)
+        self.clear()
+        storage.reload()
+        self.assertEqual(list(storage.all()), ["State." + first.id])
+        storage.new(second)
+        storage.save()
+        self.clear()
+        storage.reload()
+        self.assertEqual(len(storage.all()), 2)
+
+    def test_unterminated_tail_is_kept(self):
+        """ A complete last record missing its newline is replayed """
+        storage.new(State(name="A"))
+        storage.save()
+        state = State(name="B")
+        storage.new(state)
+        storage.save()
+        with open(self.journal.path, "r+") as f:
+            f.truncate(os.path.getsize(self.journal.path) - 1)
+        self.clear()
+        storage.reload()
+        self.assertIn("State." + state.id, storage.all())
+        storage.new(State(name="C"))
+        storage.save()
+        self.assertEqual(len(self.lines()), 2)
+
+    def test_reload_only_reads(self):
+        """ Readers leave an unterminated tail to the next save() """
+        storage.new(State(name="A"))
+        storage.save()
+        state = State(name="B")
+        storage.new(state)
+        storage.save()
+        with open(self.journal.path, "r+") as f:
+            f.truncate(os.path.getsize(self.journal.path) - 1)
+        with open(self.journal.path) as f:
+            damaged = f.read()
+        for _ in range(2):
+            self.clear()
+            storage.reload()
+            self.assertIn("State." + state.id, storage.all())
+        with open(self.journal.path) as f:
+            self.assertEqual(f.read(), damaged)
+        with open(self.journal.path, "a") as f:
+            f.write("\n\n")
+        self.clear()
+        storage.reload()
+        self.assertIn("State." + state.id, storage.all())
+
+    def test_corrupt_record_raises(self):
+        """ A damaged record before the tail is an error """
+        storage.new(State(name="A"))
+        storage.save()
+        with open(self.journal.path, "w") as f:
+            f.write("{oops\n{}\n")
+        with self.assertRaises(ValueError):
+            storage.reload()
+
+    def test_compaction(self):
+        """ The journal is folded into the snapshot past the limit """
+        storage._FileStorage__journal_limit = 3
+        try:
+            storage.new(State(name="A"))
+            storage.save()
+            for name in "BCD":
+                storage.new(State(name=name))
+                storage.save()
+            self.assertEqual(self.journal.records, 0)
+            self.assertEqual(self.lines(), [])
+            self.clear()
+            storage.reload()
+            self.assertEqual(len(storage.all()), 4)
+        finally:
+            del storage._FileStorage__journal_limit
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+""" Module for testing the incremental JSON reader"""
+import unittest
+import json
+from io import StringIO
+from models.engine.json_stream import iter_items
+
+
+class test_iter_items(unittest.TestCase):
+    """ Class to test iter_items """
+
+    def items(self, text, chunk_size=4):
+        """ (key, value, text) tuples read from a string """
+        return list(iter_items(StringIO(text), chunk_size))
+
+    def test_matches_json_load(self):
+        """ Members come out as json.load() reads them """
+        data = {"State.1": {"name": "A", "n": 12345, "f": 1.5e3},
+                "City.2": {"name": "B \"q\" é", "l": [1, {"x": None}]},
+                "Empty": {}}
+        for chunk_size in (1, 3, 7, 1 << 16):
+            items = self.items(json.dumps(data), chunk_size)
+            self.assertEqual({k: v for k, v, _ in items}, data)
+
+    def test_text_of_values(self):
+        """ The JSON text of each value is returned as read """
+        items = self.items(' { "a" : {"x": 1} ,"b":[1, 2]}\n')
+        self.assertEqual([t for _, _, t in items], ['{"x": 1}', '[1, 2]'])
+
+    def test_number_across_chunks(self):
+        """ A number cut by a chunk boundary is read whole """
+        self.assertEqual(self.items('{"a": 1234567}', 8)[0][1], 1234567)
+
+    def test_empty_object(self):
+        """ An empty object has no members """
+        self.assertEqual(self.items("{ }"), [])
+
+    def test_empty_file(self):
+        """ An empty file is a ValueError, as with json.load() """
+        with self.assertRaises(ValueError):
+            self.items("")
+
+    def test_malformed(self):
+        """ Malformed objects are ValueErrors """
+        for text in ('[1]', '{"a" 1}', '{"a": 1 "b": 2}', '{"a": {',
+                     '{1: 2}'):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    self.items(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
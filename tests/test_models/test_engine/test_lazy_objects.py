@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+""" Module for testing FileStorage in lazy mode"""
+import unittest
+import json
+import os
+import tempfile
+from models import storage
+from models.engine.file_storage import FileStorage
+from models.engine.lazy_objects import Deferred, LazyObjects
+from models.city import City
+from models.state import State
+
+
+class test_lazy_objects(unittest.TestCase):
+    """ Class to test reloading into a LazyObjects """
+
+    def setUp(self):
+        """ Write a file and reload it in lazy mode """
+        fd, self.path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        self.state = State(name="A")
+        self.city = City(name="B", state_id=self.state.id)
+        data = {"State." + self.state.id: self.state.to_dict(),
+                "City." + self.city.id: self.city.to_dict()}
+        with open(self.path, "w") as f:
+            json.dump(data, f)
+        self.storage = FileStorage()
+        self.storage._FileStorage__file_path = self.path
+        self.objects = LazyObjects(self.storage._FileStorage__build)
+        self.storage._FileStorage__objects = self.objects
+        self.storage._FileStorage__reindex()
+        self.storage.reload()
+
+    def tearDown(self):
+        """ Remove the file and the indexes of the lazy objects """
+        os.remove(self.path)
+        if os.path.exists(self.path + ".lock"):
+            os.remove(self.path + ".lock")
+        storage._FileStorage__reindex()
+
+    def test_reload_defers(self):
+        """ Reloaded objects are placeholders """
+        for value in dict.values(self.objects):
+            self.assertIs(type(value), Deferred)
+
+    def test_access_builds(self):
+        """ Reading a key builds the object once """
+        key = "State." + self.state.id
+        state = self.objects[key]
+        self.assertIs(type(state), State)
+        self.assertEqual(state.name, "A")
+        self.assertIs(self.objects[key], state)
+        self.assertIs(type(dict.get(self.objects, "City." + self.city.id)),
+                      Deferred)
+
+    def test_indexes(self):
+        """ all(cls) and related() hand out built objects """
+        states = list(self.storage.all(State).values())
+        self.assertEqual([s.id for s in states], [self.state.id])
+        cities = self.storage.related(City, "state_id", self.state.id)
+        self.assertEqual([c.name for c in cities], ["B"])
+        self.assertIs(type(cities[0]), City)
+
+    def test_stream(self):
+        """ stream() builds objects without keeping them """
+        self.assertEqual([s.name for s in self.storage.stream(State)],
+                         ["A"])
+        self.assertEqual({type(v) for v in self.storage.stream()},
+                         {State, City})
+        for value in dict.values(self.objects):
+            self.assertIs(type(value), Deferred)
+
+    def test_iteration(self):
+        """ values(), items() and dict() build objects """
+        self.assertEqual({type(v) for v in self.objects.values()},
+                         {State, City})
+        self.assertEqual({type(v) for v in dict(self.objects).values()},
+                         {State, City})
+
+    def test_save_keeps_deferred(self):
+        """ save() writes placeholders back without building them """
+        self.objects["State." + self.state.id].name = "C"
+        self.storage.save()
+        self.assertIs(type(dict.get(self.objects, "City." + self.city.id)),
+                      Deferred)
+        with open(self.path) as f:
+            data = json.load(f)
+        self.assertEqual(data["State." + self.state.id]["name"], "C")
+        self.assertEqual(data["City." + self.city.id], self.city.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+""" Module for testing the columnar Place table"""
+import unittest
+import os
+import tempfile
+from unittest import mock
+from models import storage
+from models.engine import place_table
+from models.place import Place
+
+
+class test_scan(unittest.TestCase):
+    """ Class to test the pure Python filter """
+
+    def test_predicates(self):
+        """ Every predicate has to hold, missing values never match """
+        cheap = Place(city_id="a", price_by_night=50, number_rooms=1)
+        big = Place(city_id="b", price_by_night="200", number_rooms=4,
+                    max_guest=8)
+        unknown = Place(city_id="a")
+        places = [cheap, big, unknown]
+        self.assertEqual(place_table.scan(places, city_ids=["a"]),
+                         [cheap, unknown])
+        self.assertEqual(place_table.scan(places, min_price=60), [big])
+        self.assertEqual(place_table.scan(places, max_price=60), [cheap])
+        self.assertEqual(place_table.scan(places, min_rooms=2,
+                                          min_guests=8), [big])
+
+
+@unittest.skipIf(place_table.numpy is None, "NumPy is not installed")
+class test_place_table(unittest.TestCase):
+    """ Class to test PlaceTable and FileStorage.filter_places """
+
+    def setUp(self):
+        """ Store a few Places """
+        self.clear()
+        self.places = []
+        for i in range(20):
+            place = Place(city_id="city_{}".format(i % 3),
+                          price_by_night=i * 10, number_rooms=i % 4,
+                          max_guest=i % 6)
+            storage.new(place)
+            self.places.append(place)
+
+    def tearDown(self):
+        """ Drop the stored Places """
+        self.clear()
+
+    def clear(self):
+        """ Empty the storage and its indexes """
+        storage.all().clear()
+        storage._FileStorage__pending.clear()
+        storage._FileStorage__reindex()
+
+    def check(self, **criteria):
+        """ filter_places agrees with the scan """
+        self.assertCountEqual(storage.filter_places(**criteria),
+                              place_table.scan(self.places, **criteria))
+
+    def test_filters_match_scan(self):
+        """ Vectorized filters return what the scan returns """
+        self.check()
+        self.check(city_ids=["city_1", "city_2", "nowhere"])
+        self.check(min_price=50, max_price=120)
+        self.check(min_rooms=2, min_guests=3)
+        self.check(city_ids=["city_0"], min_price=30, min_rooms=1)
+        self.check(city_ids=[])
+
+    def test_growth(self):
+        """ The table grows past its first allocation """
+        table = place_table.PlaceTable(capacity=2)
+        for i in range(10):
+            table.upsert(str(i), {"price_by_night": i}.get)
+        self.assertEqual(len(table), 10)
+        self.assertEqual(table.filter(min_price=7), ["7", "8", "9"])
+
+    def test_updates_and_deletes(self):
+        """ Rows follow new() and delete() """
+        place = self.places[0]
+        place.price_by_night = 1000
+        storage.new(place)
+        self.assertEqual(storage.filter_places(min_price=500), [place])
+        storage.delete(place)
+        self.assertEqual(storage.filter_places(min_price=500), [])
+        other = Place(price_by_night=2000)
+        storage.new(other)
+        self.assertEqual(storage.filter_places(min_price=500), [other])
+
+    def test_updates_by_setattr(self):
+        """ Rows follow attributes set then saved by save() """
+        from models.engine.file_storage import FileStorage
+        place = self.places[1]
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            with mock.patch.object(FileStorage, "_FileStorage__file_path",
+                                   path):
+                storage.save()
+                place.price_by_night = 1000
+                place.city_id = "city_9"
+                storage.save()
+        finally:
+            for name in (path, path + ".lock"):
+                if os.path.exists(name):
+                    os.remove(name)
+        self.assertEqual(storage.filter_places(min_price=500), [place])
+        self.assertEqual(storage.filter_places(city_ids=["city_9"]), [place])
+        self.check(city_ids=["city_1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
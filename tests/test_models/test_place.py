@@ -3,6 +3,7 @@
 import unittest
 import models
 import os
+from datetime import datetime
 from models.place import Place
 
 
@@ -74,6 +75,24 @@ class TestPlace(unittest.TestCase):
             if key == 'updated_at':
                 self.assertIsInstance(value, str)
 
+    def test_coerce(self):
+        """values are converted to the types of the columns"""
+        self.assertEqual(Place.coerce("max_guest", "4"), 4)
+        self.assertEqual(Place.coerce("max_guest", 4.0), 4)
+        self.assertEqual(Place.coerce("latitude", "-3.5"), -3.5)
+        self.assertEqual(Place.coerce("latitude", 37), 37.0)
+        self.assertIsInstance(Place.coerce("latitude", 37), float)
+        self.assertEqual(Place.coerce("name", 7), "7")
+        self.assertEqual(Place.coerce("created_at", "2017-09-28T21:03:54"),
+                         datetime(2017, 9, 28, 21, 3, 54))
+        self.assertEqual(Place.coerce("amenity_ids", ["1"]), ["1"])
+        for name, value in (("max_guest", "4.5"), ("max_guest", "four"),
+                            ("max_guest", True), ("latitude", "nan"),
+                            ("latitude", "north"), ("name", "x" * 129),
+                            ("name", ["x"]), ("created_at", "today")):
+            with self.assertRaises(ValueError):
+                Place.coerce(name, value)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+"""Defines unittests for web_flask/__init__.py.
+Unittest classes:
+    TestCreateApp
+"""
+import os
+import subprocess
+import sys
+import unittest
+from models import storage
+from models.amenity import Amenity
+from models.state import State
+from web_flask import create_app
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+
+class TestCreateApp(unittest.TestCase):
+    """Unittests for the application factory and its blueprints"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.state = State(name="Nevada")
+        cls.amenity = Amenity(name="Wifi")
+        storage.new(cls.state)
+        storage.new(cls.amenity)
+        storage.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        storage.delete(cls.state)
+        storage.delete(cls.amenity)
+        storage.save()
+
+    def setUp(self):
+        self.client = create_app().test_client()
+
+    def test_text_routes(self):
+        """The routes of the per-task scripts 0 to 6"""
+        self.assertEqual(self.client.get('/').data, b"Hello HBNB!")
+        self.assertEqual(self.client.get('/hbnb').data, b"HBNB")
+        self.assertEqual(self.client.get('/c/is_fun').data, b"C is fun")
+        self.assertEqual(self.client.get('/python').data,
+                         b"Python is cool")
+        self.assertEqual(self.client.get('/number/3').data,
+                         b"3 is a number")
+        self.assertEqual(self.client.get('/number/a').status_code, 404)
+        self.assertIn(b"3 is odd",
+                      self.client.get('/number_odd_or_even/3').data)
+
+    def test_storage_routes(self):
+        """The routes of the per-task scripts 7 to 10"""
+        for path in ('/states_list', '/cities_by_states', '/states',
+                     '/hbnb_filters'):
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 200, path)
+            self.assertIn(b"Nevada", response.data, path)
+        self.assertIn(b"Wifi", self.client.get('/hbnb_filters').data)
+        state = self.client.get('/states/{}'.format(self.state.id))
+        self.assertIn(b"Nevada", state.data)
+        self.assertIn(b"Not found!", self.client.get('/states/nope').data)
+
+    def test_warm_up(self):
+        """warm_up loads the storage and compiles every template ahead
+        of the first request"""
+        app = create_app(warm_up=True)
+        self.assertEqual(len(app.jinja_env.cache),
+                         len(app.jinja_env.list_templates()))
+        # in a new interpreter, nothing built the storage before
+        subprocess.run([sys.executable, "-c",
+                        "import models\n"
+                        "from web_flask import create_app\n"
+                        "assert 'storage' not in vars(models)\n"
+                        "create_app(warm_up=True)\n"
+                        "assert 'storage' in vars(models)\n"],
+                       cwd=ROOT, check=True, capture_output=True)
+
+    def test_scripts(self):
+        """The per-task scripts serve the application of the factory"""
+        from importlib import import_module
+        app = import_module("web_flask.9-states").app
+        self.assertIn("states.detail_state", app.view_functions)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+"""Defines unittests for web_flask/page_cache.py.
+Unittest classes:
+    TestCachedPage
+"""
+import os
+import unittest
+from unittest import mock
+from flask import Flask
+from models import storage
+from models.state import State
+from web_flask import page_cache
+from web_flask.page_cache import cached_page
+
+
+class TestCachedPage(unittest.TestCase):
+    """Unittests for the cached_page decorator"""
+
+    def setUp(self):
+        self.renders = []
+        self.client = self.make_client()
+
+    def make_client(self):
+        """Returns a test client of an application with a cached page"""
+        app = Flask(__name__)
+
+        @app.route('/page')
+        @cached_page
+        def page():
+            self.renders.append(1)
+            return "page {}".format(len(self.renders))
+
+        return app.test_client()
+
+    def test_cached(self):
+        """A page is rendered once while the storage does not change"""
+        first = self.client.get('/page')
+        second = self.client.get('/page')
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(len(self.renders), 1)
+        self.assertIsNotNone(first.headers.get('ETag'))
+        self.assertIsNotNone(first.headers.get('Last-Modified'))
+
+    def test_query_string(self):
+        """Query strings are part of the key"""
+        self.client.get('/page?a=1')
+        self.client.get('/page?a=2')
+        self.client.get('/page?a=1')
+        self.assertEqual(len(self.renders), 2)
+
+    def test_not_modified(self):
+        """Clients holding the page get a 304"""
+        first = self.client.get('/page')
+        again = self.client.get('/page', headers={
+            'If-None-Match': first.headers['ETag']})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.data, b"")
+        since = self.client.get('/page', headers={
+            'If-Modified-Since': first.headers['Last-Modified']})
+        self.assertEqual(since.status_code, 304)
+
+    def test_invalidation(self):
+        """Any write of the storage renders the page again"""
+        first = self.client.get('/page')
+        version = storage.version
+        storage.new(State(name="Nevada"))
+        self.assertGreater(storage.version, version)
+        second = self.client.get('/page', headers={
+            'If-None-Match': first.headers['ETag']})
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.data, b"page 2")
+        self.assertNotEqual(second.headers['ETag'], first.headers['ETag'])
+
+    def test_db_ttl(self):
+        """In DB mode pages expire after DB_TTL seconds by default"""
+        with mock.patch.dict(os.environ, HBNB_TYPE_STORAGE="db"):
+            os.environ.pop("HBNB_PAGE_TTL", None)
+            client = self.make_client()
+        with mock.patch.object(page_cache, "monotonic", return_value=100):
+            client.get('/page')
+        with mock.patch.object(page_cache, "monotonic",
+                               return_value=100 + page_cache.DB_TTL - 1):
+            client.get('/page')
+        self.assertEqual(len(self.renders), 1)
+        with mock.patch.object(page_cache, "monotonic",
+                               return_value=100 + page_cache.DB_TTL):
+            self.assertEqual(client.get('/page').data, b"page 2")
+
+
+if __name__ == "__main__":
+    unittest.main()
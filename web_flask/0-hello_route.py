@@ -1,15 +1,8 @@
 #!/usr/bin/python3
-"""Flask web application"""
+"""Flask web application, see web_flask/__init__.py"""
+from web_flask import create_app
 
-from flask import Flask
-
-app = Flask(__name__)
-
-
-@app.route("/", strict_slashes=False)
-def hello():
-    """Returns Hello HBNB! message"""
-    return "Hello HBNB!"
+app = create_app()
 
 
 if __name__ == "__main__":
@@ -1,20 +1,8 @@
 #!/usr/bin/python3
-"""Flask web application"""
+"""Flask web application, see web_flask/__init__.py"""
+from web_flask import create_app
 
-from flask import Flask
-app = Flask(__name__)
-
-
-@app.route('/', strict_slashes=False)
-def hello():
-    """returns hello hbnb"""
-    return 'Hello HBNB!'
-
-
-@app.route('/hbnb', strict_slashes=False)
-def display_page():
-    """display 'HBNB'"""
-    return 'HBNB'
+app = create_app()
 
 
 if __name__ == '__main__':
@@ -1,35 +1,8 @@
 #!/usr/bin/python3
-"""Flask web application"""
+"""Flask web application, see web_flask/__init__.py"""
+from web_flask import create_app
 
-from flask import Flask, url_for
-app = Flask(__name__)
-
-
-@app.route('/', strict_slashes=False)
-def hello():
-    """returns hello hbnb"""
-    return 'Hello HBNB!'
-
-
-@app.route('/hbnb', strict_slashes=False)
-def display_page():
-    """display 'HBNB'"""
-    return 'HBNB'
-
-
-@app.route('/c/<text>', strict_slashes=False)
-def display_text(text):
-    """displays text"""
-    text = text.replace("_", " ")
-    return f'C {text}'
-
-
-@app.route('/python/', strict_slashes=False)
-@app.route('/python/<text>', strict_slashes=False)
-def display_t(text='is cool'):
-    """displays text"""
-    text = text.replace("_", " ")
-    return f'Python {text}'
+app = create_app()
 
 
 if __name__ == '__main__':
@@ -1,24 +1,8 @@
 #!/usr/bin/python3
-"""Flask web application"""
+"""Flask web application, see web_flask/__init__.py"""
+from web_flask import create_app
 
-from flask import Flask, url_for, render_template
-from models.state import State
-from models import storage
-app = Flask(__name__)
-
-
-@app.route('/states_list', strict_slashes=False)
-def list_state():
-    """display state list"""
-    states = storage.all(State)
-    states_list = sorted(states.values(), key=lambda state: state.name)
-    return render_template('7-states_list.html', states_list=states_list)
-
-
-@app.teardown_appcontext
-def close_down(e):
-    """remove the current SQLAlchemy Session"""
-    storage.close()
+app = create_app()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+"""Flask application serving every route of web_flask
+
+Run it with the development server:
+    python3 -m web_flask.0-hello_route
+or with a WSGI server, e.g.:
+    gunicorn --preload -w 4 -b 0.0.0.0:5000 web_flask.wsgi:app
+"""
+from flask import Flask
+
+
+def create_app(warm_up=False):
+    """builds the application, with the blueprints of web_flask.views
+    Nothing of the storage is loaded before the first request needing
+    it, unless warm_up is set.
+    Args:
+        warm_up: runs warm() before returning the application
+    Return:
+        returns the Flask application
+    """
+    from web_flask import storage, views
+    app = Flask(__name__)
+    storage.init_app(app)
+    for blueprint in views.blueprints:
+        app.register_blueprint(blueprint)
+    if warm_up:
+        warm(app)
+    return app
+
+
+def warm(app):
+    """does now what the first requests would: loads the storage and
+    compiles the templates. Run once in the master of a pre-forking
+    WSGI server (gunicorn --preload), the workers share the result.
+    Args:
+        app: the Flask application
+    """
+    import models
+    # models.storage is built, and its file or database loaded, on
+    # first access
+    models.storage
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
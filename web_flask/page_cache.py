@@ -0,0 +1,70 @@
+#!/usr/bin/python3
+"""Rendered page cache for the views reading the storage"""
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from os import getenv
+from time import monotonic
+from flask import make_response, request
+from web_flask.storage import get_storage
+
+# HBNB_PAGE_TTL in DB mode, where storage.version only counts the writes
+# of this process
+DB_TTL = 5
+
+
+def cached_page(view):
+    """caches the pages of a view, keyed on path and query string
+    A page is rendered again once storage.version changed (any write of
+    this process, or a save of another one that FileStorage.reload()
+    read), or after HBNB_PAGE_TTL seconds, which catches the writes of
+    other processes in DB mode: DB_TTL there, no limit in file mode,
+    unless set (an empty value or 0 is no limit). The responses carry
+    an ETag and a Last-Modified header and are answered with 304 Not
+    Modified when the client already has them. HBNB_PAGE_CACHE_SIZE
+    pages are kept per view, least recently used first out.
+    Args:
+        view: the view function
+    Return:
+        returns the wrapped view
+    """
+    size = int(getenv("HBNB_PAGE_CACHE_SIZE", 256))
+    ttl = getenv("HBNB_PAGE_TTL")
+    if ttl is None and getenv("HBNB_TYPE_STORAGE") == "db":
+        ttl = DB_TTL
+    ttl = float(ttl) if ttl else None
+    pages = OrderedDict()
+    lock = threading.Lock()
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        """answers from the cache, or renders and stores the page"""
+        key = request.full_path
+        storage = get_storage()
+        version = storage.version
+        with lock:
+            page = pages.get(key)
+            if page is not None and (page[0] != version or
+                                     ttl and page[1] + ttl <= monotonic()):
+                del pages[key]
+                page = None
+            if page is not None:
+                pages.move_to_end(key)
+        if page is None:
+            body = view(*args, **kwargs)
+            if not isinstance(body, str):
+                return body
+            etag = hashlib.md5(body.encode("UTF-8")).hexdigest()
+            page = (version, monotonic(), body, etag, storage.modified)
+            with lock:
+                pages[key] = page
+                while len(pages) > size:
+                    pages.popitem(last=False)
+        response = make_response(page[2])
+        response.set_etag(page[3])
+        response.last_modified = page[4]
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
+    return wrapper
@@ -0,0 +1,26 @@
+#!/usr/bin/python3
+"""Storage of the web_flask application, loaded on first use"""
+from flask import g
+
+
+def get_storage():
+    """returns models.storage, importing models (which loads the storage)
+    the first time, and marks the request to close it on teardown
+    """
+    from models import storage
+    g.storage = storage
+    return storage
+
+
+def close_storage(exception=None):
+    """closes the storage if the request used it: removes the SQLAlchemy
+    Session, or reloads the JSON file
+    """
+    storage = g.pop("storage", None)
+    if storage is not None:
+        storage.close()
+
+
+def init_app(app):
+    """registers close_storage on the teardown of app contexts"""
+    app.teardown_appcontext(close_storage)
@@ -0,0 +1,7 @@
+#!/usr/bin/python3
+"""Blueprints of the web_flask application"""
+from web_flask.views.text import bp as text
+from web_flask.views.states import bp as states
+from web_flask.views.filters import bp as filters
+
+blueprints = [text, states, filters]
@@ -0,0 +1,18 @@
+#!/usr/bin/python3
+"""Filters route, the one of 10-hbnb_filters.py"""
+from flask import Blueprint, render_template
+from web_flask.page_cache import cached_page
+from web_flask.storage import get_storage
+
+bp = Blueprint("filters", __name__)
+
+
+@bp.route('/hbnb_filters', strict_slashes=False)
+@cached_page
+def hbnb_filters():
+    """State, City and Amenity objects must be loaded from DBStorag"""
+    storage = get_storage()
+    states = storage.all("State", preload=["cities"])
+    amenities = storage.all("Amenity")
+    return render_template('10-hbnb_filters.html', states=states,
+                           amenities=amenities)
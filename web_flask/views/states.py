@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+"""State and City routes, the ones of 7-states_list.py to 9-states.py
+Classes are given to the storage by name, so that importing the views
+does not import models (and load the storage)."""
+from flask import Blueprint, render_template
+from web_flask.page_cache import cached_page
+from web_flask.storage import get_storage
+
+bp = Blueprint("states", __name__)
+
+
+@bp.route('/states_list', strict_slashes=False)
+@cached_page
+def states_list():
+    """display state list"""
+    states = get_storage().all("State").values()
+    return render_template('7-states_list.html', states=states)
+
+
+@bp.route('/cities_by_states', strict_slashes=False)
+@cached_page
+def cities_by_states():
+    """display city list"""
+    states = get_storage().all("State", preload=["cities"]).values()
+    sorted_states = sorted(states, key=lambda state: state.name)
+    return render_template('8-cities_by_states.html', states=sorted_states)
+
+
+@bp.route('/states', strict_slashes=False)
+@cached_page
+def list_state():
+    """display state list"""
+    return render_template('9-states.html',
+                           state=get_storage().all("State"))
+
+
+@bp.route('/states/<id>', strict_slashes=False)
+@cached_page
+def detail_state(id):
+    """diplays state by id"""
+    state = get_storage().get("State", id)
+    if state is None:
+        return render_template('9-states.html')
+    return render_template('9-states.html', state=state)
@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+"""Text and number routes, the ones of 0-hello_route.py to
+6-number_odd_or_even.py"""
+from flask import Blueprint, render_template
+
+bp = Blueprint("text", __name__)
+
+
+@bp.route('/', strict_slashes=False)
+def hello():
+    """returns hello hbnb"""
+    return 'Hello HBNB!'
+
+
+@bp.route('/hbnb', strict_slashes=False)
+def display_page():
+    """display 'HBNB'"""
+    return 'HBNB'
+
+
+@bp.route('/c/<text>', strict_slashes=False)
+def display_text(text):
+    """displays text"""
+    text = text.replace("_", " ")
+    return f'C {text}'
+
+
+@bp.route('/python/', strict_slashes=False)
+@bp.route('/python/<text>', strict_slashes=False)
+def display_t(text='is cool'):
+    """displays text"""
+    text = text.replace("_", " ")
+    return f'Python {text}'
+
+
+@bp.route('/number/<int:n>', strict_slashes=False)
+def number(n):
+    """displays number if int"""
+    return str(n) + ' is a number'
+
+
+@bp.route('/number_template/<int:n>', strict_slashes=False)
+def number_template(n):
+    """display a HTML page only if n is an integer"""
+    return render_template('5-number.html', n=n)
+
+
+@bp.route('/number_odd_or_even/<int:n>', strict_slashes=False)
+def number_odd_or_even(n):
+    """display a HTML page only if n is an integer"""
+    result = 'even' if n % 2 == 0 else 'odd'
+    return render_template('6-number_odd_or_even.html', n=n, result=result)
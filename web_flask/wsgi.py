@@ -0,0 +1,5 @@
+#!/usr/bin/python3
+"""WSGI entry point of web_flask, warmed up at import"""
+from web_flask import create_app
+
+app = create_app(warm_up=True)